@@ -0,0 +1,208 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 경로에 추가 (python benchmark.py 로 실행)
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from core.api_service import ApiService
+from core.http_session import SessionRegistry
+from core.log_store import LogStore, ColumnBatch
+from core.mock_api import MockApiService
+from core.mock_server import MockBxmServer
+
+DEFAULT_SIZES = "1000,100000,1000000"
+BENCH_START = datetime(2026, 1, 1)
+BENCH_END = BENCH_START + timedelta(days=1) - timedelta(seconds=1)
+DTTM_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 지표별 방향 (True: 클수록 좋음)
+HIGHER_IS_BETTER = {
+    "login_ms": False,
+    "fetch_rows_per_sec": True,
+    "parse_us_per_row": False,
+    "store_us_per_row": False,
+    "table_ms": False,
+}
+
+
+def bench_login(base_url, repeat=5):
+    """로그인 지연 (중앙값, ms)"""
+    api = ApiService()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        success, _, msg = api.login(base_url, "bench", "bench")
+        samples.append((time.perf_counter() - t0) * 1000)
+        if not success:
+            raise RuntimeError(f"login failed: {msg}")
+    return statistics.median(samples)
+
+
+def bench_fetch(base_url, size):
+    """ApiService 경유 전체 조회 처리량 (rows/s)"""
+    api = ApiService()
+    success, cookies, msg = api.login(base_url, "bench", "bench")
+    if not success:
+        raise RuntimeError(f"login failed: {msg}")
+
+    t0 = time.perf_counter()
+    count = 0
+    for batch in api.iter_system_logs_sharded(base_url, cookies, BENCH_START.strftime(DTTM_FORMAT),
+                                              BENCH_END.strftime(DTTM_FORMAT), max_rows=size):
+        count += len(batch)
+    elapsed = time.perf_counter() - t0
+    if count != size:
+        raise RuntimeError(f"fetched {count:,} rows, expected {size:,}")
+    return count / elapsed
+
+
+def bench_parse(raw_items):
+    """_parse_logs 비용 (us/row)"""
+    api = ApiService()
+    t0 = time.perf_counter()
+    parsed = api._parse_logs(raw_items)
+    return (time.perf_counter() - t0) * 1e6 / len(raw_items), parsed
+
+
+def bench_store(parsed, batch_size=500):
+    """LogStore 적재 비용 (us/row)"""
+    store = LogStore()
+    t0 = time.perf_counter()
+    for i in range(0, len(parsed), batch_size):
+        store.append_batch(parsed[i:i + batch_size])
+    return (time.perf_counter() - t0) * 1e6 / len(parsed)
+
+
+def bench_table(parsed, batch_size=500):
+    """테이블 모델 채우기 + 화면 갱신 시간 (ms, PyQt6 없으면 None)"""
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        from ui.widgets.log_table import LogTableView
+    except ImportError:
+        return None
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    view = LogTableView(LogStore())
+    view.resize(1200, 800)
+    view.show()
+    app.processEvents()
+
+    t0 = time.perf_counter()
+    for i in range(0, len(parsed), batch_size):
+        view.source_model.append_rows(parsed[i:i + batch_size])
+        app.processEvents()
+    elapsed = (time.perf_counter() - t0) * 1000
+    view.close()
+    return elapsed
+
+
+def check_batch_signal(parsed, batch_size=500):
+    """
+    작업 스레드 -> JobManager 신호를 거친 뒤에도 ColumnBatch가 그대로 도착하는지 확인 (PyQt6 없으면 None)
+    신호 타입을 list로 선언하면 LogRow 목록으로 바뀌어 append_columns 대신 행 단위 적재가 됩니다.
+    """
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        from ui.job_manager import JobManager, JobWorker
+    except ImportError:
+        return None
+
+    class ColumnBatchWorker(JobWorker):
+        def iter_batches(self):
+            yield ColumnBatch.from_records(parsed[:batch_size])
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    manager = JobManager()
+    received = []
+    manager.batch_ready.connect(lambda channel, batch: received.append(batch))
+    manager.submit("search", None, ColumnBatchWorker())
+    while manager.is_busy("search"):
+        app.processEvents()
+        time.sleep(0.005)
+    return len(received) == 1 and isinstance(received[0], ColumnBatch)
+
+
+def run(sizes, latency_ms, jitter_ms):
+    results = {}
+    for size in sizes:
+        print(f"\n[{size:,} rows] 데이터 생성 및 대역 서버 기동...")
+        raw_items = MockApiService.get_raw_log_items(size, BENCH_START, BENCH_END, seed=size)
+
+        with MockBxmServer(row_count=size, start_dt=BENCH_START, end_dt=BENCH_END,
+                           latency_ms=latency_ms, jitter_ms=jitter_ms) as server:
+            login_ms = bench_login(server.base_url)
+            fetch_rps = bench_fetch(server.base_url, size)
+            SessionRegistry.close_all()
+
+        parse_us, parsed = bench_parse(raw_items)
+        store_us = bench_store(parsed)
+        table_ms = bench_table(parsed)
+        if check_batch_signal(parsed) is False:
+            raise RuntimeError("ColumnBatch arrived as a list through JobManager.batch_ready")
+
+        results[str(size)] = {
+            "login_ms": round(login_ms, 2),
+            "fetch_rows_per_sec": round(fetch_rps, 1),
+            "parse_us_per_row": round(parse_us, 3),
+            "store_us_per_row": round(store_us, 3),
+            "table_ms": None if table_ms is None else round(table_ms, 1),
+        }
+        print(f"  login {login_ms:8.2f} ms | fetch {fetch_rps:12,.0f} rows/s | "
+              f"parse {parse_us:7.2f} us/row | store {store_us:7.2f} us/row | "
+              f"table {'n/a' if table_ms is None else f'{table_ms:,.0f} ms'}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 tolerance(비율) 이상 나빠진 지표 목록"""
+    regressions = []
+    for size, metrics in results.items():
+        base = baseline.get(size)
+        if not base:
+            continue
+        for name, value in metrics.items():
+            old = base.get(name)
+            if value is None or not old:
+                continue
+            change = (value - old) / old
+            worse = -change if HIGHER_IS_BETTER[name] else change
+            if worse > tolerance:
+                regressions.append(f"{size} rows / {name}: {old} -> {value} ({worse:+.0%} worse)")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SysMon Pro offline performance benchmark")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated row counts")
+    parser.add_argument("--latency", type=float, default=0, help="mock server latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="mock server latency jitter (ms)")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write results as a baseline JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression ratio (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    print(f"🚀 SysMon Pro benchmark (sizes: {', '.join(f'{s:,}' for s in sizes)})")
+    results = run(sizes, args.latency, args.jitter)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"\n📄 baseline 저장: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\n❌ 성능 저하 감지:")
+            for line in regressions:
+                print(f"   - {line}")
+            sys.exit(1)
+        print("\n✅ baseline 대비 성능 저하 없음")
@@ -5,3 +5,107 @@ MOCK_DATA_COUNT = 50
 
 # (기존 설정 유지를 위해 남겨둠)
 LOGIN_URL = "https://your-system.com/login"
+
+# 로그 조회 페이징 설정
+LOG_PAGE_SIZE = 500        # getServiceLogList 1회 요청당 건수 (pageCount)
+LOG_MAX_ROWS = 100000      # 1회 조회 시 최대 수집 건수 (초과분은 잘림)
+
+# HTTP 세션(Connection Pool) 설정
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json; charset=UTF-8",
+    "Accept": "application/json",
+    "Connection": "keep-alive"
+}
+HTTP_POOL_CONNECTIONS = 4  # 호스트별 커넥션 풀 개수
+HTTP_POOL_MAXSIZE = 16     # 풀당 최대 유지 커넥션 수 (동시 요청 수 이상으로 설정)
+HTTP_CONNECT_RETRIES = 2   # 연결 단계 실패 시 재시도 횟수 (요청 전송 후에는 재시도 안 함)
+
+# 세션 만료 판단: HTTP 401/403 또는 아래 header.returnCode 응답이면 저장된 세션 삭제
+# (BXM 관리 서버가 세션 만료 시 보내는 코드, 운영 서버 설정에 맞게 조정)
+SESSION_EXPIRED_RETURN_CODES = ("8",)
+
+# 상세 화면 렌더링 캐시 (선택한 행의 JSON/상세 로그 문자열 보관 건수)
+DETAIL_RENDER_CACHE_SIZE = 64
+
+# 거래 상세(입/출력 전문) 조회 API - 운영 BXM Admin의 상세 조회 오퍼레이션/필드명에 맞게 수정
+DETAIL_SERVICE = "OnlineLogService"
+DETAIL_OPERATION = "getServiceLogDetail"
+DETAIL_RESULT_OMM = "ServiceLogDetailOMM"
+DETAIL_INPUT_FIELD = "inputMsg"
+DETAIL_OUTPUT_FIELD = "outputMsg"
+DETAIL_CACHE_SIZE = 256      # 조회한 상세 보관 건수 (LRU)
+DETAIL_PREFETCH_ROWS = 2     # 선택 행 위/아래로 미리 조회할 행 수
+DETAIL_FETCH_WORKERS = 3     # 상세 동시 조회 수
+
+# 검색어 입력 후 로컬 필터 적용까지 대기 시간 (연속 입력 시 마지막 입력만 반영)
+KEYWORD_FILTER_DELAY_MS = 150
+
+# 상세 로그 뷰 검색어 하이라이트 반영 대기 시간
+LOG_SEARCH_DELAY_MS = 200
+
+# 상세 로그 뷰어: 줄 색인을 나누어 만드는 단위(글자 수), 한 줄에서 그리는 최대 글자 수
+LOG_VIEW_INDEX_CHUNK = 1_000_000
+LOG_VIEW_LINE_LIMIT = 4000
+
+# 내보내기 (파일에 기록하는 배치 단위)
+EXPORT_BATCH_ROWS = 2000
+
+# 통계 탭: 결과가 바뀌는 동안 재계산 간격
+ANALYTICS_REFRESH_MS = 500
+
+# 오프라인 로그 파일 열기 (한 번에 파싱하여 화면에 추가하는 건수)
+OFFLINE_BATCH_ROWS = 5000
+
+# 로컬 로그 캐시 (SQLite, 이미 지난 시간 구간만 저장)
+CACHE_DIR = "cache"
+CACHE_DB_FILE = "log_cache.db"
+CACHE_MAX_BYTES = 512 * 1024 * 1024  # 초과 시 오래 사용하지 않은 구간부터 삭제
+CACHE_SETTLE_SEC = 300               # 현재 시각 기준 이 시간 이전 구간만 '확정'으로 보고 저장
+CACHE_READ_BATCH = 2000              # 캐시에서 읽어 UI로 보내는 배치 크기
+
+# 실시간 추적(Live Tail) 폴링 주기
+LIVE_TAIL_INTERVAL_SEC = 10
+
+# 기간 분할 병렬 조회 (긴 조회기간을 여러 구간으로 나누어 동시에 요청)
+SHARD_THRESHOLD_MIN = 60   # 조회기간이 이보다 길면 분할
+SHARD_MINUTES = 30         # 첫 구간 크기 (이후 관측된 건수 밀도에 따라 조정)
+SHARD_MIN_MINUTES = 5
+SHARD_MAX_MINUTES = 180
+SHARD_TARGET_ROWS = 2000   # 구간당 목표 건수 (밀도 기반 구간 크기 계산에 사용)
+SHARD_CONCURRENCY = 4      # 서버 보호를 위한 동시 요청 상한
+SHARD_QUEUE_PAGES = 4      # 구간별로 병합 전에 쌓아 둘 수 있는 배치 수 (차면 해당 구간 조회가 기다림)
+
+# 다중 서버 동시 조회 (Fan-out)
+FANOUT_CONCURRENCY = 8     # 동시에 조회할 서버 수 상한
+DEFAULT_DOMAIN_ID = "OKC"  # login_urls.json에 domain 항목이 없을 때 사용
+
+# 백그라운드 조회 작업 (취소된 뒤 아직 응답을 기다리는 스레드 포함 동시 실행 상한, 초과분은 대기)
+JOB_MAX_THREADS = 3
+JOB_SHUTDOWN_WAIT_MS = 3000  # 종료 시 실행 중인 작업이 끝나기를 기다리는 최대 시간
+
+# 로그 목록 응답 스트리밍 파싱 (응답 본문을 읽는 조각 크기, 한 페이지를 나누어 전달하는 건수)
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_BATCH_ROWS = 500
+
+# 큰 응답 페이지 병렬 파싱 (별도 프로세스에서 JSON 파싱/컬럼 변환, 결과는 공유 메모리로 전달)
+PARSE_PROCESSES = 4                      # 작업 프로세스 수 상한 (CPU 코어 수 - 1 이내, 0이면 사용 안 함)
+PARSE_POOL_MIN_BYTES = 2 * 1024 * 1024   # 응답 본문이 이 크기 이상인 페이지만 프로세스에서 파싱
+
+# 시작 시 마지막 결과 복원 (종료 시 조회 결과와 조회 조건을 CACHE_DIR에 스냅샷으로 저장)
+SNAPSHOT_FILE = "last_result.snap"
+SNAPSHOT_MAX_ROWS = 300_000   # 이보다 많으면 저장하지 않음 (종료가 느려지지 않도록)
+
+# API 상태 점검 (Tools > API Health Scan)
+# 서버별 점검 대상은 login_urls.json 항목의 "apis"에 같은 형식으로 지정 (없으면 아래 기본 목록)
+# path: 서버 Base URL 기준 경로 (http로 시작하면 그대로 사용), payload가 있으면 JSON POST / 없으면 GET
+TARGET_APIS = [
+    {"name": "Service Log List", "path": "/bxmAdmin/json",
+     "payload": {"header": {"application": "bxmAdmin", "service": "OnlineLogService",
+                            "operation": "getServiceLogList", "langCd": "ko"},
+                 "OnlineLogSearchConditionOMM": {"pageCount": "1", "pageNum": "1"}}},
+    {"name": "Admin Home", "path": "/bxmAdmin/"},
+]
+SCAN_CONCURRENCY = 4         # 동시에 보내는 점검 요청 수 상한 (서버 보호)
+SCAN_REPEATS = 5             # API별 반복 횟수 (지연 시간 분포 계산용)
+SCAN_TIMEOUT_SEC = 5         # 요청당 제한 시간 (초과 시 Timeout으로 분류)
+SCAN_REGRESSION_RATIO = 0.2  # baseline 대비 p50/p95가 이 비율 이상 느려지면 저하로 표시
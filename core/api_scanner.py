@@ -1,41 +1,253 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from math import ceil
+
 import requests
-from PyQt6.QtCore import QThread, pyqtSignal
-from config.settings import TARGET_APIS, DEFAULT_HEADERS
+
+from config.settings import (TARGET_APIS, DEFAULT_DOMAIN_ID, SCAN_CONCURRENCY, SCAN_REPEATS,
+                             SCAN_TIMEOUT_SEC, SCAN_REGRESSION_RATIO)
+from core.http_session import SessionRegistry
 from utils.logger import get_logger
 
 log = get_logger("ApiScanner")
 
-class ApiScannerThread(QThread):
-    result_signal = pyqtSignal(str, str, int, str)
-    finished_signal = pyqtSignal()
-
-    def __init__(self, cookies):
-        super().__init__()
-        self.cookies = cookies
-
-    def run(self):
-        log.info("API 스캔 시작")
-        session = requests.Session()
-        session.headers.update(DEFAULT_HEADERS)
-        
-        for k, v in self.cookies.items():
-            session.cookies.set(k, v)
-
-        for api in TARGET_APIS:
-            name = api['name']
-            url = api['url']
-            
-            try:
-                res = session.get(url, timeout=10)
-                code = res.status_code
-                status = "성공" if 200 <= code < 300 else "실패"
-                
-                log.debug(f"[{status}] {name} ({code})")
-                self.result_signal.emit(name, url, code, status)
-                
-            except Exception as e:
-                log.error(f"Error on {name}: {e}")
-                self.result_signal.emit(name, url, 0, f"에러: {str(e)}")
-        
-        log.info("API 스캔 종료")
-        self.finished_signal.emit()
+# 점검 결과 분류
+OK = "OK"
+TIMEOUT = "Timeout"
+CONNECTION = "Connection"
+AUTH = "Auth"
+HTTP_4XX = "HTTP 4xx"
+HTTP_5XX = "HTTP 5xx"
+API_ERROR = "API Error"
+BAD_RESPONSE = "Bad Response"
+ERROR = "Error"
+
+LATENCY_KEYS = ("min", "p50", "p95", "max")
+
+
+def classify(response, expect_json):
+    """응답 -> (분류, 상세). JSON API는 BXM header.returnCode까지 확인"""
+    code = response.status_code
+    if code in (401, 403):
+        return AUTH, f"HTTP {code}"
+    if code >= 500:
+        return HTTP_5XX, f"HTTP {code}"
+    if code >= 400:
+        return HTTP_4XX, f"HTTP {code}"
+    if not expect_json:
+        return OK, ""
+    try:
+        body = response.json()
+    except ValueError:
+        return BAD_RESPONSE, "JSON이 아닌 응답"
+    header = body.get("header") if isinstance(body, dict) else None
+    if isinstance(header, dict) and str(header.get("returnCode", "0")) != "0":
+        return API_ERROR, header.get("returnMessage", "")
+    return OK, ""
+
+
+def probe(session, url, payload, timeout):
+    """API 1회 호출 -> (지연 ms | None, 분류, 상세). 지연 시간은 응답 본문 수신까지"""
+    start = time.perf_counter()
+    try:
+        if payload is None:
+            response = session.get(url, timeout=timeout)
+        else:
+            response = session.post(url, json=payload, timeout=timeout)
+        latency = (time.perf_counter() - start) * 1000
+        category, detail = classify(response, payload is not None)
+    except requests.Timeout:
+        return None, TIMEOUT, f"> {timeout}s"
+    except requests.ConnectionError as e:
+        return None, CONNECTION, str(e)
+    except requests.RequestException as e:
+        return None, ERROR, str(e)
+    return latency, category, detail
+
+
+def login_failure_category(message):
+    """로그인 실패 분류 (ApiService.login은 예외를 메시지로만 돌려주므로 메시지로 구분)"""
+    text = (message or "").lower()
+    if "timed out" in text or "timeout" in text:
+        return TIMEOUT
+    if "connection" in text:
+        return CONNECTION
+    if "server error" in text:
+        return HTTP_5XX
+    if "client error" in text:
+        return HTTP_4XX
+    return AUTH
+
+
+def latency_stats(samples):
+    """지연 시간 목록 -> {min, p50, p95, max} (nearest-rank, 목록이 비면 None)"""
+    if not samples:
+        return dict.fromkeys(LATENCY_KEYS)
+    ordered = sorted(samples)
+
+    def pick(percent):
+        return ordered[max(ceil(percent * len(ordered) / 100) - 1, 0)]
+
+    values = (ordered[0], pick(50), pick(95), ordered[-1])
+    return {key: round(value, 1) for key, value in zip(LATENCY_KEYS, values)}
+
+
+def result_key(result):
+    return f"{result['server']} / {result['api']}"
+
+
+class ApiScanner:
+    """
+    API 상태 점검
+    서버별 점검 대상 API(login_urls.json의 "apis", 없으면 TARGET_APIS)를 제한된 동시 요청 수로 N회씩 호출하여
+    지연 시간 분포(min/p50/p95/max, 정상 응답 기준)와 오류 유형별 건수를 집계합니다.
+    로그인된 서버는 keep-alive 세션(SessionRegistry)을 재사용하고, 아니면 등록된 계정으로 먼저 로그인합니다.
+    """
+
+    def __init__(self, api, concurrency=SCAN_CONCURRENCY, repeats=SCAN_REPEATS, timeout=SCAN_TIMEOUT_SEC):
+        self.api = api
+        self.concurrency = max(1, concurrency)
+        self.repeats = max(1, repeats)
+        self.timeout = timeout
+
+    @staticmethod
+    def endpoints(server):
+        return server.get('apis') or TARGET_APIS
+
+    @staticmethod
+    def endpoint_url(base_url, endpoint):
+        path = endpoint.get('path') or endpoint.get('url', '')
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+
+    def iter_events(self, servers, sessions=None):
+        """
+        servers: login_urls.json 항목 목록 ({name, url, id, password[, domain][, apis]})
+        sessions: 이미 로그인된 서버 {url: cookies} (재로그인 생략)
+        yield: ("status", 서버, 메시지) | ("progress", 완료 요청 수, 전체 요청 수) | ("result", 서버, 결과)
+        중간에 닫으면 대기 중인 요청은 보내지 않습니다. (진행 중인 요청은 timeout 안에 끝남)
+        """
+        sessions = sessions or {}
+        total = sum(len(self.endpoints(server)) for server in servers) * self.repeats
+        done_count = 0
+        stats = {}     # (서버, API) -> 집계 중인 결과
+        pending = {}   # future -> ("login", 서버) | ("probe", 집계 키)
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="scan")
+
+        def submit_probes(server, cookies):
+            name = server.get('name', server.get('url', ''))
+            session = SessionRegistry.get(server.get('url', ''))
+            if cookies and cookies is not session.cookies:
+                session.cookies.update(cookies)
+            keys = []
+            for endpoint in self.endpoints(server):
+                key = (name, endpoint.get('name', ''))
+                url = self.endpoint_url(server.get('url', ''), endpoint)
+                stats[key] = {"server": name, "api": key[1], "url": url, "count": 0, "ok": 0,
+                              "errors": {}, "samples": [], "last_error": ""}
+                keys.append((key, url, endpoint.get('payload')))
+            # 같은 API의 반복 호출이 한꺼번에 몰리지 않도록 회차 단위로 제출
+            for _ in range(self.repeats):
+                for key, url, payload in keys:
+                    future = executor.submit(probe, session, url, payload, self.timeout)
+                    pending[future] = ("probe", key)
+
+        def failed_results(server, category, message):
+            name = server.get('name', server.get('url', ''))
+            for endpoint in self.endpoints(server):
+                yield {"server": name, "api": endpoint.get('name', ''),
+                       "url": self.endpoint_url(server.get('url', ''), endpoint),
+                       "count": self.repeats, "ok": 0, "errors": {category: self.repeats},
+                       "last_error": message, **latency_stats([])}
+
+        log.info(f"API 스캔 시작 ({len(servers)} servers, {total} requests)")
+        try:
+            for server in servers:
+                cookies = sessions.get(server.get('url', ''))
+                if cookies:
+                    submit_probes(server, cookies)
+                else:
+                    name = server.get('name', server.get('url', ''))
+                    yield "status", name, "Logging in..."
+                    future = executor.submit(self.api.login, server.get('url', ''), server.get('id', ''),
+                                             server.get('password', ''), server.get('domain', DEFAULT_DOMAIN_ID))
+                    pending[future] = ("login", server)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, target = pending.pop(future)
+                    if kind == "login":
+                        name = target.get('name', target.get('url', ''))
+                        success, cookies, msg = future.result()
+                        if success:
+                            yield "status", name, "Scanning..."
+                            submit_probes(target, cookies)
+                            continue
+                        yield "status", name, f"Login failed: {msg}"
+                        category = login_failure_category(msg)
+                        for result in failed_results(target, category, f"Login failed: {msg}"):
+                            done_count += self.repeats
+                            yield "result", name, result
+                        yield "progress", done_count, total
+                        continue
+
+                    latency, category, detail = future.result()
+                    entry = stats[target]
+                    entry["count"] += 1
+                    if category == OK:
+                        entry["ok"] += 1
+                        entry["samples"].append(latency)
+                    else:
+                        entry["errors"][category] = entry["errors"].get(category, 0) + 1
+                        entry["last_error"] = detail
+                    done_count += 1
+                    yield "progress", done_count, total
+
+                    if entry["count"] == self.repeats:
+                        result = stats.pop(target)
+                        result.update(latency_stats(result.pop("samples")))
+                        log.debug(f"[{result['ok']}/{result['count']}] {result_key(result)} p95={result['p95']}")
+                        yield "result", result["server"], result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            log.info("API 스캔 종료")
+
+
+# ---------------------------------------------------------
+# baseline 저장 / 비교
+# ---------------------------------------------------------
+def save_baseline(results, path):
+    data = {"saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "results": results}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def load_baseline(path):
+    """baseline 파일 -> {"서버 / API": 결과}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {result_key(result): result for result in data.get("results", [])}
+
+
+def compare(result, base, tolerance=SCAN_REGRESSION_RATIO):
+    """baseline 대비 나빠진 항목 목록 (비어 있으면 이상 없음, base가 없으면 None)"""
+    if base is None:
+        return None
+    problems = []
+    error_rate = 1 - result["ok"] / result["count"] if result["count"] else 0
+    base_rate = 1 - base["ok"] / base["count"] if base.get("count") else 0
+    if error_rate > base_rate:
+        problems.append(f"errors {base_rate:.0%} -> {error_rate:.0%}")
+    for key in ("p50", "p95"):
+        old, new = base.get(key), result.get(key)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        if change > tolerance:
+            problems.append(f"{key} {old:,.0f} -> {new:,.0f} ms ({change:+.0%})")
+    return problems
@@ -1,10 +1,27 @@
-import requests
 import json
-from datetime import datetime
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from config.settings import (LOG_PAGE_SIZE, LOG_MAX_ROWS, SHARD_THRESHOLD_MIN, SHARD_MINUTES,
+                             SHARD_MIN_MINUTES, SHARD_MAX_MINUTES, SHARD_TARGET_ROWS,
+                             SHARD_CONCURRENCY, SHARD_QUEUE_PAGES, DETAIL_SERVICE, DETAIL_OPERATION, DETAIL_RESULT_OMM,
+                             DETAIL_INPUT_FIELD, DETAIL_OUTPUT_FIELD, STREAM_CHUNK_BYTES,
+                             STREAM_BATCH_ROWS, SESSION_EXPIRED_RETURN_CODES)
+from core.http_session import SessionRegistry
+from core.json_stream import JsonArrayStream
+from core.log_store import ColumnBatch
+from core.parse_pool import ParsePool
+
+DTTM_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_LIST_KEY = "serviceLogList"
 
 class ApiService:
     def __init__(self):
         self.timeout = 10 
+        self.rejected_sessions = set()  # 세션 만료/인증 거부 응답을 받은 서버 (UI에서 확인 후 제거)
 
     def login(self, base_url, user_id, password, domain_id="OKC"):
         """
@@ -14,11 +31,6 @@ class ApiService:
         # URL 보정 (끝에 슬래시 제거 후 경로 추가)
         api_url = f"{base_url.rstrip('/')}/bxmAdmin/json/login"
 
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8",
-            "Accept": "application/json"
-        }
-
         # 이미지의 Request Payload 구조 반영
         payload = {
             "header": {
@@ -36,9 +48,9 @@ class ApiService:
         }
 
         try:
-            # 세션 객체를 사용하여 요청 (쿠키 자동 관리)
-            session = requests.Session()
-            response = session.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+            # 서버별 keep-alive 세션을 새로 발급받아 요청 (쿠키 자동 관리, 이후 조회에서 재사용)
+            session = SessionRegistry.reset(base_url)
+            response = session.post(api_url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             
             res_json = response.json()
@@ -53,6 +65,7 @@ class ApiService:
                 is_success = True
 
             if is_success:
+                self.rejected_sessions.discard(base_url.rstrip('/'))
                 # 성공 시 세션의 쿠키(CookieJar) 반환
                 return True, session.cookies, "Login Success"
             else:
@@ -63,13 +76,169 @@ class ApiService:
             return False, None, str(e)
 
     def get_system_logs(self, base_url, cookies, start_dt, end_dt, search_keyword=""):
-        """시스템 로그 조회 (기존 로직 유지)"""
-        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json"
+        """시스템 로그 조회 (전체 페이지를 모아서 한 번에 반환)"""
+        data = []
+        for batch in self.iter_system_logs(base_url, cookies, start_dt, end_dt, search_keyword):
+            data.extend(batch)
+        return data
 
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8",
-            "Accept": "application/json"
-        }
+    def iter_system_logs(self, base_url, cookies, start_dt, end_dt, search_keyword="",
+                         page_size=LOG_PAGE_SIZE, max_rows=LOG_MAX_ROWS):
+        """
+        시스템 로그 페이지 순회 조회 (Generator)
+        pageNum을 1부터 증가시키며 파싱된 배치(list)를 도착하는 대로 yield 합니다.
+        (한 페이지도 응답을 받는 대로 STREAM_BATCH_ROWS건씩 나누어 yield)
+        마지막 페이지(page_size 미만)에 도달하거나 max_rows를 채우면 종료합니다.
+
+        반환값(StopIteration.value): 구간 전체를 빠짐없이 받았으면 True
+        (요청 실패 또는 max_rows로 잘린 경우 False -> 캐시 저장 판단에 사용)
+        """
+        page_num = 1
+        total = 0
+
+        while total < max_rows:
+            page = self._iter_log_page(
+                base_url, cookies, start_dt, end_dt, search_keyword, page_num, page_size
+            )
+            received = 0
+            try:
+                while True:
+                    try:
+                        raw_list = next(page)
+                    except StopIteration as stop:
+                        if not stop.value:
+                            return False
+                        break
+                    if total >= max_rows:
+                        return False  # max_rows 이후에도 항목이 더 있음
+                    received += len(raw_list)
+                    if isinstance(raw_list, ColumnBatch):  # 병렬 파싱된 페이지
+                        batch = raw_list if len(raw_list) <= max_rows - total else raw_list[:max_rows - total]
+                    else:
+                        batch = self._parse_logs(raw_list[:max_rows - total])
+                    total += len(batch)
+                    yield batch
+                    if len(batch) < len(raw_list):
+                        return False
+            finally:
+                page.close()  # 중간에 멈추면 응답 연결 해제
+
+            if received < page_size:
+                return True
+            page_num += 1
+
+        return False
+
+    def iter_system_logs_sharded(self, base_url, cookies, start_dt, end_dt, search_keyword="",
+                                 max_rows=LOG_MAX_ROWS, concurrency=SHARD_CONCURRENCY):
+        """
+        긴 조회기간을 시간 구간(shard)으로 나누어 병렬 조회 (Generator)
+        - 최대 concurrency개 구간을 동시에 요청하고, 완료된 구간의 건수 밀도로 다음 구간 크기를 조정
+        - 각 구간은 받은 페이지를 구간별 대기열(최대 SHARD_QUEUE_PAGES개)로 넘기고, 대기열이 차면 기다림
+          (구간 전체를 메모리에 모으지 않음)
+        - 결과는 구간 순서(=시간순)로 yield (구간 내부는 서버 응답 순서)
+        - 중간에 닫으면 실행 중인 구간도 다음 페이지 전에 멈춤
+        - 반환값은 iter_system_logs와 동일 (전체 완료 여부)
+        """
+        try:
+            range_start = datetime.strptime(start_dt, DTTM_FORMAT)
+            range_end = datetime.strptime(end_dt, DTTM_FORMAT)
+        except ValueError:
+            range_start = range_end = None
+
+        if range_start is None or range_end - range_start <= timedelta(minutes=SHARD_THRESHOLD_MIN):
+            return (yield from self.iter_system_logs(base_url, cookies, start_dt, end_dt,
+                                                     search_keyword, max_rows=max_rows))
+
+        shard_size = timedelta(minutes=SHARD_MINUTES)
+        next_start = range_start
+        shards = deque()   # 구간 순서대로 (shard_start, shard_end, 페이지 대기열)
+        total = 0
+        complete = True
+        stop = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="log-shard")
+        try:
+            while shards or next_start <= range_end:
+                # 1. 동시 요청 상한까지 다음 구간 제출
+                while len(shards) < concurrency and next_start <= range_end:
+                    shard_end = min(next_start + shard_size - timedelta(seconds=1), range_end)
+                    pages = queue.Queue(maxsize=SHARD_QUEUE_PAGES)
+                    executor.submit(self._fetch_shard, base_url, cookies, next_start, shard_end,
+                                    search_keyword, max_rows, pages, stop)
+                    shards.append((next_start, shard_end, pages))
+                    next_start = shard_end + timedelta(seconds=1)
+
+                # 2. 맨 앞 구간의 페이지를 받는 대로 내보냄
+                shard_start, shard_end, pages = shards[0]
+                kind, payload = pages.get()
+                if kind == "batch":
+                    batch = payload if len(payload) <= max_rows - total else payload[:max_rows - total]
+                    total += len(batch)
+                    yield batch
+                    if total >= max_rows:
+                        return False
+                    continue
+                if kind == "error":
+                    raise payload
+
+                # 3. 구간 완료: 건수 밀도 기반 구간 크기 조정
+                shards.popleft()
+                count, shard_complete = payload
+                complete = complete and shard_complete
+                minutes = max((shard_end - shard_start).total_seconds() / 60, 1)
+                density = count / minutes
+                target = SHARD_TARGET_ROWS / density if density else SHARD_MAX_MINUTES
+                shard_size = timedelta(minutes=min(max(target, SHARD_MIN_MINUTES), SHARD_MAX_MINUTES))
+            return complete
+        finally:
+            stop.set()  # 실행 중인 구간은 다음 페이지 전에 멈춤
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_shard(self, base_url, cookies, shard_start, shard_end, search_keyword, max_rows, pages, stop):
+        """
+        한 구간의 페이지를 차례로 pages 대기열에 넣음 (작업 스레드에서 실행)
+        ("batch", 배치) ... ("done", (건수, 완료 여부)) | ("error", 예외)
+        """
+        count = 0
+        gen = self.iter_system_logs(base_url, cookies, shard_start.strftime(DTTM_FORMAT),
+                                    shard_end.strftime(DTTM_FORMAT), search_keyword,
+                                    max_rows=max_rows)
+        try:
+            while not stop.is_set():
+                try:
+                    batch = next(gen)
+                except StopIteration as done:
+                    self._put_page(pages, ("done", (count, bool(done.value))), stop)
+                    return
+                count += len(batch)
+                if not self._put_page(pages, ("batch", batch), stop):
+                    return
+        except Exception as e:
+            self._put_page(pages, ("error", e), stop)
+        finally:
+            gen.close()
+
+    @staticmethod
+    def _put_page(pages, item, stop):
+        """대기열이 차 있으면 자리가 날 때까지 기다림 (조회가 닫히면 False)"""
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _iter_log_page(self, base_url, cookies, start_dt, end_dt, search_keyword, page_num, page_size):
+        """
+        getServiceLogList 한 페이지 요청 (Generator)
+        응답 본문을 받는 대로 serviceLogList 항목을 STREAM_BATCH_ROWS건씩 yield 합니다.
+        (response.json()처럼 본문 전체와 객체 트리를 한꺼번에 만들지 않으므로 페이지가 커도 메모리 일정)
+        본문이 PARSE_POOL_MIN_BYTES 이상이면 작업 프로세스에서 파싱한 ColumnBatch 하나를 yield 합니다.
+        반환값(StopIteration.value): 성공 True / 실패 False (실패 전에 받은 항목은 이미 yield 됨)
+        """
+        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json"
 
         payload = {
             "header": {
@@ -81,60 +250,172 @@ class ApiService:
             "OnlineLogSearchConditionOMM": {
                 "opOccurDttmStart": start_dt,
                 "opOccurDttmEnd": end_dt,
-                "pageCount": "100",
-                "pageNum": "1",
-                "guid": search_keyword if search_keyword else "",
-                "svcNm": "", 
+                "pageCount": str(page_size),
+                "pageNum": str(page_num),
+                "guid": "",
+                "svcNm": "",
                 "opNm": "",
                 "bxmAppId": "",
                 "nodeName": "",
                 "sendUserIp": ""
             }
         }
+        # search_keyword: GUID 문자열 또는 조회조건 dict ({"svcNm": ..., "nodeName": ...})
+        condition = payload["OnlineLogSearchConditionOMM"]
+        if isinstance(search_keyword, dict):
+            condition.update({k: v for k, v in search_keyword.items() if k in condition and v})
+        elif search_keyword:
+            condition["guid"] = search_keyword
 
+        response = None
         try:
-            response = requests.post(
-                api_url, 
-                headers=headers, 
-                cookies=cookies, 
-                json=payload, 
-                timeout=self.timeout
-            )
+            session = self._get_session(base_url, cookies)
+            response = session.post(api_url, json=payload, timeout=self.timeout, stream=True)
+            response.raise_for_status()
+
+            if ParsePool.accepts(int(response.headers.get("Content-Length") or 0)):
+                batch, header = ParsePool.parse(response.content)
+                if batch is None and header.get("returnCode") not in (None, "0"):
+                    self._note_rejection(base_url, header=header)
+                    print(f"API Request Failed (page {page_num}): {header.get('returnMessage', 'Unknown Error')}")
+                    return False
+                if batch:
+                    yield batch
+                return True
+
+            stream = JsonArrayStream(LOG_LIST_KEY)
+            pending = []
+            received = 0
+            for chunk in response.iter_content(STREAM_CHUNK_BYTES):
+                pending.extend(stream.feed(chunk))
+                while len(pending) >= STREAM_BATCH_ROWS:
+                    received += STREAM_BATCH_ROWS
+                    yield pending[:STREAM_BATCH_ROWS]
+                    del pending[:STREAM_BATCH_ROWS]
+            stream.close()
+            if pending:
+                received += len(pending)
+                yield pending
+
+            if not received:
+                # 세션 만료 등 업무 오류는 '빈 결과'가 아닌 실패로 처리 (캐시 저장 방지)
+                header = (stream.document() or {}).get("header") or {}
+                if header.get("returnCode") not in (None, "0"):
+                    self._note_rejection(base_url, header=header)
+                    print(f"API Request Failed (page {page_num}): {header.get('returnMessage', 'Unknown Error')}")
+                    return False
+            return True
+
+        except Exception as e:
+            self._note_rejection(base_url, status_code=getattr(getattr(e, 'response', None), 'status_code', None))
+            print(f"API Request Failed (page {page_num}): {e}")
+            return False
+        finally:
+            if response is not None:
+                response.close()
+
+    def get_log_detail(self, base_url, cookies, guid, occur_dttm=""):
+        """
+        거래 상세(입/출력 전문) 조회 -> {"input": ..., "output": ...} (실패 시 None)
+        오퍼레이션/필드명은 config.settings의 DETAIL_* 설정을 따릅니다.
+        """
+        api_url = f"{base_url.rstrip('/')}/bxmAdmin/json"
+        payload = {
+            "header": {
+                "application": "bxmAdmin",
+                "service": DETAIL_SERVICE,
+                "operation": DETAIL_OPERATION,
+                "langCd": "ko"
+            },
+            "OnlineLogSearchConditionOMM": {
+                "guid": guid,
+                "opOccurDttm": occur_dttm
+            }
+        }
+
+        try:
+            session = self._get_session(base_url, cookies)
+            response = session.post(api_url, json=payload, timeout=self.timeout)
             response.raise_for_status()
 
             res_json = response.json()
-            
-            if "ServiceLogListOMM" in res_json and "serviceLogList" in res_json["ServiceLogListOMM"]:
-                raw_list = res_json["ServiceLogListOMM"]["serviceLogList"]
-                return self._parse_logs(raw_list)
-            else:
-                return []
+            if DETAIL_RESULT_OMM in res_json:
+                detail = res_json[DETAIL_RESULT_OMM] or {}
+                return {"input": detail.get(DETAIL_INPUT_FIELD, ""), "output": detail.get(DETAIL_OUTPUT_FIELD, "")}
+
+            header = res_json.get("header", {})
+            print(f"Detail Request Failed ({guid}): {header.get('returnMessage', 'Unknown Error')}")
+            return None
+
+        except Exception as e:
+            print(f"Detail Request Failed ({guid}): {e}")
+            return None
+
+    def send_raw_request(self, url, cookies, payload_text, base_url=None):
+        """
+        API 테스트 탭용 원본 요청 (성공 여부, 응답 문자열 반환)
+        base_url: 로그인한 서버. url이 그 아래 경로면 해당 서버의 세션을 사용합니다.
+        """
+        try:
+            payload = json.loads(payload_text) if payload_text else {}
+        except ValueError as e:
+            return False, f"Invalid JSON payload: {e}"
 
+        try:
+            if base_url and url.startswith(base_url.rstrip('/') + '/'):
+                session = self._get_session(base_url, cookies)
+            else:
+                session = self._get_session(url, cookies)
+            response = session.post(url, json=payload, timeout=self.timeout)
+            try:
+                body = json.dumps(response.json(), indent=2, ensure_ascii=False)
+            except ValueError:
+                body = response.text
+            return response.ok, f"HTTP {response.status_code}\n\n{body}"
         except Exception as e:
-            print(f"API Request Failed: {e}")
-            return []
+            return False, str(e)
+
+    def _note_rejection(self, base_url, status_code=None, header=None):
+        """세션 만료/인증 거부 응답이면 기록 (HTTP 401/403 또는 SESSION_EXPIRED_RETURN_CODES, 업무 오류 메시지는 보지 않음)"""
+        return_code = str((header or {}).get("returnCode") or "")
+        if status_code in (401, 403) or return_code in SESSION_EXPIRED_RETURN_CODES:
+            self.rejected_sessions.add(base_url.rstrip('/'))
+
+    def pop_session_rejected(self, base_url):
+        """해당 서버가 세션을 거부한 적이 있으면 True (기록은 지움)"""
+        key = base_url.rstrip('/')
+        if key in self.rejected_sessions:
+            self.rejected_sessions.discard(key)
+            return True
+        return False
+
+    def _get_session(self, base_url, cookies=None):
+        """서버별 공유 세션 반환 (로그인 세션과 다른 쿠키가 전달되면 병합)"""
+        session = SessionRegistry.get(base_url)
+        if cookies and cookies is not session.cookies:
+            session.cookies.update(cookies)
+        return session
 
-    def _parse_logs(self, raw_list):
+    @staticmethod
+    def _parse_logs(raw_list):
+        """
+        목록 표시용 컬럼만 추출 (원본 항목은 raw로 보관)
+        입력전문 JSON/상세 로그 문자열은 행 선택 시 core.log_format에서 생성합니다.
+        """
         parsed_data = []
         for item in raw_list:
-            is_error = item.get("opErrYn", "N") == "Y"
-            
-            log_item = {
-                "timestamp": item.get("opOccurDttm", ""),
-                "guid": item.get("guid", ""),
-                "user_ip": item.get("sendUserIp", ""),
-                "error": is_error,
-                "application": item.get("bxmAppId", ""),
-                "service": item.get("svcNm", ""),
-                "operation": item.get("opNm", ""),
-                "raw_input": json.dumps(item, indent=2, ensure_ascii=False), 
-                "raw_output": "Detail API required", 
-                "detail_log": (
-                    f"[INFO] Node: {item.get('nodeName', 'N/A')}\n"
-                    f"[INFO] Elapsed: {item.get('opElapsedMills', 0)}ms\n"
-                    f"[INFO] Message: {item.get('msgType', '')}\n"
-                    f"{'[ERROR] Transaction Failed' if is_error else '[INFO] Transaction Success'}"
-                )
-            }
-            parsed_data.append(log_item)
-        return parsed_data
\ No newline at end of file
+            get = item.get
+            parsed_data.append({
+                "timestamp": get("opOccurDttm", ""),
+                "guid": get("guid", ""),
+                "user_ip": get("sendUserIp", ""),
+                "error": get("opErrYn", "N") == "Y",
+                "application": get("bxmAppId", ""),
+                "service": get("svcNm", ""),
+                "operation": get("opNm", ""),
+                "node": get("nodeName", ""),
+                "elapsed": get("opElapsedMills", 0),
+                "msg_type": get("msgType", ""),
+                "raw": item
+            })
+        return parsed_data
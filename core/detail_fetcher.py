@@ -0,0 +1,90 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import DETAIL_CACHE_SIZE, DETAIL_FETCH_WORKERS
+from utils.lru_cache import LruCache
+
+
+class DetailFetcher:
+    """
+    거래 상세(입/출력 전문) 지연 조회
+    - 행을 선택할 때만 조회하고 결과는 LRU 캐시에 보관 (실패는 캐시하지 않음)
+    - 같은 거래를 이미 조회 중이면 새로 요청하지 않고 기존 요청 결과를 함께 받음
+    - 선택 행 주변은 prefetch()로 미리 조회하며, 선택이 바뀌면 아직 시작하지 않은 이전 미리 조회는 취소
+    키: (base_url, guid, 발생일시)
+    """
+
+    def __init__(self, api, cache_size=DETAIL_CACHE_SIZE, workers=DETAIL_FETCH_WORKERS):
+        self.api = api
+        self.cache = LruCache(cache_size)
+        self._pending = {}        # key -> Future
+        self._prefetching = {}    # key -> Future (미리 조회로 제출한 요청)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="log-detail")
+
+    def fetch(self, base_url, cookies, guid, occur_dttm="", callback=None):
+        """
+        캐시에 있으면 (key, 상세) 반환, 없으면 백그라운드 조회 후 (key, None) 반환
+        callback(key, 상세|None)은 작업 스레드에서 호출됩니다. (캐시에 있으면 호출하지 않음)
+        """
+        key = (base_url, guid, occur_dttm)
+        detail = self.cache.get(key)
+        if detail is not None:
+            return key, detail
+
+        future = self._submit(key, cookies)
+        with self._lock:
+            self._prefetching.pop(key, None)  # 선택된 행은 취소 대상에서 제외
+        if callback is not None:
+            future.add_done_callback(lambda f: f.cancelled() or callback(key, f.result()))
+        return key, None
+
+    def prefetch(self, targets, cookies_for):
+        """
+        선택 행 주변 미리 조회: targets = [(base_url, guid, 발생일시)]
+        cookies_for(base_url) -> 쿠키 (None 이면 공유 세션 사용)
+        """
+        wanted = set(targets)
+        with self._lock:
+            for key in [key for key in self._prefetching if key not in wanted]:
+                if self._prefetching.pop(key).cancel():  # 아직 실행 전인 요청만 취소됨
+                    self._pending.pop(key, None)
+
+        for key in targets:
+            if key in self.cache:
+                continue
+            future = self._submit(key, cookies_for(key[0]))
+            with self._lock:
+                self._prefetching.setdefault(key, future)
+
+    def _submit(self, key, cookies):
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None or future.cancelled():
+                future = self._executor.submit(self._fetch, key, cookies)
+                self._pending[key] = future
+            return future
+
+    def _fetch(self, key, cookies):
+        base_url, guid, occur_dttm = key
+        try:
+            detail = self.api.get_log_detail(base_url, cookies, guid, occur_dttm)
+            if detail is not None:
+                self.cache.put(key, detail)
+            return detail
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+                self._prefetching.pop(key, None)
+
+    def clear(self):
+        """캐시 및 대기 중인 미리 조회 정리 (새 조회/로그인 시)"""
+        with self._lock:
+            for key, future in self._prefetching.items():
+                if future.cancel():
+                    self._pending.pop(key, None)
+            self._prefetching.clear()
+        self.cache.clear()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
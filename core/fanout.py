@@ -0,0 +1,127 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import FANOUT_CONCURRENCY, DEFAULT_DOMAIN_ID, LOG_MAX_ROWS
+from core.log_store import ColumnBatch
+
+
+class FanOutSearch:
+    """
+    다중 서버 동시 조회
+    선택한 서버들에 병렬로 로그인 후 같은 조건으로 조회하고, 도착하는 배치를 하나의 스트림으로 합칩니다.
+    각 레코드에는 'server'(서버 이름)가 추가되며, 느리거나 실패한 서버가 다른 서버를 막지 않습니다.
+    로그인한 서버의 쿠키는 보관했다가 다음 조회에 재사용하고, 서버가 세션을 거부하면 한 번만 다시 로그인합니다.
+    """
+    _DONE = object()
+
+    def __init__(self, api, log_cache):
+        self.api = api
+        self.log_cache = log_cache
+        self.sessions = {}  # 동시 조회에서 로그인한 서버 {url: cookies}
+        self._lock = threading.Lock()
+
+    def _login(self, server):
+        """로그인 후 쿠키 보관 -> (성공 여부, cookies, 메시지)"""
+        url = server.get('url', '')
+        success, cookies, msg = self.api.login(url, server.get('id', ''), server.get('password', ''),
+                                               server.get('domain', DEFAULT_DOMAIN_ID))
+        with self._lock:
+            if success:
+                self.sessions[url] = dict(cookies.items())
+            else:
+                self.sessions.pop(url, None)
+        return success, cookies, msg
+
+    def forget(self, url):
+        """보관한 쿠키 삭제 (해당 서버에 다른 계정으로 로그인한 경우 등)"""
+        with self._lock:
+            self.sessions.pop(url, None)
+
+    def iter_events(self, servers, start_dt, end_dt, search_keyword="", use_cache=True,
+                    sessions=None, max_rows=LOG_MAX_ROWS):
+        """
+        servers: login_urls.json 항목 목록 ({name, url, id, password[, domain]})
+        sessions: 이미 로그인된 서버 {url: cookies} (재로그인 생략, 보관한 쿠키보다 우선)
+        yield: ("batch", name, records) | ("status", name, message)
+        """
+        events = queue.Queue()
+        stop = threading.Event()
+        sessions = sessions or {}
+
+        def worker(server):
+            name = server.get('name', server.get('url', ''))
+            url = server.get('url', '')
+            try:
+                cookies = sessions.get(url)
+                cached = False
+                if not cookies:
+                    with self._lock:
+                        cookies = self.sessions.get(url)
+                    cached = bool(cookies)
+                if not cookies:
+                    events.put(("status", name, "Logging in..."))
+                    success, cookies, msg = self._login(server)
+                    if not success:
+                        events.put(("status", name, f"Login failed: {msg}"))
+                        return
+
+                count = 0
+                while True:
+                    gen = self.log_cache.iter_logs(self.api, url, cookies, start_dt, end_dt,
+                                                   search_keyword, max_rows=max_rows, bypass=not use_cache)
+                    for batch in gen:
+                        if stop.is_set():
+                            gen.close()
+                            return
+                        if isinstance(batch, ColumnBatch):
+                            batch.set_field('server', name)
+                        else:
+                            for record in batch:
+                                record['server'] = name
+                        count += len(batch)
+                        events.put(("batch", name, batch))
+                    # 보관한 쿠키가 만료되어 거부된 경우에만 다시 로그인 후 한 번 더 조회
+                    if not (cached and self.api.pop_session_rejected(url)):
+                        break
+                    cached = False
+                    if count:
+                        self.forget(url)  # 다음 조회에서 다시 로그인
+                        events.put(("status", name, f"Session expired after {count:,} rows"))
+                        return
+                    events.put(("status", name, "Session expired, logging in..."))
+                    success, cookies, msg = self._login(server)
+                    if not success:
+                        events.put(("status", name, f"Login failed: {msg}"))
+                        return
+                events.put(("status", name, f"{count:,} rows"))
+            except Exception as e:
+                events.put(("status", name, f"Error: {e}"))
+            finally:
+                events.put((self._DONE, name, None))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(FANOUT_CONCURRENCY, len(servers))),
+                                      thread_name_prefix="fanout")
+        try:
+            for server in servers:
+                executor.submit(worker, server)
+
+            remaining = len(servers)
+            total = 0
+            while remaining:
+                kind, name, payload = events.get()
+                if kind is self._DONE:
+                    remaining -= 1
+                    continue
+                if kind == "batch":
+                    payload = payload[:max_rows - total]
+                    total += len(payload)
+                    yield kind, name, payload
+                    if total >= max_rows:
+                        yield "status", name, f"Row limit ({max_rows:,}) reached"
+                        return
+                else:
+                    yield kind, name, payload
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,75 @@
+import threading
+from urllib.parse import urlsplit
+
+from config.settings import (DEFAULT_HEADERS, HTTP_POOL_CONNECTIONS,
+                             HTTP_POOL_MAXSIZE, HTTP_CONNECT_RETRIES)
+
+
+class SessionRegistry:
+    """
+    BXM 서버(Base URL)별 keep-alive 세션 저장소
+    로그인 시 생성한 세션을 이후 모든 호출(로그 조회, API 스캔, API 테스트)에서 재사용하여
+    매 요청마다 TCP/TLS 핸드셰이크가 발생하지 않도록 합니다.
+    같은 host:port 아래 경로만 다른 서버도 쿠키가 섞이지 않도록 경로까지 포함한 Base URL로 구분합니다.
+    """
+    _sessions = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(url):
+        """정규화한 Base URL을 키로 사용 (scheme/host 소문자, 경로 끝 '/' 제거, query/fragment 제외)"""
+        parts = urlsplit(url.strip())
+        if not parts.netloc:
+            return url.strip().rstrip('/').lower()
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+    @staticmethod
+    def _create_session():
+        # requests/urllib3는 import 비용이 커서 첫 세션 생성 시 로드 (프로그램 시작 시간 단축)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+
+        retry = Retry(total=HTTP_CONNECT_RETRIES, connect=HTTP_CONNECT_RETRIES,
+                      read=0, status=0, backoff_factor=0.1, allowed_methods=None)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                              pool_maxsize=HTTP_POOL_MAXSIZE,
+                              max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @classmethod
+    def get(cls, url):
+        """해당 서버의 세션 반환 (없으면 생성)"""
+        key = cls._key(url)
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                session = cls._create_session()
+                cls._sessions[key] = session
+            return session
+
+    @classmethod
+    def reset(cls, url):
+        """기존 세션을 닫고 새 세션 생성 (재로그인 시 쿠키 초기화)"""
+        key = cls._key(url)
+        with cls._lock:
+            old = cls._sessions.pop(key, None)
+            session = cls._create_session()
+            cls._sessions[key] = session
+        if old is not None:
+            old.close()
+        return session
+
+    @classmethod
+    def close_all(cls):
+        """모든 세션 종료 (프로그램 종료 시)"""
+        with cls._lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            session.close()
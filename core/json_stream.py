@@ -0,0 +1,80 @@
+import codecs
+import json
+import re
+
+DOCUMENT_LIMIT = 64 * 1024   # 배열이 없는 응답(오류 응답 등)을 전체 파싱하기 위해 보관하는 최대 크기
+
+_SEEK, _ITEMS, _DONE = range(3)
+_SEEK_KEEP = 256                      # 키를 찾는 동안 조각 경계에 걸친 키를 위해 남겨 두는 글자 수
+_SEPARATOR = re.compile(r'[\s,]*')
+
+
+class JsonArrayStream:
+    """
+    JSON 응답 본문을 조각(chunk) 단위로 받아 지정한 키의 배열 항목을 하나씩 꺼냄
+    전체 본문이나 객체 트리를 만들지 않으므로 응답 크기와 관계없이 메모리는 미처리 조각 + 항목 하나 수준
+    - key: 배열 키 이름 (본문에서 처음 나오는 "key": [ 를 배열 시작으로 봄)
+    - feed(chunk) -> 이번 조각까지 완성된 항목 목록
+    - close(): 본문이 끝났는데 배열이 닫히지 않았으면 ValueError
+    - document(): 본문이 DOCUMENT_LIMIT 이하면 전체 파싱 결과 (배열이 없을 때 header 확인용), 초과하면 None
+
+    항목 파싱은 json.JSONDecoder.raw_decode (C 스캐너)를 사용합니다.
+    항목이 아직 다 오지 않았으면 남은 글자를 보관했다가 다음 조각과 이어서 파싱합니다.
+    """
+
+    def __init__(self, key):
+        self._start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._decode = json.JSONDecoder().raw_decode
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()  # 조각 경계의 멀티바이트 문자 처리
+        self._text = ""
+        self._state = _SEEK
+        self._head = bytearray()
+        self._size = 0
+
+    def feed(self, chunk):
+        if not chunk:
+            return []
+        if len(self._head) < DOCUMENT_LIMIT:
+            self._head += chunk[:DOCUMENT_LIMIT - len(self._head)]
+        self._size += len(chunk)
+        if self._state == _DONE:
+            return []
+
+        text = self._text + self._utf8.decode(chunk)
+        pos = 0
+        if self._state == _SEEK:
+            match = self._start.search(text)
+            if match is None:
+                self._text = text[-_SEEK_KEEP:]
+                return []
+            pos = match.end()
+            self._state = _ITEMS
+
+        items = []
+        size = len(text)
+        while True:
+            pos = _SEPARATOR.match(text, pos).end()
+            if pos >= size:
+                break
+            if text[pos] == "]":
+                self._state = _DONE
+                break
+            try:
+                item, end = self._decode(text, pos)
+            except ValueError:
+                break  # 항목이 아직 다 오지 않음
+            if end == size and text[pos] not in '{["':
+                break  # 숫자/리터럴은 다음 조각에 이어질 수 있음
+            items.append(item)
+            pos = end
+        self._text = text[pos:] if self._state == _ITEMS else ""
+        return items
+
+    def close(self):
+        if self._state == _ITEMS:
+            raise ValueError("JSON 배열이 끝나기 전에 응답이 끊겼습니다.")
+
+    def document(self):
+        if self._size > DOCUMENT_LIMIT:
+            return None
+        return json.loads(bytes(self._head)) if self._head.strip() else {}
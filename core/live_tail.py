@@ -0,0 +1,50 @@
+from core.log_store import ColumnBatch
+from utils.time_utils import to_ts_key, ts_key_to_text
+
+
+class TailCursor:
+    """
+    실시간 추적 기준점
+    지금까지 받은 레코드 중 가장 늦은 opOccurDttm(초 단위)과 그 초에 속한 레코드 키를 기억합니다.
+    다음 조회는 그 초부터 다시 요청하고, 경계 초에서 이미 받은 레코드는 걸러냅니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.max_sec_key = 0      # yyyyMMddHHmmss
+        self.boundary = set()     # (guid, ts_key) - max_sec_key 초에 속한 레코드
+
+    def observe(self, batch):
+        """화면에 추가된 배치로 기준점 갱신 (ColumnBatch는 일시 문자열 변환 없이 컬럼을 그대로 사용)"""
+        if isinstance(batch, ColumnBatch):
+            keys = zip(batch.guid, batch.ts)
+        else:
+            keys = ((record['guid'], to_ts_key(record['timestamp'])) for record in batch)
+        for guid, ts_key in keys:
+            sec_key = ts_key // 1000
+            if sec_key > self.max_sec_key:
+                self.max_sec_key = sec_key
+                self.boundary = {(guid, ts_key)}
+            elif sec_key == self.max_sec_key:
+                self.boundary.add((guid, ts_key))
+
+    def filter_new(self, batch):
+        """경계 구간 중복 제거 (기준점 이전 레코드도 제외)"""
+        new_records = []
+        for record in batch:
+            ts_key = to_ts_key(record['timestamp'])
+            sec_key = ts_key // 1000
+            if sec_key < self.max_sec_key:
+                continue
+            if sec_key == self.max_sec_key and (record['guid'], ts_key) in self.boundary:
+                continue
+            new_records.append(record)
+        return new_records
+
+    def start_text(self):
+        """다음 조회 시작 일시 (기준점이 없으면 None)"""
+        if not self.max_sec_key:
+            return None
+        return ts_key_to_text(self.max_sec_key * 1000, with_ms=False)
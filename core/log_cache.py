@@ -0,0 +1,261 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from config.settings import (CACHE_DIR, CACHE_DB_FILE, CACHE_MAX_BYTES,
+                             CACHE_SETTLE_SEC, CACHE_READ_BATCH, LOG_MAX_ROWS)
+from core.log_store import encode_raw, ColumnBatch
+from utils.time_utils import to_ts_key
+
+DTTM_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    cache_key   TEXT    NOT NULL,
+    start_sec   INTEGER NOT NULL,
+    end_sec     INTEGER NOT NULL,
+    row_count   INTEGER NOT NULL,
+    byte_size   INTEGER NOT NULL,
+    last_access REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_segments_key ON segments (cache_key, start_sec);
+
+CREATE TABLE IF NOT EXISTS rows (
+    segment_id  INTEGER NOT NULL,
+    ts_key      INTEGER NOT NULL,
+    raw         BLOB    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rows_segment ON rows (segment_id, ts_key);
+"""
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_sec(dttm_text):
+    return int((datetime.strptime(dttm_text, DTTM_FORMAT) - _EPOCH).total_seconds())
+
+
+def _to_text(sec):
+    return (_EPOCH + timedelta(seconds=sec)).strftime(DTTM_FORMAT)
+
+
+class LogCache:
+    """
+    로컬 로그 캐시 (SQLite WAL)
+    '서버 URL + 조회조건'별로 이미 받아둔 시간 구간(segment)과 원본 항목을 저장합니다.
+    조회 시 저장된 구간은 디스크에서 읽고, 비어 있는 구간만 서버에 요청합니다.
+    현재 시각에 가까운 구간(CACHE_SETTLE_SEC 이내)은 데이터가 더 들어올 수 있으므로 저장하지 않습니다.
+    """
+
+    def __init__(self, db_path=None, max_bytes=CACHE_MAX_BYTES):
+        self.db_path = db_path or os.path.join(CACHE_DIR, CACHE_DB_FILE)
+        self.max_bytes = max_bytes
+        self._write_lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self, readonly=False):
+        """readonly=True: 쓰기 트랜잭션을 열지 않는 연결 (오래 열어 두는 조회용)"""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            if not self._initialized:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+            conn.execute("PRAGMA synchronous = NORMAL")
+            if readonly:
+                conn.execute("PRAGMA query_only = ON")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(base_url, query=""):
+        """query: GUID 문자열 또는 서버 조회조건 dict (같은 조건이면 항목 순서와 무관하게 같은 키)"""
+        if isinstance(query, dict):
+            query = "&".join(f"{k}={v}" for k, v in sorted(query.items()) if v)
+        return f"{base_url.rstrip('/').lower()}|{query or ''}"
+
+    # ---------------------------------------------------------
+    # 조회 계획
+    # ---------------------------------------------------------
+    def plan(self, cache_key, start_sec, end_sec):
+        """
+        [start_sec, end_sec] 구간을 시간순 조각으로 분할
+        반환: [("cache", [segment_id, ...], s, e) | ("fetch", None, s, e), ...]
+        """
+        with self._connect() as conn:
+            segments = conn.execute(
+                "SELECT id, start_sec, end_sec FROM segments "
+                "WHERE cache_key = ? AND end_sec >= ? AND start_sec <= ? ORDER BY start_sec",
+                (cache_key, start_sec, end_sec)
+            ).fetchall()
+
+        pieces = []
+        cursor = start_sec
+        for seg_id, seg_start, seg_end in segments:
+            if seg_start > cursor:
+                pieces.append(("fetch", None, cursor, seg_start - 1))
+            lo, hi = max(seg_start, cursor), min(seg_end, end_sec)
+            if lo <= hi:
+                if pieces and pieces[-1][0] == "cache" and pieces[-1][3] == lo - 1:
+                    kind, ids, s, _ = pieces.pop()
+                    pieces.append((kind, ids + [seg_id], s, hi))
+                else:
+                    pieces.append(("cache", [seg_id], lo, hi))
+                cursor = hi + 1
+        if cursor <= end_sec:
+            pieces.append(("fetch", None, cursor, end_sec))
+        return pieces
+
+    # ---------------------------------------------------------
+    # 읽기/쓰기
+    # ---------------------------------------------------------
+    def read_raw(self, segment_ids, start_sec, end_sec, batch_size=CACHE_READ_BATCH):
+        """
+        저장된 원본 항목(bytes)을 배치 단위로 반환 (Generator)
+        사용 시각 갱신은 짧은 쓰기 트랜잭션으로 먼저 끝내고, 배치를 내보내는 동안에는 읽기 전용 연결만 열어 둡니다.
+        (UI로 배치를 넘기는 동안 다른 작업의 store()가 막히지 않도록)
+        """
+        lo = to_ts_key(_to_text(start_sec))
+        hi = to_ts_key(_to_text(end_sec)) + 999
+        marks = ",".join("?" * len(segment_ids))
+        with self._write_lock, self._connect() as conn:
+            conn.execute(f"UPDATE segments SET last_access = ? WHERE id IN ({marks})",
+                         (time.time(), *segment_ids))
+        with self._connect(readonly=True) as conn:
+            cur = conn.execute(
+                f"SELECT raw FROM rows WHERE segment_id IN ({marks}) AND ts_key BETWEEN ? AND ? "
+                "ORDER BY ts_key",
+                (*segment_ids, lo, hi)
+            )
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [row[0] for row in rows]
+
+    def store(self, cache_key, start_sec, end_sec, raw_items):
+        """확정된 구간 하나를 저장 (raw_items: 원본 dict 또는 bytes 목록, 또는 (일시 키, bytes) 목록)"""
+        encoded = []
+        for item in raw_items:
+            if isinstance(item, tuple):
+                encoded.append(item)
+                continue
+            data = encode_raw(item)
+            if isinstance(item, dict):
+                ts_key = to_ts_key(item.get("opOccurDttm"))
+            else:
+                ts_key = to_ts_key(json.loads(data).get("opOccurDttm"))
+            encoded.append((ts_key, data))
+
+        byte_size = sum(len(data) for _, data in encoded)
+        with self._write_lock, self._connect() as conn:
+            cur = conn.execute(
+                "INSERT INTO segments (cache_key, start_sec, end_sec, row_count, byte_size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key, start_sec, end_sec, len(encoded), byte_size, time.time())
+            )
+            seg_id = cur.lastrowid
+            conn.executemany("INSERT INTO rows (segment_id, ts_key, raw) VALUES (?, ?, ?)",
+                             ((seg_id, ts_key, data) for ts_key, data in encoded))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        """전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 구간부터 삭제"""
+        total = conn.execute("SELECT COALESCE(SUM(byte_size), 0) FROM segments").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for seg_id, size in conn.execute(
+                "SELECT id, byte_size FROM segments ORDER BY last_access").fetchall():
+            conn.execute("DELETE FROM rows WHERE segment_id = ?", (seg_id,))
+            conn.execute("DELETE FROM segments WHERE id = ?", (seg_id,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        conn.execute("PRAGMA incremental_vacuum")
+
+    def clear(self):
+        with self._write_lock, self._connect() as conn:
+            conn.execute("DELETE FROM rows")
+            conn.execute("DELETE FROM segments")
+            conn.execute("PRAGMA incremental_vacuum")
+
+    # ---------------------------------------------------------
+    # 캐시 적용 조회
+    # ---------------------------------------------------------
+    def iter_logs(self, api, base_url, cookies, start_dt, end_dt, search_keyword="",
+                  max_rows=LOG_MAX_ROWS, bypass=False):
+        """
+        ApiService.iter_system_logs와 같은 배치를 yield 하되, 저장된 구간은 디스크에서 읽음
+        bypass=True 이면 캐시를 사용하지 않고 서버에서 직접 조회합니다.
+        """
+        try:
+            start_sec, end_sec = _to_sec(start_dt), _to_sec(end_dt)
+        except ValueError:
+            bypass = True
+        if bypass:
+            return (yield from api.iter_system_logs_sharded(base_url, cookies, start_dt, end_dt,
+                                                            search_keyword, max_rows=max_rows))
+
+        cache_key = self.make_key(base_url, search_keyword)
+        settled_sec = int((datetime.now() - _EPOCH).total_seconds()) - CACHE_SETTLE_SEC
+        total = 0
+        complete = True
+
+        for kind, segment_ids, s, e in self.plan(cache_key, start_sec, end_sec):
+            if total >= max_rows:
+                return False
+
+            if kind == "cache":
+                for raws in self.read_raw(segment_ids, s, e):
+                    batch = api._parse_logs([json.loads(raw) for raw in raws[:max_rows - total]])
+                    total += len(batch)
+                    yield batch
+                    if total >= max_rows:
+                        return False
+                continue
+
+            # 서버 조회: 확정된 과거 구간과 아직 변할 수 있는 최근 구간을 분리
+            sub_pieces = [(s, e, False)]
+            if s <= settled_sec < e:
+                sub_pieces = [(s, settled_sec, True), (settled_sec + 1, e, False)]
+            elif e <= settled_sec:
+                sub_pieces = [(s, e, True)]
+
+            for sub_s, sub_e, cacheable in sub_pieces:
+                fetched = []
+                done = yield from self._fetch(api, base_url, cookies, sub_s, sub_e,
+                                              search_keyword, max_rows - total, fetched)
+                total += len(fetched)
+                if not done:
+                    complete = False
+                elif cacheable:
+                    self.store(cache_key, sub_s, sub_e, fetched)
+
+        return complete
+
+    @staticmethod
+    def _fetch(api, base_url, cookies, start_sec, end_sec, search_keyword, max_rows, sink):
+        """서버 조회 결과를 yield 하면서 저장용 원본 항목을 sink에 모음"""
+        gen = api.iter_system_logs_sharded(base_url, cookies, _to_text(start_sec), _to_text(end_sec),
+                                           search_keyword, max_rows=max_rows)
+        while True:
+            try:
+                batch = next(gen)
+            except StopIteration as stop:
+                return bool(stop.value)
+            if isinstance(batch, ColumnBatch):
+                sink.extend(batch.cache_items())
+            else:
+                sink.extend(record['raw'] for record in batch)
+            yield batch
@@ -0,0 +1,146 @@
+import json
+import mmap
+import os
+import re
+
+from core.api_service import ApiService
+
+# 선택 의존성: 빠른 JSON 파싱
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 평면 JSON 객체 하나 (중첩 객체 없이 문자열 안의 괄호/따옴표 처리) - getServiceLogList 항목 형태
+_FLAT_OBJECT = re.compile(rb'\{[^{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}"]*)*\}')
+# 배열 항목 사이 (공백과 쉼표 하나)
+_SEPARATOR = re.compile(rb'\s*(?:,\s*)?')
+_LIST_KEY = b'"serviceLogList"'
+_DECODE_WINDOW = 64 * 1024
+
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+def _loads(data):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _object_end(buffer, pos):
+    """pos의 '{'로 시작하는 JSON 값의 끝 위치 (중첩 객체가 있는 항목, raw_decode로 경계 확인)"""
+    window = _DECODE_WINDOW
+    while True:
+        text = buffer[pos:pos + window].decode('utf-8', errors='replace')  # 잘린 마지막 글자는 항목 밖
+        try:
+            _, end = _raw_decode(text)
+            return pos + len(text[:end].encode('utf-8'))
+        except ValueError as e:
+            if pos + window >= len(buffer):
+                raise ValueError(f"항목을 해석할 수 없습니다 (위치 {pos:,}): {e}") from None
+            window *= 4
+
+
+class LogDumpReader:
+    """
+    로컬 BXM 로그 파일 (서버 로그인 없이 분석)
+    - getServiceLogList 응답을 저장한 JSON (또는 항목 배열 JSON)
+    - 한 줄에 항목 하나인 JSONL (Export Results로 내보낸 파일 등)
+
+    파일을 mmap으로 열어 한 번 훑으며 항목 위치(시작, 끝)를 찾고, 목록 컬럼만 파싱합니다.
+    원본 항목은 복사하지 않고 위치만 넘기므로 상세 화면에서 볼 때 해당 구간만 읽습니다.
+    (LogStore.set_raw_column(MappedRawColumn(reader.buffer)) 와 함께 사용)
+    """
+
+    def __init__(self, path):
+        if path.lower().endswith((".gz", ".zst")):
+            raise ValueError("압축된 파일은 압축을 해제한 뒤 열어 주세요.")
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._file = open(path, "rb")
+        # 빈 파일은 mmap 할 수 없음
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.format = self._detect_format()
+
+    def _detect_format(self):
+        """'jsonl' | 'array' (항목 배열) | 'response' (getServiceLogList 응답)"""
+        head = self.buffer[:4096].lstrip()
+        if not head:
+            return "jsonl"
+        if head.startswith(b"["):
+            return "array"
+
+        # 첫 줄이 완결된 항목 하나면 JSONL, 아니면(여러 줄로 정렬된 응답 등) 응답 파일
+        newline = self.buffer.find(b"\n")
+        first_line = self.buffer[:newline if newline != -1 else self.size]
+        if _LIST_KEY in first_line[:64 * 1024]:
+            return "response"
+        try:
+            _loads(first_line)
+            return "jsonl"
+        except ValueError:
+            return "response"
+
+    def iter_spans(self):
+        """항목의 (시작, 끝) 위치를 파일 순서대로"""
+        buffer = self.buffer
+        if self.format == "jsonl":
+            pos, size = 0, self.size
+            find = buffer.find
+            while pos < size:
+                end = find(b"\n", pos)
+                if end == -1:
+                    end = size
+                line_end = end
+                while line_end > pos and buffer[line_end - 1] in b"\r \t":
+                    line_end -= 1
+                if line_end > pos:
+                    yield pos, line_end
+                pos = end + 1
+            return
+
+        key = 0
+        if self.format == "response":
+            key = buffer.find(_LIST_KEY)
+            if key == -1:
+                raise ValueError("serviceLogList 항목을 찾을 수 없습니다.")
+        start = buffer.find(b"[", key)
+        if start == -1 or not buffer[start + 1:start + 4096].lstrip().startswith(b"{"):
+            return  # 빈 목록
+
+        # 평면 항목은 정규식으로 연속해서 찾고, 항목 사이에 다른 내용이 있으면(중첩 객체) 해당 항목만 raw_decode
+        pos = start + 1
+        while True:
+            for match in _FLAT_OBJECT.finditer(buffer, pos):
+                if not _SEPARATOR.fullmatch(buffer, pos, match.start()):
+                    break
+                yield match.span()
+                pos = match.end()
+            item_start = _SEPARATOR.match(buffer, pos).end()
+            if buffer[item_start:item_start + 1] != b"{":
+                return  # 배열 끝(]) - 응답의 다른 객체는 제외
+            pos = _object_end(buffer, item_start)
+            yield item_start, pos
+
+    def iter_batches(self, batch_rows):
+        """파싱된 레코드 배치 (raw는 파일 내 (시작, 끝) 위치)"""
+        batch_spans = []
+        for span in self.iter_spans():
+            batch_spans.append(span)
+            if len(batch_spans) >= batch_rows:
+                yield self._parse(batch_spans)
+                batch_spans = []
+        if batch_spans:
+            yield self._parse(batch_spans)
+
+    def _parse(self, spans):
+        buffer = self.buffer
+        items = [_loads(buffer[start:end]) for start, end in spans]
+        records = ApiService._parse_logs(items)
+        for record, span in zip(records, spans):
+            record['raw'] = span
+        return records
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
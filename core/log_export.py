@@ -0,0 +1,116 @@
+import csv
+import gzip
+import io
+import json
+
+from core.log_store import encode_raw
+
+# 선택 의존성: zstd 압축
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# CSV 컬럼 (레코드 키와 동일)
+CSV_COLUMNS = ("timestamp", "guid", "user_ip", "error", "application", "service",
+               "operation", "node", "elapsed", "msg_type", "server")
+
+
+def export_format(path):
+    """파일 이름으로 (형식, 압축) 판단: ('jsonl'|'csv', None|'gzip'|'zstd')"""
+    name = path.lower()
+    compression = None
+    if name.endswith(".gz"):
+        compression, name = "gzip", name[:-3]
+    elif name.endswith(".zst"):
+        compression, name = "zstd", name[:-4]
+
+    if name.endswith(".csv"):
+        return "csv", compression
+    if name.endswith((".jsonl", ".json", ".ndjson")):
+        return "jsonl", compression
+    raise ValueError(f"지원하지 않는 내보내기 형식입니다: {path}")
+
+
+def _jsonl_line(record):
+    """
+    레코드 -> JSONL 한 줄 (BXM 원본 항목, 동시 조회 결과는 'server' 추가)
+    원본 bytes는 그대로 쓰되, 줄바꿈이 있는(보기 좋게 들여쓴 덤프 파일) 항목과 server를 붙일 항목만 다시 직렬화합니다.
+    """
+    raw = record.get('raw', {})
+    server = record.get('server')
+    if isinstance(raw, (bytes, bytearray)):
+        if not server and b"\n" not in raw and b"\r" not in raw:
+            return bytes(raw)
+        raw = json.loads(raw)
+    if server and isinstance(raw, dict):
+        raw = {**raw, 'server': server}
+    return encode_raw(raw)
+
+
+def _open_binary(path, compression):
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd 압축을 사용하려면 'pip install zstandard'가 필요합니다.")
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb")
+
+
+class LogExporter:
+    """
+    조회 결과 스트리밍 내보내기 (JSONL / CSV, gzip / zstd 압축)
+    레코드 배치를 받는 즉시 파일에 기록하므로 전체 결과를 메모리에 모으지 않습니다.
+    - JSONL: 한 줄에 BXM 원본 항목(raw) 하나 (다시 불러와 분석 가능한 형태, 동시 조회 결과는 server 포함)
+    - CSV: 화면 컬럼 기준 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)
+
+    with LogExporter(path) as exporter:
+        for batch in batches:
+            exporter.write_batch(batch)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format, self.compression = export_format(path)
+        self.count = 0
+        self._stream = _open_binary(path, self.compression)
+        self._text = None
+        self._csv = None
+        if self.format == "csv":
+            self._text = io.TextIOWrapper(self._stream, encoding="utf-8-sig", newline="")
+            self._csv = csv.writer(self._text)
+            self._csv.writerow(CSV_COLUMNS)
+
+    def write_batch(self, records):
+        """dict 레코드 또는 LogRow 목록 기록"""
+        if self._csv is not None:
+            self._csv.writerows(
+                [self._csv_value(record.get(column, "")) for column in CSV_COLUMNS] for record in records)
+        else:
+            raws = [_jsonl_line(record) for record in records]
+            if raws:
+                self._stream.write(b"\n".join(raws) + b"\n")
+        self.count += len(records)
+
+    @staticmethod
+    def _csv_value(value):
+        if value is True:
+            return "FAIL"
+        if value is False:
+            return "OK"
+        return value
+
+    def close(self):
+        if self._text is not None:
+            self._text.close()   # 내부 스트림까지 닫힘
+        else:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
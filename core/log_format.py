@@ -0,0 +1,36 @@
+import json
+
+# 출력전문 자리에 표시하는 문구 (상세 조회 불가 / 조회 중 / 실패)
+RAW_OUTPUT_PLACEHOLDER = "Detail API required"
+DETAIL_LOADING_TEXT = "Loading detail..."
+DETAIL_FAILED_TEXT = "Detail request failed"
+
+
+def render_raw_input(record):
+    """원본 항목(raw)을 보기 좋은 JSON 문자열로 변환 (행 선택 시에만 호출)"""
+    raw = record.get('raw')
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        raw = json.loads(bytes(raw))
+    elif isinstance(raw, str):
+        raw = json.loads(raw)
+    return json.dumps(raw, indent=2, ensure_ascii=False)
+
+
+def render_message(message):
+    """상세 조회로 받은 전문 표시 (JSON 문자열/객체는 들여쓰기, 그 외는 그대로)"""
+    if isinstance(message, str):
+        try:
+            message = json.loads(message)
+        except ValueError:
+            return message
+    return json.dumps(message, indent=2, ensure_ascii=False)
+
+
+def render_detail_log(record):
+    """상세 로그 텍스트 생성"""
+    return (
+        f"[INFO] Node: {record.get('node') or 'N/A'}\n"
+        f"[INFO] Elapsed: {record.get('elapsed', 0)}ms\n"
+        f"[INFO] Message: {record.get('msg_type', '')}\n"
+        f"{'[ERROR] Transaction Failed' if record['error'] else '[INFO] Transaction Success'}"
+    )
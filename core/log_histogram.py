@@ -0,0 +1,114 @@
+from array import array
+from datetime import datetime, timedelta
+
+MINUTE_DIVISOR = 100000   # yyyyMMddHHmmssSSS // 100000 -> yyyyMMddHHmm
+
+
+def latency_bin(value):
+    """경과시간 -> 구간 번호 (2의 거듭제곱마다 4칸, 상대 오차 25% 이내 / 0~7은 정확)"""
+    if value < 8:
+        return max(value, 0)
+    shift = value.bit_length() - 3
+    return shift * 4 + (value >> shift)
+
+
+def bin_floor(bin_no):
+    """구간 번호 -> 구간 시작 값"""
+    if bin_no < 8:
+        return bin_no
+    shift = bin_no // 4 - 1
+    return (bin_no % 4 + 4) << shift
+
+
+class MinuteBucket:
+    __slots__ = ("rows", "errors", "latency")
+
+    def __init__(self):
+        self.rows = array('I')   # 이 분에 속한 레코드 번호
+        self.errors = 0
+        self.latency = {}        # latency_bin -> 건수
+
+    def percentile(self, percent):
+        """구간 히스토그램 기준 근사 백분위 (구간 시작 값)"""
+        target = len(self.rows) * percent / 100
+        seen = 0
+        for bin_no in sorted(self.latency):
+            seen += self.latency[bin_no]
+            if seen >= target:
+                return bin_floor(bin_no)
+        return 0
+
+
+class MinuteHistogram:
+    """
+    분 단위 처리량/에러/지연 집계 (LogIndex와 같이 배치 도착 시 증분 갱신)
+    - 분별 건수, 에러 수, 경과시간 구간 히스토그램(p95 근사)
+    - 분별 레코드 번호 목록을 보관하므로 시간 구간 선택 시 전체 행을 훑지 않고 바로 필터링
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.clear()
+
+    def clear(self):
+        self.buckets = {}      # yyyyMMddHHmm -> MinuteBucket
+        self.count = 0
+        self.version = 0       # 변경될 때마다 증가 (화면 캐시 무효화용)
+
+    def add_rows(self, start_no, end_no):
+        """저장소의 [start_no, end_no) 레코드를 집계에 추가"""
+        buckets = self.buckets
+        ts = self.store.ts
+        error = self.store.error
+        elapsed = self.store.elapsed
+
+        bucket = None
+        current = None
+        for rec_no in range(start_no, end_no):
+            minute = ts[rec_no] // MINUTE_DIVISOR
+            if not minute:
+                continue  # 일시 형식 오류
+            if minute != current:
+                current = minute
+                bucket = buckets.get(minute)
+                if bucket is None:
+                    bucket = buckets[minute] = MinuteBucket()
+            bucket.rows.append(rec_no)
+            if error[rec_no]:
+                bucket.errors += 1
+            bin_no = latency_bin(elapsed[rec_no])
+            bucket.latency[bin_no] = bucket.latency.get(bin_no, 0) + 1
+
+        self.count = max(self.count, end_no)
+        self.version += 1
+
+    def minute_range(self):
+        """첫 분부터 마지막 분까지 빠짐없는 분 키 목록 (yyyyMMddHHmm)"""
+        if not self.buckets:
+            return []
+        first = datetime.strptime(str(min(self.buckets)), "%Y%m%d%H%M")
+        last = datetime.strptime(str(max(self.buckets)), "%Y%m%d%H%M")
+        minutes = int((last - first).total_seconds() // 60) + 1
+        step = timedelta(minutes=1)
+        return [int((first + step * i).strftime("%Y%m%d%H%M")) for i in range(minutes)]
+
+    def series(self, with_p95=False):
+        """분 키 목록과 분별 (건수, 에러 수, p95) 목록 - 데이터가 없는 분은 0"""
+        keys = self.minute_range()
+        values = []
+        for minute in keys:
+            bucket = self.buckets.get(minute)
+            if bucket is None:
+                values.append((0, 0, 0))
+            else:
+                values.append((len(bucket.rows), bucket.errors, bucket.percentile(95) if with_p95 else 0))
+        return keys, values
+
+    def rows_between(self, first_minute, last_minute):
+        """분 구간(양 끝 포함)에 속한 레코드 번호 목록 (정렬됨)"""
+        rows = []
+        for minute, bucket in self.buckets.items():
+            if first_minute <= minute <= last_minute:
+                rows.extend(bucket.rows)
+        rows.sort()
+        return rows
@@ -0,0 +1,158 @@
+from array import array
+from bisect import bisect_right
+from itertools import chain, compress
+
+
+class LogIndex:
+    """
+    조회 결과 인덱스 (레코드 번호 기반)
+    배치가 도착할 때마다 증분으로 갱신되며, GUID 및 보조 컬럼 값으로 해당 레코드 번호 목록을
+    O(1)로 조회합니다. (같은 GUID가 여러 건일 수 있음)
+    보조 컬럼은 저장소의 사전 인코딩 코드별로 레코드 번호 배열을 둡니다.
+    키워드 검색은 저장소의 사전 인코딩 어휘와 GUID 연결 문자열에서 부분 일치를 찾아
+    행 마스크(행마다 0/1 한 바이트)로 합치므로 행마다 문자열을 비교하지 않습니다.
+    """
+    FIELDS = ("service", "operation", "application", "user_ip", "node")
+    CODE_FIELDS = FIELDS + ("server",)  # 값 -> 레코드 번호 목록을 두는 컬럼
+    GUID_BLOCK_ROWS = 4096  # GUID 검색 문자열 블록 크기
+
+    def __init__(self, store):
+        self.store = store
+        self.clear()
+
+    def clear(self):
+        self.by_guid = {}
+        self.by_code = {field: [] for field in self.CODE_FIELDS}  # 컬럼 -> [코드별 레코드 번호 배열]
+        self.count = 0
+        # GUID 부분 검색용: (첫 레코드 번호, 소문자 GUID를 줄바꿈으로 연결한 문자열, 행 시작 위치)
+        self._guid_blocks = []
+        self._guid_pending = []
+        self._guid_pending_start = 0
+
+    def add_batch(self, batch, start_no):
+        """batch[i]의 레코드 번호는 start_no + i (저장소에 이미 추가된 배치, GUID는 저장소 컬럼에서 읽음)"""
+        by_guid = self.by_guid
+
+        if not self._guid_pending:
+            self._guid_pending_start = start_no
+        pending = self._guid_pending
+
+        end_no = start_no + len(batch)
+        for rec_no, guid in enumerate(self.store.guid[start_no:end_no], start_no):
+            by_guid.setdefault(guid, []).append(rec_no)
+            pending.append(guid.lower())
+
+        for field in self.CODE_FIELDS:
+            column = self.store.dict_columns[field]
+            rows = self.by_code[field]
+            rows.extend(array('I') for _ in range(len(column.values) - len(rows)))
+            for rec_no, code in enumerate(column.codes[start_no:end_no], start_no):
+                rows[code].append(rec_no)
+        self.count += len(batch)
+
+        if len(pending) >= self.GUID_BLOCK_ROWS:
+            self._flush_guids()
+
+    def _flush_guids(self):
+        if not self._guid_pending:
+            return
+        starts = array('I')
+        pos = 0
+        for guid in self._guid_pending:
+            starts.append(pos)
+            pos += len(guid) + 1
+        text = "\n".join(self._guid_pending) + "\n"
+        self._guid_blocks.append((self._guid_pending_start, text, starts))
+        self._guid_pending = []
+
+    def rows_for_guid(self, guid):
+        return self.by_guid.get(guid, [])
+
+    def rows_for(self, field, value):
+        """보조 컬럼 값이 정확히 일치하는 레코드 번호 목록 (정렬됨)"""
+        code = self.store.dict_columns[field].lookup.get(value)
+        if code is None or code >= len(self.by_code[field]):
+            return []
+        return list(self.by_code[field][code])
+
+    def rows_for_any_case(self, field, value):
+        """대소문자 무시 일치 (어휘만 비교하고 해당 코드들의 레코드 번호를 합침, 정렬됨)"""
+        value = value.lower()
+        rows = self.by_code[field]
+        matched = [rows[code] for code, text in enumerate(self.store.dict_columns[field].values[:len(rows)])
+                   if text.lower() == value]
+        if len(matched) == 1:
+            return list(matched[0])
+        return sorted(chain.from_iterable(matched))
+
+    def values(self, field):
+        """보조 컬럼의 고유값 목록"""
+        return list(self.store.dict_columns[field].values)
+
+    @staticmethod
+    def intersect(rec_nos, other):
+        """정렬된 두 레코드 번호 목록의 교집합 (정렬 유지)"""
+        if len(other) < len(rec_nos):
+            rec_nos, other = other, rec_nos
+        other = set(other)
+        return [rec_no for rec_no in rec_nos if rec_no in other]
+
+    # ---------------------------------------------------------
+    # 키워드 검색 (로컬 필터)
+    # ---------------------------------------------------------
+    def search(self, keyword):
+        """
+        공백으로 구분된 모든 단어를 포함하는 레코드 번호 목록 (대소문자 무시, 정렬됨)
+        각 단어는 GUID, IP, 서비스, 오퍼레이션, 앱, 노드 중 하나에만 포함되면 됩니다.
+        """
+        count = self.count
+        terms = keyword.lower().split()
+        if not terms:
+            return list(range(count))
+
+        self._flush_guids()
+        mask = -1
+        for term in terms:
+            mask &= self._match_term(term, count)
+            if not mask:
+                return []
+        if mask == -1:
+            return list(range(count))
+        return list(compress(range(count), mask.to_bytes(count, 'big')))
+
+    def _match_term(self, term, count):
+        """단어가 포함된 행의 마스크 (행마다 0/1 한 바이트인 bytes를 큰 정수로 다룸, -1 = 전체)"""
+        mask = 0
+        # 보조 컬럼은 고유값(어휘)만 검사하고 코드 배열을 마스크로 변환
+        for field in self.FIELDS:
+            column = self.store.dict_columns[field]
+            codes = {code for code, value in enumerate(column.values) if term in value.lower()}
+            if not codes:
+                continue
+            if len(codes) == len(column.values):
+                return -1
+            mask |= int.from_bytes(bytes(map(codes.__contains__, column.codes[:count])), 'big')
+
+        # GUID는 블록 문자열에서 find로 검색하고 위치를 행 번호로 환산 (일치한 행은 나머지를 건너뜀)
+        guid_mask = bytearray(count)
+        for first, text, starts in self._guid_blocks:
+            pos = text.find(term)
+            while pos != -1:
+                i = bisect_right(starts, pos) - 1
+                guid_mask[first + i] = 1
+                next_pos = starts[i + 1] if i + 1 < len(starts) else len(text)
+                pos = text.find(term, next_pos)
+        return mask | int.from_bytes(guid_mask, 'big')
+
+    @classmethod
+    def keyword_predicate(cls, keyword):
+        """search()와 같은 조건의 행 판정 함수 (이후 추가되는 행에 적용, 빈 키워드면 None)"""
+        terms = keyword.lower().split()
+        if not terms:
+            return None
+        fields = ("guid",) + cls.FIELDS
+
+        def predicate(record):
+            values = [str(record.get(field) or "").lower() for field in fields]
+            return all(any(term in value for value in values) for term in terms)
+        return predicate
@@ -0,0 +1,190 @@
+import re
+import shlex
+from fnmatch import translate
+
+from core.log_index import LogIndex
+
+# 검색어 필드 별칭 -> 레코드 키
+FIELD_ALIASES = {
+    "svc": "service", "service": "service",
+    "op": "operation", "operation": "operation",
+    "app": "application", "application": "application",
+    "node": "node",
+    "ip": "user_ip",
+    "guid": "guid",
+    "server": "server",
+}
+
+# 레코드 키 -> getServiceLogList 조회조건 필드 (서버에서 거를 수 있는 항목)
+SERVER_CONDITION_FIELDS = {
+    "guid": "guid",
+    "service": "svcNm",
+    "operation": "opNm",
+    "application": "bxmAppId",
+    "node": "nodeName",
+    "user_ip": "sendUserIp",
+}
+
+_ELAPSED_PATTERN = re.compile(r"^(?:elapsed|ms)(>=|<=|>|<|=|:)(\d+)$", re.IGNORECASE)
+_ERROR_VALUES = {"y": True, "yes": True, "true": True, "1": True, "fail": True,
+                 "n": False, "no": False, "false": False, "0": False, "ok": False}
+_COMPARE = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "=": lambda a, b: a == b,
+    ":": lambda a, b: a == b,
+}
+
+
+class LogQuery:
+    """
+    검색창 질의 해석
+    예) svc:PaymentSvc op:approve node:was02 ip:10.1.* err:Y elapsed>500 timeout
+
+    - conditions: 서버 조회조건으로 보낼 항목 (와일드카드 없는 필드:값)
+    - keyword: 필드 없이 입력한 단어 (LogIndex 키워드 검색)
+    - 그 외 조건(err, elapsed, 와일드카드, 서버 미지원 필드)은 compile()로 로컬 필터 생성
+    """
+
+    def __init__(self, text=""):
+        self.text = text or ""
+        self.conditions = {}
+        self.words = []
+        self._field_filters = []    # (레코드 키, 정규식 또는 문자열)
+        self._error = None
+        self._elapsed = []          # (비교 함수, 기준값)
+        self._parse()
+
+    def _parse(self):
+        try:
+            tokens = shlex.split(self.text)
+        except ValueError:
+            tokens = self.text.split()
+
+        for token in tokens:
+            match = _ELAPSED_PATTERN.match(token)
+            if match:
+                self._elapsed.append((_COMPARE[match.group(1)], int(match.group(2))))
+                continue
+
+            name, sep, value = token.partition(":")
+            name = name.lower()
+            if not sep or not value:
+                self.words.append(token)
+            elif name == "err" and value.lower() in _ERROR_VALUES:
+                self._error = _ERROR_VALUES[value.lower()]
+            elif name in FIELD_ALIASES:
+                self._add_field(FIELD_ALIASES[name], value)
+            else:
+                self.words.append(token)
+
+    def _add_field(self, key, value):
+        server_field = SERVER_CONDITION_FIELDS.get(key)
+        if "*" in value or "?" in value:
+            self._field_filters.append((key, re.compile(translate(value), re.IGNORECASE)))
+        elif server_field and server_field not in self.conditions:
+            self.conditions[server_field] = value
+        else:
+            self._field_filters.append((key, value))
+
+    @property
+    def keyword(self):
+        return " ".join(self.words)
+
+    def has_local_filter(self):
+        return bool(self._field_filters or self._elapsed or self._error is not None)
+
+    def describe_conditions(self):
+        """상태 표시용 서버 조회조건 문자열"""
+        return ", ".join(f"{field}={value}" for field, value in self.conditions.items())
+
+    def compile(self, store, pushed=None, index=None):
+        """
+        로컬 조건 -> (후보 레코드 번호 목록 | None, 레코드 번호 판정 함수 | None), 조건이 없으면 (None, None)
+        pushed: 현재 결과를 조회할 때 서버에 보낸 조회조건. 여기에 없는 서버 조건(아직 재조회 전)도 로컬에서 거릅니다.
+        index: LogIndex를 주면 와일드카드 없는 보조 컬럼 조건은 값별 레코드 번호 목록으로 후보를 좁힙니다.
+               (후보가 None이면 전체 행 대상, 판정 함수는 이후 도착하는 행에도 쓰이므로 모든 조건을 포함)
+        저장소 컬럼을 직접 읽으며, 사전 인코딩 컬럼은 코드별 판정 결과를 기억해 문자열 비교를 한 번만 합니다.
+        """
+        pushed = pushed or {}
+        pending = [(key, self.conditions[field]) for key, field in SERVER_CONDITION_FIELDS.items()
+                   if field in self.conditions and pushed.get(field) != self.conditions[field]]
+        if not pending and not self.has_local_filter():
+            return None, None
+
+        rows = None
+        if index is not None:
+            for key, value in pending + self._field_filters:
+                if isinstance(value, str) and key in index.CODE_FIELDS:
+                    matched = index.rows_for_any_case(key, value)
+                    rows = matched if rows is None else LogIndex.intersect(rows, matched)
+
+        checks = [self._field_check(store, key, value) for key, value in pending]
+        if self._error is not None:
+            error, expected = store.error, 1 if self._error else 0
+            checks.append(lambda rec_no: error[rec_no] == expected)
+
+        for compare, limit in self._elapsed:
+            elapsed = store.elapsed
+            checks.append(lambda rec_no, c=compare, v=limit: c(elapsed[rec_no], v))
+
+        for key, pattern in self._field_filters:
+            checks.append(self._field_check(store, key, pattern))
+
+        if len(checks) == 1:
+            return rows, checks[0]
+        return rows, lambda rec_no: all(check(rec_no) for check in checks)
+
+    def record_predicate(self):
+        """
+        dict 레코드(또는 LogRow)용 판정 함수 (저장소 없이 스트리밍으로 거를 때, 조건이 없으면 None)
+        서버 조건은 이미 조회조건으로 반영된 것으로 보고 일반 단어와 로컬 조건만 검사합니다.
+        """
+        checks = []
+        keyword_predicate = LogIndex.keyword_predicate(self.keyword)
+        if keyword_predicate is not None:
+            checks.append(keyword_predicate)
+        if self._error is not None:
+            checks.append(lambda record, e=self._error: bool(record.get('error')) == e)
+        for compare, limit in self._elapsed:
+            checks.append(lambda record, c=compare, v=limit: c(_to_int(record.get('elapsed')), v))
+        for key, pattern in self._field_filters:
+            checks.append(lambda record, k=key, m=_matcher(pattern): m(str(record.get(k) or "")))
+
+        if not checks:
+            return None
+        return lambda record: all(check(record) for check in checks)
+
+    @staticmethod
+    def _field_check(store, key, pattern):
+        matches = _matcher(pattern)
+        column = store.dict_columns.get(key)
+        if column is None:
+            return lambda rec_no: matches(str(store.value(rec_no, key) or ""))
+
+        memo = {}
+        codes, values = column.codes, column.values
+
+        def check(rec_no):
+            code = codes[rec_no]
+            hit = memo.get(code)
+            if hit is None:
+                hit = memo[code] = matches(values[code])
+            return hit
+        return check
+
+
+def _matcher(pattern):
+    """필드 조건 -> 문자열 판정 함수 (문자열은 대소문자 무시 일치, 정규식은 전체 일치)"""
+    if isinstance(pattern, str):
+        return lambda text, p=pattern.lower(): text.lower() == p
+    return lambda text, p=pattern: p.fullmatch(text) is not None
+
+
+def _to_int(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
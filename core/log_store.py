@@ -0,0 +1,500 @@
+import json
+import zlib
+from array import array
+from itertools import accumulate
+
+from utils.lazy_import import lazy_import
+from utils.lru_cache import LruCache
+from utils.time_utils import to_ts_key, ts_key_to_text, ts_has_ms
+
+# 선택 의존성: 빠른 JSON 직렬화 / 벡터 연산
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+np = lazy_import("numpy")  # 시작 시간 단축: 통계 계산 시 처음 로드
+NUMPY_AVAILABLE = np is not None
+
+
+def encode_raw(item):
+    """원본 항목을 압축된 JSON bytes로 보관 (dict 보관 대비 메모리 절감)"""
+    if isinstance(item, (bytes, bytearray)):
+        return bytes(item)
+    if ORJSON_AVAILABLE:
+        # orjson 결과 버퍼는 여유 공간을 포함하므로 정확한 크기로 복사하여 보관
+        return memoryview(orjson.dumps(item)).tobytes()
+    return json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class DictColumn:
+    """사전 인코딩 컬럼 (고유 문자열 목록 + 행별 코드)"""
+
+    def __init__(self):
+        self.values = []
+        self.lookup = {}
+        self.codes = array('I')
+
+    def append(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self.lookup[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, rec_no):
+        return self.values[self.codes[rec_no]]
+
+    def extend_codes(self, values, codes):
+        """다른 사전(values)의 코드 배열을 이 사전의 코드로 바꾸어 추가 (컬럼형 배치 적재용)"""
+        remap = []
+        for value in values:
+            code = self.lookup.get(value)
+            if code is None:
+                code = len(self.values)
+                self.lookup[value] = code
+                self.values.append(value)
+            remap.append(code)
+        if remap == list(range(len(remap))):
+            self.codes.extend(codes)
+        else:
+            self.codes.extend(array('I', map(remap.__getitem__, codes)))
+
+    def sort_ranks(self):
+        """코드 -> 정렬 순위 (문자열 비교 없이 정수로 정렬하기 위함)"""
+        ranks = [0] * len(self.values)
+        for rank, code in enumerate(sorted(range(len(self.values)), key=self.values.__getitem__)):
+            ranks[code] = rank
+        return ranks
+
+    def clear(self):
+        self.values.clear()
+        self.lookup.clear()
+        del self.codes[:]
+
+
+class RawBlockColumn:
+    """
+    원본 JSON bytes 컬럼 (BLOCK_ROWS 건씩 묶어 zlib 압축 보관)
+    행 단위 압축보다 압축률이 훨씬 높고, 상세 화면에서 한 행을 볼 때만 해당 블록을 해제합니다.
+    """
+    BLOCK_ROWS = 256
+
+    def __init__(self):
+        self.blocks = []
+        self.starts = array('I')   # 압축된 행의 블록 내 시작 위치
+        self.pending = []          # 아직 압축되지 않은 마지막 블록
+        self._cache = LruCache(4)
+
+    def __len__(self):
+        return len(self.blocks) * self.BLOCK_ROWS + len(self.pending)
+
+    def append(self, item):
+        self.pending.append(encode_raw(item))
+        if len(self.pending) >= self.BLOCK_ROWS:
+            self._flush()
+
+    def extend(self, datas):
+        """이미 인코딩된 원본 bytes 목록 추가 (컬럼형 배치 적재용)"""
+        pos = 0
+        while pos < len(datas):
+            room = self.BLOCK_ROWS - len(self.pending)
+            self.pending.extend(datas[pos:pos + room])
+            pos += room
+            if len(self.pending) >= self.BLOCK_ROWS:
+                self._flush()
+
+    def _flush(self):
+        pos = 0
+        for data in self.pending:
+            self.starts.append(pos)
+            pos += len(data)
+        self.blocks.append(zlib.compress(b''.join(self.pending), 1))
+        self.pending = []
+
+    def get(self, rec_no):
+        block_no, offset = divmod(rec_no, self.BLOCK_ROWS)
+        if block_no >= len(self.blocks):
+            return self.pending[offset]
+
+        blob = self._cache.get(block_no)
+        if blob is None:
+            blob = zlib.decompress(self.blocks[block_no])
+            self._cache.put(block_no, blob)
+        start = self.starts[rec_no]
+        end = self.starts[rec_no + 1] if offset + 1 < self.BLOCK_ROWS else len(blob)
+        return blob[start:end]
+
+    def clear(self):
+        self.blocks.clear()
+        del self.starts[:]
+        self.pending = []
+        self._cache.clear()
+
+
+class MappedRawColumn:
+    """
+    원본 파일(mmap) 안의 위치만 보관하는 원본 컬럼 (오프라인 덤프용)
+    항목 JSON을 복사/압축하지 않고, 상세 화면에서 볼 때 해당 구간만 읽습니다.
+    append()에는 (시작, 끝) 위치를 넘깁니다.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.spans = array('q')   # 시작, 끝, 시작, 끝, ...
+
+    def __len__(self):
+        return len(self.spans) // 2
+
+    def append(self, span):
+        self.spans.extend(span)
+
+    def get(self, rec_no):
+        return self.buffer[self.spans[rec_no * 2]:self.spans[rec_no * 2 + 1]]
+
+    def clear(self):
+        del self.spans[:]
+
+
+class LogRow:
+    """저장소(또는 ColumnBatch)의 한 행을 dict처럼 읽기 위한 뷰 (record['guid'], record.get('raw'))"""
+    __slots__ = ("store", "rec_no")
+
+    def __init__(self, store, rec_no):
+        self.store = store
+        self.rec_no = rec_no
+
+    def __getitem__(self, key):
+        return self.store.value(self.rec_no, key)
+
+    def get(self, key, default=None):
+        try:
+            return self.store.value(self.rec_no, key)
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {key: self.store.value(self.rec_no, key) for key in self.store.FIELDS}
+
+
+class LogStore:
+    """
+    조회 결과 컬럼형 저장소 (기존 list of dict 대체)
+    - 반복이 많은 컬럼(앱/서비스/오퍼레이션/노드/IP 등)은 사전 인코딩
+    - 일시/경과시간/에러 여부는 typed array (numpy 설치 시 벡터 연산에 그대로 사용)
+    - 원본 항목은 JSON bytes를 블록 압축하여 보관하고 상세 화면에서만 해석
+      (오프라인 덤프는 파일 내 위치만 보관)
+    """
+    DICT_FIELDS = ("user_ip", "application", "service", "operation", "node", "msg_type", "server")
+    FIELDS = ("timestamp", "guid", "error", "elapsed", "raw") + DICT_FIELDS
+
+    def __init__(self):
+        self.ts = array('q')          # yyyyMMddHHmmssSSS 정수 키
+        self.elapsed = array('q')     # opElapsedMills
+        self.error = bytearray()      # 1 = 에러
+        self.guid = []
+        self.raw = RawBlockColumn()
+        self.dict_columns = {field: DictColumn() for field in self.DICT_FIELDS}
+        self.ts_with_ms = True
+
+    def __len__(self):
+        return len(self.guid)
+
+    # ---------------------------------------------------------
+    # 적재
+    # ---------------------------------------------------------
+    def append_batch(self, batch):
+        """파싱된 dict 배치를 컬럼에 추가하고 첫 레코드 번호 반환"""
+        if isinstance(batch, ColumnBatch):
+            return self.append_columns(batch)
+        start_no = len(self.guid)
+        if start_no == 0 and batch:
+            # 원본에 밀리초가 없으면 표시에서도 생략
+            self.ts_with_ms = ts_has_ms(batch[0].get('timestamp'))
+
+        ts_append = self.ts.append
+        elapsed_append = self.elapsed.append
+        error_append = self.error.append
+        guid_append = self.guid.append
+        raw_append = self.raw.append
+        dict_appends = [(field, self.dict_columns[field].append) for field in self.DICT_FIELDS]
+
+        for record in batch:
+            ts_append(to_ts_key(record.get('timestamp')))
+            elapsed_append(self._to_int(record.get('elapsed', 0)))
+            error_append(1 if record.get('error') else 0)
+            guid_append(record.get('guid', ""))
+            raw_append(record.get('raw', {}))
+            for field, append in dict_appends:
+                append(record.get(field, ""))
+        return start_no
+
+    def append_columns(self, batch):
+        """컬럼형 배치를 행 단위 변환 없이 추가하고 첫 레코드 번호 반환"""
+        start_no = len(self.guid)
+        if start_no == 0 and len(batch):
+            self.ts_with_ms = batch.ts_with_ms
+        self.ts.extend(batch.ts)
+        self.elapsed.extend(batch.elapsed)
+        self.error += batch.error
+        self.guid.extend(batch.guid)
+        self.raw.extend(batch.raw)
+        for field, column in self.dict_columns.items():
+            column.extend_codes(*batch.dict_columns[field])
+        return start_no
+
+    @staticmethod
+    def _to_int(value):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+    def set_raw_column(self, column):
+        """원본 컬럼 교체 (온라인: RawBlockColumn / 오프라인 덤프: MappedRawColumn), 기존 데이터는 비움"""
+        self.clear()
+        self.raw = column
+
+    def clear(self):
+        del self.ts[:]
+        del self.elapsed[:]
+        self.error.clear()
+        self.guid.clear()
+        self.raw.clear()
+        for column in self.dict_columns.values():
+            column.clear()
+
+    # ---------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------
+    def value(self, rec_no, key):
+        """단일 셀 값 (dict 레코드와 동일한 키 사용)"""
+        if key == 'timestamp':
+            return ts_key_to_text(self.ts[rec_no], self.ts_with_ms)
+        if key == 'guid':
+            return self.guid[rec_no]
+        if key == 'error':
+            return self.error[rec_no] == 1
+        if key == 'elapsed':
+            return self.elapsed[rec_no]
+        if key == 'raw':
+            return self.raw.get(rec_no)
+        if key == 'ts_key':
+            return self.ts[rec_no]
+        column = self.dict_columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        return column.get(rec_no)
+
+    def row(self, rec_no):
+        return LogRow(self, rec_no)
+
+    def sort_key_getter(self, key):
+        """레코드 번호 -> 정렬 키 함수 (파이썬 비교 함수 없이 정수/문자열 키 사용)"""
+        if key in ('timestamp', 'ts_key'):
+            return self.ts.__getitem__
+        if key == 'elapsed':
+            return self.elapsed.__getitem__
+        if key == 'error':
+            return self.error.__getitem__
+        if key == 'guid':
+            return self.guid.__getitem__
+        column = self.dict_columns[key]
+        ranks = column.sort_ranks()
+        return [ranks[code] for code in column.codes].__getitem__
+
+    def sort_rows(self, rec_nos, key, reverse=False):
+        """레코드 번호 목록을 컬럼 기준으로 정렬"""
+        return sorted(rec_nos, key=self.sort_key_getter(key), reverse=reverse)
+
+    def to_column_batch(self):
+        """저장소 전체 -> ColumnBatch (결과 스냅샷 저장용, 원본 외 컬럼은 복사하지 않고 참조)"""
+        raw = [self.raw.get(rec_no) for rec_no in range(len(self))]
+        return ColumnBatch(self.ts, self.elapsed, self.error, self.guid, raw,
+                           {field: (column.values, column.codes) for field, column in self.dict_columns.items()},
+                           self.ts_with_ms)
+
+    def numpy_column(self, key):
+        """벡터 연산용 numpy 배열 복사본 (dict 컬럼은 코드 배열)"""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is not installed")
+        if key in ('timestamp', 'ts_key'):
+            return np.array(self.ts, dtype=np.int64)
+        if key == 'elapsed':
+            return np.array(self.elapsed, dtype=np.int64)
+        if key == 'error':
+            return np.frombuffer(bytes(self.error), dtype=np.uint8)
+        return np.array(self.dict_columns[key].codes, dtype=np.uint32)
+
+
+class ColumnBatch:
+    """
+    컬럼형 레코드 배치 (병렬 파싱 결과를 공유 메모리로 주고받기 위한 형태)
+    LogStore.append_batch에 넘기면 행 단위 변환 없이 컬럼을 그대로 이어 붙이고,
+    다른 소비자(색인/실시간 추적/내보내기 등)는 dict 레코드처럼 batch[i]['guid'] 형태로 읽습니다.
+    원본(raw)은 encode_raw 결과 bytes, 사전 컬럼은 (값 목록, 코드 배열) 입니다.
+    """
+    FIELDS = LogStore.FIELDS
+
+    def __init__(self, ts, elapsed, error, guid, raw, dict_columns, ts_with_ms=True):
+        self.ts = ts                      # array('q') yyyyMMddHHmmssSSS
+        self.elapsed = elapsed            # array('q')
+        self.error = error                # bytearray
+        self.guid = guid                  # list[str]
+        self.raw = raw                    # list[bytes]
+        self.dict_columns = dict_columns  # 필드 -> (값 목록, array('I') 코드)
+        self.ts_with_ms = ts_with_ms
+
+    @classmethod
+    def from_records(cls, records):
+        """파싱된 dict 레코드 목록 -> 컬럼형 배치 (LogStore.append_batch와 같은 변환)"""
+        columns = {field: DictColumn() for field in LogStore.DICT_FIELDS}
+        ts = array('q', [to_ts_key(record.get('timestamp')) for record in records])
+        elapsed = array('q', [LogStore._to_int(record.get('elapsed', 0)) for record in records])
+        error = bytearray(1 if record.get('error') else 0 for record in records)
+        guid = [record.get('guid', "") for record in records]
+        raw = [encode_raw(record.get('raw', {})) for record in records]
+        for field, column in columns.items():
+            append = column.append
+            for record in records:
+                append(record.get(field, ""))
+        ts_with_ms = ts_has_ms(records[0].get('timestamp')) if records else True
+        return cls(ts, elapsed, error, guid, raw,
+                   {field: (column.values, column.codes) for field, column in columns.items()}, ts_with_ms)
+
+    @classmethod
+    def concat(cls, batches):
+        """여러 배치를 하나로 (사전 컬럼은 값 목록을 합치고 코드를 다시 매김)"""
+        columns = {field: DictColumn() for field in LogStore.DICT_FIELDS}
+        ts, elapsed, error, guid, raw = array('q'), array('q'), bytearray(), [], []
+        for batch in batches:
+            ts.extend(batch.ts)
+            elapsed.extend(batch.elapsed)
+            error += batch.error
+            guid.extend(batch.guid)
+            raw.extend(batch.raw)
+            for field, column in columns.items():
+                column.extend_codes(*batch.dict_columns[field])
+        ts_with_ms = batches[0].ts_with_ms if batches else True
+        return cls(ts, elapsed, error, guid, raw,
+                   {field: (column.values, column.codes) for field, column in columns.items()}, ts_with_ms)
+
+    def __len__(self):
+        return len(self.guid)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return LogRow(self, index)
+
+    def __iter__(self):
+        return (LogRow(self, rec_no) for rec_no in range(len(self)))
+
+    def take(self, rec_nos):
+        """지정한 행만 지정한 순서로 (정렬/잘라내기용)"""
+        if isinstance(rec_nos, range) and rec_nos.step == 1:
+            part = slice(rec_nos.start, rec_nos.stop)
+            return ColumnBatch(self.ts[part], self.elapsed[part], self.error[part], self.guid[part],
+                               self.raw[part],
+                               {field: (values, codes[part]) for field, (values, codes) in self.dict_columns.items()},
+                               self.ts_with_ms)
+        rec_nos = list(rec_nos)
+        pick = lambda column: [column[i] for i in rec_nos]
+        return ColumnBatch(array('q', pick(self.ts)), array('q', pick(self.elapsed)), bytearray(pick(self.error)),
+                           pick(self.guid), pick(self.raw),
+                           {field: (values, array('I', pick(codes)))
+                            for field, (values, codes) in self.dict_columns.items()},
+                           self.ts_with_ms)
+
+    def set_field(self, field, value):
+        """사전 컬럼 전체를 한 값으로 (다중 서버 조회의 server 컬럼)"""
+        self.dict_columns[field] = ([value], array('I', bytes(4 * len(self))))
+
+    def value(self, rec_no, key):
+        """LogStore.value와 같은 키/값 형태"""
+        if key == 'timestamp':
+            return ts_key_to_text(self.ts[rec_no], self.ts_with_ms)
+        if key == 'guid':
+            return self.guid[rec_no]
+        if key == 'error':
+            return self.error[rec_no] == 1
+        if key == 'elapsed':
+            return self.elapsed[rec_no]
+        if key == 'raw':
+            return self.raw[rec_no]
+        if key == 'ts_key':
+            return self.ts[rec_no]
+        column = self.dict_columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        values, codes = column
+        return values[codes[rec_no]]
+
+    def cache_items(self):
+        """로컬 캐시 저장용 (일시 키, 원본 bytes) 목록"""
+        return list(zip(self.ts, self.raw))
+
+    # ---------------------------------------------------------
+    # 공유 메모리 전달 (typed array / 연속 bytes만 복사, 문자열 사전은 메타 정보로 전달)
+    # ---------------------------------------------------------
+    def _parts(self):
+        guid_text = "".join(self.guid)
+        return ([self.ts, self.elapsed, self.error,
+                 array('q', accumulate(map(len, self.guid))),
+                 array('q', accumulate(map(len, self.raw)))]
+                + [self.dict_columns[field][1] for field in LogStore.DICT_FIELDS]
+                + [guid_text.encode('utf-8'), b''.join(self.raw)])
+
+    def _meta(self, sizes):
+        return {"sizes": sizes, "ts_with_ms": self.ts_with_ms,
+                "values": [self.dict_columns[field][0] for field in LogStore.DICT_FIELDS]}
+
+    def pack_parts(self):
+        """-> (메타 정보, 컬럼별 memoryview 목록) - 전체 크기를 먼저 알고 기록할 곳을 만들 때"""
+        parts = [memoryview(part).cast('B') for part in self._parts()]
+        return self._meta([part.nbytes for part in parts]), parts
+
+    @staticmethod
+    def write_parts(parts, buffer):
+        """pack_parts의 컬럼들을 buffer(memoryview)에 연속 기록"""
+        pos = 0
+        for part in parts:
+            buffer[pos:pos + part.nbytes] = part
+            pos += part.nbytes
+
+    def pack(self):
+        """컬럼을 하나의 bytes로 -> (메타 정보, bytes) (unpack_from으로 복원)"""
+        meta, parts = self.pack_parts()
+        return meta, b''.join(parts)
+
+    @classmethod
+    def unpack_from(cls, meta, buffer):
+        """pack/write_parts로 기록한 buffer에서 배치 복원 (buffer 내용은 복사하므로 바로 해제 가능)"""
+        parts = []
+        pos = 0
+        for size in meta["sizes"]:
+            parts.append(bytes(buffer[pos:pos + size]))
+            pos += size
+        ts, elapsed, error, guid_ends, raw_ends = parts[:5]
+        code_parts = parts[5:-2]
+        guid_text, raw_blob = parts[-2].decode('utf-8'), parts[-1]
+
+        def typed(typecode, data):
+            column = array(typecode)
+            column.frombytes(data)
+            return column
+
+        guid_ends = typed('q', guid_ends)
+        raw_ends = typed('q', raw_ends)
+        guid = [guid_text[start:end] for start, end in zip([0, *guid_ends], guid_ends)]
+        raw = [raw_blob[start:end] for start, end in zip([0, *raw_ends], raw_ends)]
+        dict_columns = {field: (values, typed('I', codes))
+                        for field, values, codes in zip(LogStore.DICT_FIELDS, meta["values"], code_parts)}
+        return cls(typed('q', ts), typed('q', elapsed), bytearray(error), guid, raw, dict_columns,
+                   meta["ts_with_ms"])
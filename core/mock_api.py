@@ -36,3 +36,38 @@ class MockApiService:
             
         data.sort(key=lambda x: x['timestamp'], reverse=True)
         return data
+
+
+    @staticmethod
+    def get_raw_log_items(count, start_dt, end_dt, error_ratio=0.25, seed=None):
+        """
+        getServiceLogList 응답 형식(serviceLogList 항목)의 가상 데이터 생성
+        start_dt ~ end_dt(datetime) 구간에 균등 분포, opOccurDttm 오름차순
+        """
+        rnd = random.Random(seed)
+        apps = ["bxmOnline", "bxmBatch", "bxmGateway"]
+        services = ["PaymentSvc", "AuthSvc", "AccountSvc", "LoanSvc", "CardSvc", "NotifySvc"]
+        operations = ["approve", "cancel", "inquiry", "login", "register", "transfer", "healthCheck"]
+        nodes = ["was01", "was02", "was03", "was04"]
+        msg_types = ["REQ", "RES"]
+
+        span_ms = max(int((end_dt - start_dt).total_seconds() * 1000), 1)
+        step = span_ms / max(count, 1)
+
+        items = []
+        for i in range(count):
+            occur = start_dt + datetime.timedelta(milliseconds=int(i * step))
+            is_error = rnd.random() < error_ratio
+            items.append({
+                "opOccurDttm": occur.strftime("%Y-%m-%d %H:%M:%S.") + f"{occur.microsecond // 1000:03d}",
+                "guid": uuid.UUID(int=rnd.getrandbits(128), version=4).hex,
+                "sendUserIp": f"10.{rnd.randint(1, 3)}.{rnd.randint(0, 15)}.{rnd.randint(1, 254)}",
+                "opErrYn": "Y" if is_error else "N",
+                "bxmAppId": rnd.choice(apps),
+                "svcNm": rnd.choice(services),
+                "opNm": rnd.choice(operations),
+                "nodeName": rnd.choice(nodes),
+                "opElapsedMills": int(rnd.lognormvariate(4.5, 0.9)),
+                "msgType": rnd.choice(msg_types)
+            })
+        return items
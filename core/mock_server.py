@@ -0,0 +1,200 @@
+import argparse
+import bisect
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from config.settings import (DETAIL_OPERATION, DETAIL_RESULT_OMM, DETAIL_INPUT_FIELD, DETAIL_OUTPUT_FIELD,
+                             SESSION_EXPIRED_RETURN_CODES)
+from core.mock_api import MockApiService
+
+# 조회조건 필드 -> 원본 항목 필드 (값이 있으면 일치하는 항목만 반환)
+_FILTER_FIELDS = {
+    "guid": "guid",
+    "svcNm": "svcNm",
+    "opNm": "opNm",
+    "bxmAppId": "bxmAppId",
+    "nodeName": "nodeName",
+    "sendUserIp": "sendUserIp",
+}
+
+
+class _BxmHandler(BaseHTTPRequestHandler):
+    """BXM Admin JSON API 흉내 (login / OnlineLogService.getServiceLogList / 거래 상세 조회)"""
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server.mock
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._send(400, {"header": {"returnCode": "9", "returnMessage": "Invalid JSON"}})
+
+        server.simulate_latency()
+        if server.should_fail():
+            return self._send(500, {"header": {"returnCode": "9", "returnMessage": "Injected error"}})
+
+        path = self.path.rstrip("/")
+        if path.endswith("/bxmAdmin/json/login"):
+            return self._login(body)
+        if path.endswith("/bxmAdmin/json"):
+            if server.session_id not in (self.headers.get("Cookie") or ""):
+                return self._send(200, {"header": {"returnCode": SESSION_EXPIRED_RETURN_CODES[0],
+                                                   "returnMessage": "Session expired"}})
+            operation = body.get("header", {}).get("operation")
+            if operation == "getServiceLogList":
+                return self._send(200, server.service_log_list(body.get("OnlineLogSearchConditionOMM", {})))
+            if operation == DETAIL_OPERATION:
+                return self._send(200, server.service_log_detail(body.get("OnlineLogSearchConditionOMM", {})))
+            return self._send(200, {"header": {"returnCode": "9", "returnMessage": f"Unknown operation: {operation}"}})
+        return self._send(404, {"header": {"returnCode": "9", "returnMessage": "Not Found"}})
+
+    def _login(self, body):
+        login = body.get("LoginOMM", {})
+        if not login.get("userId") or not login.get("userPwd"):
+            return self._send(200, {"header": {"returnCode": "9", "returnMessage": "Invalid user"}})
+        cookie = f"JSESSIONID={self.server.mock.session_id}; Path=/"
+        return self._send(200, {"header": {"returnCode": "0"}, "ResponseCode": {"code": 100}},
+                          extra_headers={"Set-Cookie": cookie})
+
+    def _send(self, status, payload, extra_headers=None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MockBxmServer:
+    """
+    로컬 BXM Admin 대역 서버 (성능 측정/오프라인 개발용)
+    MockApiService로 생성한 데이터를 getServiceLogList 형식으로 페이징하여 응답하고 (GUID별 상세 전문 포함),
+    지연(latency), 지연 편차(jitter), 오류 주입(error_rate)을 설정할 수 있습니다.
+    """
+
+    def __init__(self, row_count=1000, start_dt=None, end_dt=None, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, host="127.0.0.1", port=0, seed=42):
+        self.end_dt = end_dt or datetime.now().replace(microsecond=0)
+        self.start_dt = start_dt or (self.end_dt - timedelta(days=1))
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.session_id = uuid.uuid4().hex
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+        self.items = MockApiService.get_raw_log_items(row_count, self.start_dt, self.end_dt, seed=seed)
+        self._keys = [item["opOccurDttm"][:19] for item in self.items]
+        self._guid_map = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _BxmHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ---------------------------------------------------------
+    # 요청 처리 (핸들러 스레드에서 호출)
+    # ---------------------------------------------------------
+    def simulate_latency(self):
+        if not self.latency_ms and not self.jitter_ms:
+            return
+        with self._random_lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(self.latency_ms + jitter, 0) / 1000)
+
+    def should_fail(self):
+        if not self.error_rate:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.error_rate
+
+    def service_log_list(self, cond):
+        """조회기간(초 단위 포함 비교) + 필터 + 페이징"""
+        lo = bisect.bisect_left(self._keys, cond.get("opOccurDttmStart", "")[:19])
+        hi = bisect.bisect_right(self._keys, cond.get("opOccurDttmEnd", "9999")[:19])
+        rows = self.items[lo:hi]
+
+        filters = [(field, cond[key]) for key, field in _FILTER_FIELDS.items() if cond.get(key)]
+        if filters:
+            rows = [item for item in rows if all(item.get(field) == value for field, value in filters)]
+
+        page_count = int(cond.get("pageCount") or 100)
+        page_num = int(cond.get("pageNum") or 1)
+        page = rows[(page_num - 1) * page_count: page_num * page_count]
+        return {
+            "header": {"returnCode": "0"},
+            "ServiceLogListOMM": {"totalCount": len(rows), "serviceLogList": page}
+        }
+
+
+    def service_log_detail(self, cond):
+        """GUID 기준 가상 입/출력 전문"""
+        guid = cond.get("guid", "")
+        item = self._by_guid().get(guid)
+        if item is None:
+            return {"header": {"returnCode": "9", "returnMessage": f"GUID not found: {guid}"}}
+        failed = item["opErrYn"] == "Y"
+        detail = {
+            DETAIL_INPUT_FIELD: json.dumps({"header": {"guid": guid, "svcNm": item["svcNm"], "opNm": item["opNm"]},
+                                            "body": {"userIp": item["sendUserIp"], "payload": guid[:16]}}),
+            DETAIL_OUTPUT_FIELD: json.dumps({"header": {"guid": guid, "returnCode": "9" if failed else "0"},
+                                             "body": {"message": "Internal error" if failed else "OK",
+                                                      "elapsed": item["opElapsedMills"]}}),
+        }
+        return {"header": {"returnCode": "0"}, DETAIL_RESULT_OMM: detail}
+
+    def _by_guid(self):
+        if self._guid_map is None:
+            self._guid_map = {item["guid"]: item for item in self.items}
+        return self._guid_map
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local BXM Admin stand-in server")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--port", type=int, default=8091)
+    parser.add_argument("--latency", type=float, default=0, help="ms per request")
+    parser.add_argument("--jitter", type=float, default=0, help="+/- ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="0.0 ~ 1.0")
+    args = parser.parse_args()
+
+    mock = MockBxmServer(row_count=args.rows, port=args.port, latency_ms=args.latency,
+                         jitter_ms=args.jitter, error_rate=args.error_rate)
+    print(f"Mock BXM Admin listening on {mock.base_url} "
+          f"({args.rows:,} rows, {mock.start_dt} ~ {mock.end_dt})")
+    mock.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        mock.stop()
@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+
+from config.settings import PARSE_PROCESSES, PARSE_POOL_MIN_BYTES
+from core.log_store import ColumnBatch
+
+# 선택 의존성: 빠른 JSON 파싱
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# 작업 프로세스: 직전 결과의 공유 메모리 handle
+# (Windows는 모든 handle이 닫히면 공유 메모리가 사라지므로 호출 측이 열 때까지 유지, 다음 작업에서 닫음)
+_handoff = []
+
+
+def parse_body(body):
+    """getServiceLogList 응답 본문 -> (ColumnBatch, None) | (None, header) (serviceLogList가 없는 응답)"""
+    from core.api_service import ApiService  # 순환 참조 방지
+
+    res_json = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+    omm = res_json.get("ServiceLogListOMM")
+    if not isinstance(omm, dict) or "serviceLogList" not in omm:
+        return None, res_json.get("header") or {}
+    return ColumnBatch.from_records(ApiService._parse_logs(omm["serviceLogList"] or [])), None
+
+
+def parse_page(body):
+    """
+    작업 프로세스: 응답 본문 파싱 후 컬럼형 배치를 실제 컬럼 크기만큼의 공유 메모리에 기록
+    반환: {"meta": ..., "shm": 공유 메모리 이름} (호출 측이 열어 복사한 뒤 unlink) | {"header": ...} (목록 없음)
+    """
+    from multiprocessing import shared_memory
+
+    while _handoff:
+        _handoff.pop().close()
+
+    batch, header = parse_body(body)
+    if batch is None:
+        return {"header": header}
+    meta, parts = batch.pack_parts()
+    shm = shared_memory.SharedMemory(create=True, size=max(sum(part.nbytes for part in parts), 1))
+    ColumnBatch.write_parts(parts, shm.buf)
+    _handoff.append(shm)
+    return {"meta": meta, "shm": shm.name}
+
+
+class ParsePool:
+    """
+    큰 응답 페이지의 JSON 파싱/컬럼 변환을 별도 프로세스에서 수행
+    조회 스레드가 GIL을 오래 잡아 UI가 멈추지 않도록, 응답 본문(bytes)만 작업 프로세스에 넘기고
+    결과는 작업 프로세스가 패킹한 컬럼 크기만큼 만든 공유 메모리로 받습니다. (dict 목록 pickle 없음)
+    호출 측이 열어 복사한 뒤 unlink 하고, 작업 프로세스는 다음 작업 때 자신의 handle을 닫습니다.
+    """
+    _executor = None
+    _disabled = False
+    _lock = threading.Lock()
+
+    @staticmethod
+    def processes():
+        """사용할 작업 프로세스 수 (단일 코어이거나 설정이 0이면 0)"""
+        return max(min(PARSE_PROCESSES, (os.cpu_count() or 1) - 1), 0)
+
+    @classmethod
+    def accepts(cls, size):
+        """이 크기의 응답을 프로세스에서 파싱할지 여부"""
+        return not cls._disabled and size >= PARSE_POOL_MIN_BYTES and cls.processes() > 0
+
+    @classmethod
+    def _get_executor(cls):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with cls._lock:
+            if cls._executor is None:
+                # Qt 스레드가 실행 중인 프로세스를 fork 하지 않도록 spawn 사용 (Windows와 동일)
+                cls._executor = ProcessPoolExecutor(max_workers=cls.processes(),
+                                                    mp_context=multiprocessing.get_context("spawn"))
+            return cls._executor
+
+    @classmethod
+    def parse(cls, body):
+        """
+        응답 본문 파싱 -> parse_body와 동일
+        작업 프로세스를 시작할 수 없으면 이후에는 사용하지 않도록 끄고 현재 스레드에서 파싱합니다.
+        """
+        # 프로세스 풀 관련 모듈은 큰 페이지를 처음 받을 때 로드 (프로그램 시작 시간 단축)
+        from concurrent.futures.process import BrokenProcessPool
+        from multiprocessing import shared_memory
+
+        try:
+            result = cls._get_executor().submit(parse_page, body).result()
+        except BrokenProcessPool as e:
+            print(f"Parse pool disabled: {e}")
+            cls._disabled = True
+            cls.shutdown()
+            return parse_body(body)
+        if "header" in result:
+            return None, result["header"]
+
+        shm = shared_memory.SharedMemory(name=result["shm"])
+        try:
+            return ColumnBatch.unpack_from(result["meta"], shm.buf), None
+        finally:
+            shm.close()
+            shm.unlink()
+
+    @classmethod
+    def shutdown(cls):
+        """작업 프로세스 종료 (프로그램 종료 시)"""
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
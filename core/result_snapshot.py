@@ -0,0 +1,64 @@
+import json
+import os
+import zlib
+
+from config.settings import CACHE_DIR, SNAPSHOT_FILE, SNAPSHOT_MAX_ROWS
+from core.log_store import ColumnBatch
+
+_MAGIC = b"SYSMON-SNAPSHOT 1\n"
+
+
+class ResultSnapshot:
+    """
+    마지막 조회 결과 스냅샷 (종료 시 저장, 시작 시 복원하여 네트워크 호출 전에 바로 사용)
+    파일 구성: 식별 줄 + JSON 한 줄(조회 조건, 컬럼 메타 정보) + zlib 압축한 컬럼 bytes (ColumnBatch.pack)
+    """
+
+    def __init__(self, path=None, max_rows=SNAPSHOT_MAX_ROWS):
+        self.path = path or os.path.join(CACHE_DIR, SNAPSHOT_FILE)
+        self.max_rows = max_rows
+
+    def save(self, store, state):
+        """
+        저장소 전체와 화면 상태(state: JSON 직렬화 가능한 dict) 저장 -> 저장 여부
+        결과가 없거나 max_rows를 넘으면 이전 스냅샷을 지우고 저장하지 않습니다.
+        """
+        if not len(store) or len(store) > self.max_rows:
+            self.clear()
+            return False
+        meta, data = store.to_column_batch().pack()
+        header = json.dumps({"state": state, "batch": meta}, ensure_ascii=False).encode('utf-8')
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_MAGIC)
+                f.write(header + b"\n")
+                f.write(zlib.compress(data, 1))
+            os.replace(tmp_path, self.path)  # 저장 중 종료되어도 이전 스냅샷은 유지
+            return True
+        except OSError as e:
+            print(f"Failed to save snapshot: {e}")
+            return False
+
+    def load(self):
+        """(state, ColumnBatch) | None (없거나 읽을 수 없는 파일)"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                if f.readline() != _MAGIC:
+                    return None
+                header = json.loads(f.readline())
+                data = zlib.decompress(f.read())
+            return header["state"], ColumnBatch.unpack_from(header["batch"], data)
+        except (OSError, ValueError, KeyError, zlib.error) as e:
+            print(f"Failed to load snapshot: {e}")
+            return None
+
+    def clear(self):
+        if os.path.exists(self.path):
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -1,14 +1,33 @@
+from utils.startup_timer import StartupTimer  # 시작 시간 측정 기준점 (가장 먼저 import)
+
 import sys
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QCoreApplication, QTimer, Qt
 from ui.main_window import MainWindow
 
 if __name__ == '__main__':
+    # 병렬 파싱 작업 프로세스 (PyInstaller로 빌드한 실행 파일에서 필요)
+    multiprocessing.freeze_support()
+    StartupTimer.mark("imports")
+
+    # WebEngine(웹 로그인)을 나중에 로드해도 되도록 QApplication 생성 전에 설정
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
-    
+
     # 윈도우 스타일 퓨전으로 설정 (기본보다 깔끔함)
     app.setStyle("Fusion")
-    
+    StartupTimer.mark("QApplication")
+
     window = MainWindow()
     window.show()
-    
+    StartupTimer.mark("show")
+
+    # 이벤트 루프가 첫 화면을 그린 뒤 단계별 시간 출력
+    def on_first_paint():
+        StartupTimer.mark("first paint")
+        window.show_startup_report(StartupTimer.report())
+
+    QTimer.singleShot(0, on_first_paint)
+
     sys.exit(app.exec())
@@ -0,0 +1,230 @@
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QPushButton, QHeaderView, QLabel, QComboBox, QSpinBox, QFileDialog,
+                             QMessageBox)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from config.settings import SCAN_CONCURRENCY, SCAN_REPEATS
+from core.api_scanner import (ApiScanner, LATENCY_KEYS, save_baseline, load_baseline, compare,
+                              result_key)
+from utils.config_manager import ConfigManager
+from utils.styles import AppStyle
+
+COLUMNS = ["Server", "API", "OK", "Errors", "Min", "p50", "p95", "Max", "vs Baseline"]
+BASELINE_COLUMN = len(COLUMNS) - 1
+ALL_SERVERS = "All Servers"
+
+
+class ApiScanWorker(QThread):
+    status_signal = pyqtSignal(str, str)      # 서버, 메시지
+    progress_signal = pyqtSignal(int, int)    # 완료 요청 수, 전체 요청 수
+    result_signal = pyqtSignal(dict)
+    finished_signal = pyqtSignal()
+
+    def __init__(self, scanner, servers, sessions):
+        super().__init__()
+        self.scanner = scanner
+        self.servers = servers
+        self.sessions = sessions
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        events = self.scanner.iter_events(self.servers, self.sessions)
+        try:
+            for kind, first, second in events:
+                if self.cancelled:
+                    break
+                if kind == "status":
+                    self.status_signal.emit(first, second)
+                elif kind == "progress":
+                    self.progress_signal.emit(first, second)
+                else:
+                    self.result_signal.emit(second)
+        finally:
+            events.close()  # 대기 중인 요청은 보내지 않음
+        self.finished_signal.emit()
+
+
+class ApiScanDialog(QDialog):
+    """
+    API 상태 점검 (Tools > API Health Scan)
+    등록된 서버의 점검 대상 API를 동시에 N회씩 호출하여 지연 시간/오류 유형을 표시하고,
+    결과를 baseline으로 저장했다가 이후 점검 결과와 비교합니다.
+    """
+
+    def __init__(self, api_service, sessions=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("API Health Scan")
+        self.resize(1000, 500)
+        self.api_service = api_service
+        self.sessions = sessions or {}
+        self.results = []
+        self.baseline = None
+        self.worker = None
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        # 1. 점검 조건 (대상 서버, 반복 횟수, 동시 요청 수)
+        form_layout = QHBoxLayout()
+        self.cmb_server = QComboBox()
+        self.cmb_server.addItem(ALL_SERVERS)
+        for server in self.servers():
+            self.cmb_server.addItem(server.get('name', server.get('url', '')))
+
+        self.spin_repeats = QSpinBox()
+        self.spin_repeats.setRange(1, 100)
+        self.spin_repeats.setValue(SCAN_REPEATS)
+        self.spin_concurrency = QSpinBox()
+        self.spin_concurrency.setRange(1, 32)
+        self.spin_concurrency.setValue(SCAN_CONCURRENCY)
+
+        self.btn_start = QPushButton("Start")
+        self.btn_start.setFixedWidth(80)
+        self.btn_start.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_start.clicked.connect(self.toggle_scan)
+
+        form_layout.addWidget(QLabel("Server"))
+        form_layout.addWidget(self.cmb_server)
+        form_layout.addWidget(QLabel("Repeats"))
+        form_layout.addWidget(self.spin_repeats)
+        form_layout.addWidget(QLabel("Concurrency"))
+        form_layout.addWidget(self.spin_concurrency)
+        form_layout.addStretch()
+        form_layout.addWidget(self.btn_start)
+        layout.addLayout(form_layout)
+
+        # 2. 결과 테이블 (지연 시간 ms)
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(BASELINE_COLUMN, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        layout.addWidget(self.table)
+
+        # 3. 진행 상태 / baseline
+        bottom_layout = QHBoxLayout()
+        self.lbl_status = QLabel("")
+        self.btn_save_baseline = QPushButton("Save Baseline...")
+        self.btn_save_baseline.clicked.connect(self.export_baseline)
+        self.btn_compare = QPushButton("Compare Baseline...")
+        self.btn_compare.clicked.connect(self.open_baseline)
+        bottom_layout.addWidget(self.lbl_status)
+        bottom_layout.addStretch()
+        bottom_layout.addWidget(self.btn_save_baseline)
+        bottom_layout.addWidget(self.btn_compare)
+        layout.addLayout(bottom_layout)
+
+    def servers(self):
+        """점검 대상 서버 (등록된 서버 + 등록되지 않은 현재 로그인 서버)"""
+        servers = ConfigManager.load_urls()
+        known = {item.get('url', '') for item in servers}
+        for url in self.sessions:
+            if url not in known:
+                servers.append({"name": "Current Session", "url": url})
+        return servers
+
+    def toggle_scan(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.btn_start.setEnabled(False)
+            self.lbl_status.setText("Stopping...")
+            return
+
+        servers = self.servers()
+        if self.cmb_server.currentText() != ALL_SERVERS:
+            servers = [item for item in servers
+                       if item.get('name', item.get('url', '')) == self.cmb_server.currentText()]
+        if not servers:
+            QMessageBox.warning(self, "API Health Scan", "점검할 서버가 없습니다. (Tools > Options)")
+            return
+
+        self.results = []
+        self.table.setRowCount(0)
+        scanner = ApiScanner(self.api_service, self.spin_concurrency.value(), self.spin_repeats.value())
+        self.worker = ApiScanWorker(scanner, servers, self.sessions)
+        self.worker.status_signal.connect(lambda name, msg: self.lbl_status.setText(f"{name}: {msg}"))
+        self.worker.progress_signal.connect(lambda done, total: self.lbl_status.setText(f"{done:,} / {total:,}"))
+        self.worker.result_signal.connect(self.add_result)
+        self.worker.finished_signal.connect(self.on_scan_finished)
+        self.btn_start.setText("Stop")
+        self.worker.start()
+
+    def on_scan_finished(self):
+        cancelled = self.worker.cancelled
+        self.btn_start.setText("Start")
+        self.btn_start.setEnabled(True)
+        failed = sum(1 for result in self.results if result["ok"] < result["count"])
+        self.lbl_status.setText(f"{'Stopped' if cancelled else 'Done'} — {len(self.results)} APIs, {failed} with errors")
+
+    def add_result(self, result):
+        self.results.append(result)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+
+        errors = ", ".join(f"{category} {count}" for category, count in result["errors"].items())
+        cells = [result["server"], result["api"], f"{result['ok']}/{result['count']}", errors]
+        cells += ["-" if result[key] is None else f"{result[key]:,.1f}" for key in LATENCY_KEYS]
+        for col, text in enumerate(cells):
+            item = QTableWidgetItem(text)
+            if col >= 4:
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            self.table.setItem(row, col, item)
+        if errors:
+            error_item = self.table.item(row, 3)
+            error_item.setForeground(QColor(AppStyle.COLOR_ERROR))
+            error_item.setToolTip(f"{result['url']}\n{result['last_error']}")
+        self.table.item(row, 1).setToolTip(result["url"])
+        self.show_comparison(row)
+
+    def show_comparison(self, row):
+        if self.baseline is None:
+            self.table.setItem(row, BASELINE_COLUMN, QTableWidgetItem(""))
+            return
+        problems = compare(self.results[row], self.baseline.get(result_key(self.results[row])))
+        if problems is None:
+            item = QTableWidgetItem("(no baseline)")
+        elif problems:
+            item = QTableWidgetItem(" | ".join(problems))
+            item.setForeground(QColor(AppStyle.COLOR_ERROR))
+        else:
+            item = QTableWidgetItem("OK")
+            item.setForeground(QColor(AppStyle.COLOR_SUCCESS))
+        self.table.setItem(row, BASELINE_COLUMN, item)
+
+    def export_baseline(self):
+        if not self.results:
+            QMessageBox.information(self, "Save Baseline", "저장할 점검 결과가 없습니다.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Baseline", "api_baseline.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            save_baseline(self.results, path)
+        except OSError as e:
+            QMessageBox.critical(self, "Save Baseline", f"저장하지 못했습니다:\n{e}")
+
+    def open_baseline(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Compare Baseline", "", "JSON (*.json);;All Files (*)")
+        if not path:
+            return
+        try:
+            self.baseline = load_baseline(path)
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.critical(self, "Compare Baseline", f"baseline 파일을 읽을 수 없습니다:\n{e}")
+            return
+        for row in range(len(self.results)):
+            self.show_comparison(row)
+
+    def done(self, result):
+        # 닫을 때 점검 중이면 중단 (진행 중인 요청은 timeout 안에 끝남)
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        super().done(result)
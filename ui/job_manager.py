@@ -0,0 +1,155 @@
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from config.settings import JOB_MAX_THREADS
+
+
+class JobWorker(QThread):
+    """
+    취소 가능한 배치 조회 작업 (하위 클래스에서 iter_batches 구현)
+    취소되면 다음 배치를 받은 시점에 멈추고 generator를 닫습니다. (이미 보낸 HTTP 요청은 응답까지 대기)
+    조회 중 예외가 나면 error_signal로 알리고, 어느 경우든 finished_signal은 항상 보냅니다.
+    """
+    batch_signal = pyqtSignal(object)   # list[dict] | ColumnBatch (list로 선언하면 ColumnBatch가 LogRow 목록으로 변환됨)
+    status_signal = pyqtSignal(str, str)
+    finished_signal = pyqtSignal(int)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = False
+        self.failed = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def iter_batches(self):
+        raise NotImplementedError
+
+    def run(self):
+        total = 0
+        batches = None
+        try:
+            batches = self.iter_batches()
+            for batch in batches:
+                if self.cancelled:
+                    break
+                total += len(batch)
+                self.batch_signal.emit(batch)
+        except Exception as e:
+            self.failed = True
+            self.error_signal.emit(f"{total:,}건 받은 후 중단: {e}")
+        finally:
+            try:
+                if batches is not None:
+                    batches.close()  # 중간에 멈춘 조회는 캐시에 저장되지 않음
+            finally:
+                self.finished_signal.emit(total)  # 채널을 비우도록 항상 전송
+
+
+class JobManager(QObject):
+    """
+    채널별 백그라운드 조회 관리 ("search": 조회 결과, "tail": 실시간 추적)
+    - 채널마다 결과에 반영되는 작업은 하나: 새 작업을 제출하면 이전 작업은 취소하고 이후 신호는 무시
+    - 같은 키의 작업이 이미 진행 중이면 새로 시작하지 않음 (F5/Enter 연타 시 중복 요청 방지)
+    - 동시에 실행되는 스레드는 max_threads개 이하 (취소됐지만 응답을 기다리는 스레드 포함)
+      초과분은 채널별 마지막 작업만 대기열에 두었다가 스레드가 끝나면 시작
+    """
+    batch_ready = pyqtSignal(str, object)      # 채널, 배치 (list[dict] | ColumnBatch)
+    progress = pyqtSignal(str, int)            # 채널, 지금까지 받은 건수
+    status = pyqtSignal(str, str, str)         # 채널, 이름, 메시지 (다중 서버 조회 진행 상태)
+    finished = pyqtSignal(str, int, bool)      # 채널, 받은 건수, 중단 여부 (취소 또는 오류)
+    error = pyqtSignal(str, str)               # 채널, 오류 메시지 (finished 전에 발생)
+
+    def __init__(self, parent=None, max_threads=JOB_MAX_THREADS):
+        super().__init__(parent)
+        self.max_threads = max_threads
+        self._current = {}    # 채널 -> [키, 작업, 받은 건수]
+        self._running = []    # 실행 중인 스레드 (끝날 때까지 참조 유지)
+        self._queued = []     # 시작 대기 중인 (채널, 작업)
+
+    def submit(self, channel, key, worker):
+        """작업 제출 (같은 키가 진행 중이면 False 반환, 작업은 시작하지 않음)"""
+        if self.is_running(channel, key):
+            return False
+        self.cancel(channel, notify=False)
+
+        self._current[channel] = [key, worker, 0]
+        worker.batch_signal.connect(lambda batch: self._on_batch(channel, worker, batch))
+        worker.status_signal.connect(lambda name, message: self._on_status(channel, worker, name, message))
+        worker.finished_signal.connect(lambda total: self._on_finished(channel, worker, total))
+        worker.error_signal.connect(lambda message: self._on_error(channel, worker, message))
+        worker.finished.connect(lambda: self._on_thread_done(worker))
+
+        if len(self._running) < self.max_threads:
+            self._start(worker)
+        else:
+            self._queued.append((channel, worker))
+        return True
+
+    def cancel(self, channel, notify=True, wait=False):
+        """
+        채널의 현재 작업 취소 (지금까지 받은 결과는 그대로 둠)
+        notify: finished(채널, 건수, True) 신호 발생 / wait: 스레드가 끝날 때까지 대기
+        """
+        current = self._current.pop(channel, None)
+        if current is None:
+            return False
+        _, worker, rows = current
+        worker.cancel()
+        self._queued = [item for item in self._queued if item[1] is not worker]
+        if wait and worker.isRunning():
+            worker.wait()
+        if notify:
+            self.finished.emit(channel, rows, True)
+        return True
+
+    def cancel_all(self, wait_ms=0):
+        """모든 작업 취소 (종료 시: wait_ms 동안 실행 중인 스레드 종료 대기)"""
+        for channel in list(self._current):
+            self.cancel(channel, notify=False)
+        self._queued.clear()
+        for worker in list(self._running):
+            worker.wait(wait_ms)
+
+    def is_busy(self, channel):
+        return channel in self._current
+
+    def is_running(self, channel, key):
+        current = self._current.get(channel)
+        return current is not None and key is not None and current[0] == key
+
+    def _start(self, worker):
+        self._running.append(worker)
+        worker.start()
+
+    def _is_current(self, channel, worker):
+        current = self._current.get(channel)
+        return current is not None and current[1] is worker
+
+    def _on_batch(self, channel, worker, batch):
+        if not self._is_current(channel, worker):
+            return  # 취소된 작업이 취소 직전에 보낸 배치
+        current = self._current[channel]
+        current[2] += len(batch)
+        self.batch_ready.emit(channel, batch)
+        self.progress.emit(channel, current[2])
+
+    def _on_status(self, channel, worker, name, message):
+        if self._is_current(channel, worker):
+            self.status.emit(channel, name, message)
+
+    def _on_error(self, channel, worker, message):
+        if self._is_current(channel, worker):
+            self.error.emit(channel, message)
+
+    def _on_finished(self, channel, worker, total):
+        if self._is_current(channel, worker):
+            del self._current[channel]
+            self.finished.emit(channel, total, worker.cancelled or worker.failed)
+
+    def _on_thread_done(self, worker):
+        if worker in self._running:
+            self._running.remove(worker)
+        worker.deleteLater()
+        while self._queued and len(self._running) < self.max_threads:
+            self._start(self._queued.pop(0)[1])
@@ -1,13 +1,10 @@
+import importlib.util
+
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QLabel
 from PyQt6.QtCore import QUrl, Qt
 
-# 웹 엔진 확인
-try:
-    from PyQt6.QtWebEngineWidgets import QWebEngineView
-    from PyQt6.QtWebEngineCore import QWebEngineProfile
-    WEB_ENGINE_AVAILABLE = True
-except ImportError:
-    WEB_ENGINE_AVAILABLE = False
+# 웹 엔진 확인 (설치 여부만 확인, 로드는 창을 열 때 - Chromium 초기화로 시작이 느려지지 않도록)
+WEB_ENGINE_AVAILABLE = importlib.util.find_spec("PyQt6.QtWebEngineWidgets") is not None
 
 from config.settings import LOGIN_URL
 
@@ -35,6 +32,9 @@ class LoginDialog(QDialog):
             self.setLayout(layout)
             return
 
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtWebEngineCore import QWebEngineProfile
+
         self.webview = QWebEngineView()
         profile = QWebEngineProfile.defaultProfile()
         self.cookie_store = profile.cookieStore()
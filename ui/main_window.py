@@ -1,42 +1,141 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QSplitter, QTextEdit, QLabel, QFrame, QPushButton, 
-                             QTableWidget, QTableWidgetItem, QHeaderView, QLineEdit,
-                             QTabWidget, QDateEdit, QGridLayout, QMessageBox, QComboBox)
-from PyQt6.QtCore import Qt, QDate, QTime, QThread, pyqtSignal
-from PyQt6.QtGui import QColor, QTextDocument, QTextCursor, QTextCharFormat, QFont
+                             QLineEdit, QTabWidget, QDateEdit, QGridLayout, QMessageBox, QComboBox,
+                             QCheckBox, QToolButton, QMenu, QFileDialog, QProgressDialog)
+from PyQt6.QtCore import Qt, QDate, QTime, QThread, QTimer, pyqtSignal
+import os
+import sys
 from datetime import datetime
+from itertools import compress
 
-from config.settings import APP_TITLE, LOGIN_URL
+from config.settings import (APP_TITLE, LOGIN_URL, LOG_MAX_ROWS, DETAIL_RENDER_CACHE_SIZE,
+                             LIVE_TAIL_INTERVAL_SEC, KEYWORD_FILTER_DELAY_MS, EXPORT_BATCH_ROWS,
+                             OFFLINE_BATCH_ROWS, DETAIL_PREFETCH_ROWS, JOB_SHUTDOWN_WAIT_MS)
 from utils.styles import AppStyle
 from core.api_service import ApiService
+from core.http_session import SessionRegistry
+from core.log_index import LogIndex
+from core.log_histogram import MinuteHistogram, MINUTE_DIVISOR
+from core.log_store import LogStore, RawBlockColumn, MappedRawColumn
+from core.log_dump import LogDumpReader
+from core.log_cache import LogCache
+from core.live_tail import TailCursor
+from core.fanout import FanOutSearch
+from core.log_query import LogQuery
+from core.log_export import LogExporter, ZSTD_AVAILABLE
+from core.log_format import (render_raw_input, render_detail_log, render_message, RAW_OUTPUT_PLACEHOLDER,
+                             DETAIL_LOADING_TEXT, DETAIL_FAILED_TEXT)
+from core.detail_fetcher import DetailFetcher
+from core.parse_pool import ParsePool
+from core.result_snapshot import ResultSnapshot
 from ui.widgets.custom_widgets import Panel, CollapsiblePanel, LoadingOverlay
 from ui.widgets.menu_bar import AppMenuBar
-from ui.login_dialog import LoginDialog
+from ui.widgets.log_table import LogTableView, SERVER_COLUMN
+from ui.widgets.log_highlighter import LogHighlighter
+from ui.widgets.log_viewer import LogTextView
+from ui.widgets.analytics_panel import AnalyticsPanel
+from ui.widgets.histogram_strip import HistogramStrip
+from ui.job_manager import JobManager, JobWorker
 from ui.api_login_dialog import ApiLoginDialog
 from utils.config_manager import ConfigManager
+from utils.lru_cache import LruCache
+from utils.startup_timer import StartupTimer
 
-# 로그 조회용 워커
-class LogLoadWorker(QThread):
-    finished_signal = pyqtSignal(list)
-
-    def __init__(self, api_service, base_url, cookies, start_str, end_str, query):
+# 로그 조회용 워커 (페이지 단위로 배치 전송)
+class LogLoadWorker(JobWorker):
+    def __init__(self, api_service, log_cache, base_url, cookies, start_str, end_str, query, use_cache=True):
         super().__init__()
         self.api = api_service
+        self.log_cache = log_cache
         self.base_url = base_url
         self.cookies = cookies
         self.start_str = start_str
         self.end_str = end_str
         self.query = query
+        self.use_cache = use_cache
 
-    def run(self):
-        data = self.api.get_system_logs(
+    def iter_batches(self):
+        return self.log_cache.iter_logs(
+            self.api,
             self.base_url,
             self.cookies,
             self.start_str,
             self.end_str,
-            self.query
+            self.query,
+            bypass=not self.use_cache
+        )
+
+# 다중 서버 동시 조회 워커
+class FanOutWorker(JobWorker):
+    def __init__(self, fanout, servers, start_str, end_str, query, use_cache=True, sessions=None):
+        super().__init__()
+        self.fanout = fanout
+        self.servers = servers
+        self.start_str = start_str
+        self.end_str = end_str
+        self.query = query
+        self.use_cache = use_cache
+        self.sessions = sessions
+
+    def iter_batches(self):
+        events = self.fanout.iter_events(
+            self.servers,
+            self.start_str,
+            self.end_str,
+            self.query,
+            use_cache=self.use_cache,
+            sessions=self.sessions
         )
-        self.finished_signal.emit(data)
+        try:
+            for kind, name, payload in events:
+                if kind == "batch":
+                    yield payload
+                else:
+                    self.status_signal.emit(name, payload)
+        finally:
+            events.close()  # 취소 시 남은 서버 조회 중단
+
+# 로컬 로그 파일 읽기 워커 (오프라인 모드)
+class DumpLoadWorker(JobWorker):
+    def __init__(self, reader):
+        super().__init__()
+        self.reader = reader
+
+    def iter_batches(self):
+        return self.reader.iter_batches(OFFLINE_BATCH_ROWS)
+
+# 내보내기 워커 (배치를 받는 대로 파일에 기록)
+class ExportWorker(QThread):
+    progress_signal = pyqtSignal(int)
+    finished_signal = pyqtSignal(int, str)  # 기록 건수, 오류 메시지 (성공 시 빈 문자열)
+
+    def __init__(self, path, batches, from_store=False):
+        super().__init__()
+        self.path = path
+        self.batches = batches        # 레코드 배치 iterator (작업 스레드에서 소비)
+        self.from_store = from_store  # 화면 결과 저장소를 읽는 중인지 (새 조회 시 중단 대상)
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        count = 0
+        try:
+            with LogExporter(self.path) as exporter:
+                for batch in self.batches:
+                    if self.cancelled:
+                        break
+                    exporter.write_batch(batch)
+                    count = exporter.count
+                    self.progress_signal.emit(count)
+        except Exception as e:
+            self.finished_signal.emit(count, str(e))
+            return
+        finally:
+            if hasattr(self.batches, 'close'):
+                self.batches.close()
+        self.finished_signal.emit(count, "Cancelled" if self.cancelled else "")
 
 # 로그인용 워커
 class LoginWorker(QThread):
@@ -55,6 +154,8 @@ class LoginWorker(QThread):
         self.finished_signal.emit(success, cookies, msg)
 
 class MainWindow(QMainWindow):
+    detail_fetched = pyqtSignal(object, object)  # 상세 조회 완료 (작업 스레드 -> UI): key, 상세|None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_TITLE)
@@ -64,13 +165,59 @@ class MainWindow(QMainWindow):
         self.cookies = {} 
         self.current_base_url = None
         self.api_service = ApiService()
+        self.log_store = LogStore()
+        self.log_index = LogIndex(self.log_store)
+        self.histogram = MinuteHistogram(self.log_store)
+        self.render_cache = LruCache(DETAIL_RENDER_CACHE_SIZE)
+        self.log_cache = LogCache()
+        self.fanout = FanOutSearch(self.api_service, self.log_cache)
+        self.fanout_status = {}
+        self.loaded_signature = None  # 마지막으로 서버에서 받은 조회 조건 (기간/대상 서버/서버 조회조건)
+        self.server_conditions = {}   # 현재 결과 조회 시 서버에 보낸 조회조건
+        self.dump_reader = None       # 오프라인 모드에서 연 로컬 로그 파일
+        self.server_urls = {}         # 다중 서버 조회 시 서버 이름 -> URL (상세 조회 대상)
+        self.snapshot = ResultSnapshot()  # 종료 시 저장한 마지막 결과 (시작 시 복원)
+
+        # 거래 상세(입/출력 전문): 행 선택 시 조회 + LRU 캐시 + 주변 행 미리 조회
+        self.detail_fetcher = DetailFetcher(self.api_service)
+        self.detail_key = None        # 현재 화면에 표시할 상세의 키
+        self.detail_fetched.connect(self.on_detail_fetched)
+
+        # 검색어 중 서버 미지원 조건/일반 단어는 로드된 결과를 로컬에서 필터링 (입력이 멈추면 적용)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(KEYWORD_FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_search_filter)
+
+        # 백그라운드 조회: 새 조회가 이전 조회를 취소하고, 같은 조회 연타는 하나로 합침
+        self.log_worker = None        # 조회 결과에 반영 중인(또는 마지막) 작업
+        self.jobs = JobManager(self)
+        self.jobs.batch_ready.connect(self.on_job_batch)
+        self.jobs.progress.connect(self.on_job_progress)
+        self.jobs.status.connect(lambda channel, name, message: self.on_fanout_status(name, message))
+        self.jobs.finished.connect(self.on_job_finished)
+        self.jobs.error.connect(self.on_job_error)
+        self.load_error = None        # 현재 조회가 오류로 중단된 경우 메시지
+
+        # 실시간 추적(Live Tail)
+        self.tail_cursor = TailCursor()
+        self.export_worker = None
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(LIVE_TAIL_INTERVAL_SEC * 1000)
+        self.live_timer.timeout.connect(self.poll_live_tail)
         
         self.init_ui()
         
         # [중요] 오버레이를 메인윈도우의 자식으로 생성
         self.overlay = LoadingOverlay(self)
-        
-        self.load_data()
+        self.overlay.cancel_requested.connect(self.cancel_loading)
+        StartupTimer.mark("MainWindow")
+
+        # 마지막 세션/결과 복원 (네트워크 호출 없음) - 복원한 결과가 있으면 F5/Search 전까지 서버 조회 안 함
+        self.restore_session()
+        if not self.restore_snapshot():
+            self.load_data()
+        StartupTimer.mark("restore")
 
     def init_ui(self):
         self.setMenuBar(AppMenuBar(self))
@@ -89,20 +236,37 @@ class MainWindow(QMainWindow):
         self.setup_system_log_tab(self.tab_system)
         self.tabs.addTab(self.tab_system, "시스템로그")
 
+        # 조회 결과(화면 필터 기준) 경과시간/에러 통계
+        model = self.table.source_model
+        self.analytics_panel = AnalyticsPanel(
+            self.log_store, lambda: model.visible_record_numbers() if model.is_filtered() else None)
+        model.rowsInserted.connect(self.analytics_panel.invalidate)
+        model.modelReset.connect(self.analytics_panel.invalidate)
+        self.tabs.addTab(self.analytics_panel, "통계")
+
         self.tab_batch = QWidget()
         self.tabs.addTab(self.tab_batch, "배치로그")
         
         main_layout.addWidget(self.tabs)
 
+    def closeEvent(self, event):
+        partial = self.jobs.is_busy("search")
+        self.jobs.cancel_all(JOB_SHUTDOWN_WAIT_MS)
+        self.save_snapshot(partial)
+        self.detail_fetcher.shutdown()
+        ParsePool.shutdown()
+        SessionRegistry.close_all()
+        super().closeEvent(event)
+
     # [신규] 창 크기/위치 변경 시 오버레이 동기화
     def resizeEvent(self, event):
         if hasattr(self, 'overlay') and self.overlay.isVisible():
-            self.overlay.setGeometry(self.geometry())
+            self.overlay.follow_parent()
         super().resizeEvent(event)
 
     def moveEvent(self, event):
         if hasattr(self, 'overlay') and self.overlay.isVisible():
-            self.overlay.setGeometry(self.geometry())
+            self.overlay.follow_parent()
         super().moveEvent(event)
 
     def create_top_bar(self):
@@ -178,7 +342,6 @@ class MainWindow(QMainWindow):
     def process_login(self, url, uid, pw, domain, page_name):
         """로그인 요청 처리"""
         # [수정] 오버레이를 현재 메인윈도우 크기에 맞춰 띄움 (Reparent 하지 않음)
-        self.overlay.setGeometry(self.geometry())
         self.overlay.show_loading("Logging in...")
         
         # 워커 시작
@@ -192,8 +355,13 @@ class MainWindow(QMainWindow):
         self.overlay.hide_loading()
         
         if success:
+            self.close_log_file()
+            self.detail_fetcher.clear()  # 이전 세션으로 받은 상세는 사용하지 않음
+            self.fanout.forget(target_url)  # 동시 조회에서 보관한 이전 쿠키 대신 새 세션 사용
+            self.jobs.cancel("search", notify=False)  # 이전 세션으로 진행 중인 조회는 새 세션으로 다시 조회
             self.cookies = cookies
             self.current_base_url = target_url
+            ConfigManager.save_session(target_url, dict(cookies.items()), page_name)  # 다음 실행 시 복원
             
             self.lbl_user_info.setText(f"{page_name} | ✅ Online")
             self.lbl_user_info.setObjectName("user_online")
@@ -204,10 +372,112 @@ class MainWindow(QMainWindow):
             self.login_dlg.accept() # 로그인 성공 시에만 창 닫기
             self.load_data()
         else:
+            self.drop_session("Guest | ⚠️ Login Failed")
             QMessageBox.critical(self.login_dlg, "Login Failed", f"Failed to login:\n{msg}")
             self.login_dlg.set_controls_enabled(True) 
-            self.lbl_user_info.setText("Guest | ⚠️ Login Failed")
-            self.lbl_user_info.setObjectName("user_offline")
+
+    def open_api_scan(self):
+        """Tools > API Health Scan (현재 로그인 세션 재사용)"""
+        from ui.api_scan_dialog import ApiScanDialog  # requests를 쓰는 점검 모듈은 열 때 로드
+
+        sessions = {self.current_base_url: self.cookies} if self.cookies and self.current_base_url else {}
+        ApiScanDialog(self.api_service, sessions, self).exec()
+
+    def show_startup_report(self, summary):
+        """시작 단계별 시간 (main.py에서 첫 화면 표시 후 호출)"""
+        message = self.statusBar().currentMessage()
+        self.statusBar().showMessage(f"{message}  [{summary}]" if message else summary)
+
+    # -------------------------------------------------------------------------
+    # 마지막 세션/결과 복원 (시작 시) / 저장 (종료 시)
+    # -------------------------------------------------------------------------
+    def restore_session(self):
+        """저장된 로그인 세션(쿠키) 복원 - 만료 여부는 첫 조회 때 확인됨"""
+        session = ConfigManager.load_session()
+        if not session or not session.get("base_url"):
+            return False
+        self.cookies = session.get("cookies") or {}
+        self.current_base_url = session["base_url"]
+        self.lbl_user_info.setText(f"{session.get('page_name') or 'Unknown'} | ♻️ Restored")
+        self.lbl_user_info.setObjectName("user_online")
+        self.lbl_user_info.style().unpolish(self.lbl_user_info)
+        self.lbl_user_info.style().polish(self.lbl_user_info)
+        return True
+
+    def check_session_rejected(self):
+        """서버가 현재 세션을 거부했으면 (만료) 저장된 세션을 지우고 다시 로그인하도록 표시"""
+        if not self.current_base_url or not self.api_service.pop_session_rejected(self.current_base_url):
+            return
+        self.drop_session("Guest | ⚠️ Session Expired")
+
+    def drop_session(self, status):
+        """
+        현재 로그인 세션을 메모리와 저장 파일에서 모두 버림 (화면 표시와 실제 세션이 어긋나지 않도록)
+        실시간 추적은 중단되고, 다시 로그인할 때까지 서버 조회를 하지 않습니다.
+        """
+        ConfigManager.clear_session()
+        self.cookies = {}
+        self.current_base_url = None
+        self.jobs.cancel("tail", notify=False)
+        self.lbl_user_info.setText(status)
+        self.lbl_user_info.setObjectName("user_offline")
+        self.lbl_user_info.style().unpolish(self.lbl_user_info)
+        self.lbl_user_info.style().polish(self.lbl_user_info)
+
+    def restore_snapshot(self):
+        """마지막 결과와 조회 조건을 화면에 복원 (복원했으면 True)"""
+        loaded = self.snapshot.load()
+        if loaded is None:
+            return False
+        state, batch = loaded
+
+        self.date_start.setDate(QDate.fromString(state["date_start"], "yyyy-MM-dd"))
+        self.time_start.setCurrentText(state["time_start"])
+        self.date_end.setDate(QDate.fromString(state["date_end"], "yyyy-MM-dd"))
+        self.time_end.setCurrentText(state["time_end"])
+        self.search_input.setText(state.get("query", ""))
+        self.btn_fanout.setChecked(state.get("fanout", False))
+        self.fanout_unchecked = set(state.get("fanout_unchecked", []))
+        self.server_conditions = state.get("server_conditions") or {}
+        self.server_urls = state.get("server_urls") or {}
+        self.table.setColumnHidden(SERVER_COLUMN, not self.btn_fanout.isChecked())
+
+        self.table.setSortingEnabled(False)
+        self.on_batch_loaded(batch)
+        self.table.setSortingEnabled(True)
+        self.filter_timer.stop()
+        self.apply_search_filter()
+
+        # 끝까지 받은 결과이고 같은 서버면 Search/Enter는 로컬 필터만 (F5는 항상 서버 조회)
+        same_target = state.get("fanout") or state.get("base_url") == self.current_base_url
+        if state.get("complete") and same_target:
+            self.loaded_signature = self.search_signature()
+        self.statusBar().showMessage(
+            f"Restored {len(batch):,} rows from last session ({state.get('saved_at', '')}) — F5 to refresh")
+        return True
+
+    def save_snapshot(self, partial=False):
+        """현재 결과와 조회 조건 저장 (오프라인 모드는 원본 파일이 있으므로 저장하지 않음)"""
+        if self.dump_reader is not None:
+            self.snapshot.clear()
+            return
+        state = {
+            "date_start": self.date_start.date().toString("yyyy-MM-dd"),
+            "time_start": self.time_start.currentText(),
+            "date_end": self.date_end.date().toString("yyyy-MM-dd"),
+            "time_end": self.time_end.currentText(),
+            "query": self.search_input.text(),
+            "fanout": self.btn_fanout.isChecked(),
+            "fanout_unchecked": sorted(self.fanout_unchecked),
+            "base_url": self.current_base_url,
+            "server_conditions": self.server_conditions,
+            "server_urls": self.server_urls,
+            # 취소/진행 중이었거나 화면 조건이 받은 조건과 다르면 다음 Search에서 다시 조회
+            "complete": not partial and self.loaded_signature is not None
+                        and self.loaded_signature == self.search_signature(),
+            "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.snapshot.save(self.log_store, state)
 
     # -------------------------------------------------------------------------
     # 이하 기존 로직 (탭, 테이블, 필터링 등)
@@ -223,7 +493,19 @@ class MainWindow(QMainWindow):
         self.left_splitter = QSplitter(Qt.Orientation.Vertical)
         
         self.table = self.create_table()
-        self.left_splitter.addWidget(Panel("System Log List", self.table))
+
+        # 분당 요청/에러 시계열 (드래그한 시간 구간만 목록에 표시)
+        self.histogram_strip = HistogramStrip(self.histogram)
+        self.histogram_strip.range_selected.connect(lambda _: self.apply_search_filter())
+
+        list_container = QWidget()
+        list_container.setObjectName("transparent_container")
+        list_layout = QVBoxLayout(list_container)
+        list_layout.setContentsMargins(0, 0, 0, 0)
+        list_layout.setSpacing(5)
+        list_layout.addWidget(self.histogram_strip)
+        list_layout.addWidget(Panel("System Log List", self.table))
+        self.left_splitter.addWidget(list_container)
         
         self.detail_panel = self.create_detail_layer()
         self.detail_panel.hide()
@@ -253,82 +535,41 @@ class MainWindow(QMainWindow):
         
         self.edt_log_search = QLineEdit()
         self.edt_log_search.setPlaceholderText("Find string in log...")
-        self.edt_log_search.textChanged.connect(self.update_highlights)
-        self.edt_log_search.returnPressed.connect(lambda: self.find_text_in_log(forward=True))
+
+        # 일치 건수 (현재 위치 / 전체)
+        self.lbl_match_count = QLabel("")
+        self.lbl_match_count.setMinimumWidth(70)
+        self.lbl_match_count.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         
         btn_prev = QPushButton("Prev")
         btn_prev.setFixedWidth(60)
         btn_prev.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_prev.clicked.connect(lambda: self.find_text_in_log(forward=False))
 
         btn_next = QPushButton("Next")
         btn_next.setFixedWidth(60)
         btn_next.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_next.clicked.connect(lambda: self.find_text_in_log(forward=True))
 
         search_layout.addWidget(self.edt_log_search)
+        search_layout.addWidget(self.lbl_match_count)
         search_layout.addWidget(btn_prev)
         search_layout.addWidget(btn_next)
 
-        self.txt_full_log = QTextEdit()
-        self.txt_full_log.setReadOnly(True)
+        # 대용량 로그 뷰어 (줄 색인 기반, 보이는 줄만 그림 / Ctrl+G: 줄 이동)
+        self.txt_full_log = LogTextView()
+
+        # 하이라이트: 디바운스 + 작업 스레드 검색 + 보이는 구간만 표시
+        self.log_highlighter = LogHighlighter(self.txt_full_log, self)
+        self.log_highlighter.counter_changed.connect(self.lbl_match_count.setText)
+        self.edt_log_search.textChanged.connect(self.log_highlighter.set_needle)
+        self.edt_log_search.returnPressed.connect(lambda: self.log_highlighter.jump(forward=True))
+        btn_prev.clicked.connect(lambda: self.log_highlighter.jump(forward=False))
+        btn_next.clicked.connect(lambda: self.log_highlighter.jump(forward=True))
 
         layout.addLayout(search_layout)
         layout.addWidget(self.txt_full_log)
 
         return Panel("Detailed Log View", container)
 
-    def update_highlights(self):
-        extra_selections = []
-        doc = self.txt_full_log.document()
-        error_keywords = ["error", "fatal", "exception"]
-        
-        block = doc.begin()
-        while block.isValid():
-            text = block.text().lower()
-            if any(k in text for k in error_keywords):
-                selection = QTextEdit.ExtraSelection()
-                cursor = QTextCursor(doc)
-                cursor.setPosition(block.position())
-                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-                selection.cursor = cursor
-                fmt = QTextCharFormat()
-                fmt.setBackground(AppStyle.HIGHLIGHT_ERROR_BG) 
-                fmt.setProperty(QTextCharFormat.Property.FullWidthSelection, True)
-                selection.format = fmt
-                extra_selections.append(selection)
-            block = block.next()
-
-        search_text = self.edt_log_search.text()
-        if search_text:
-            cursor = QTextCursor(doc)
-            while not cursor.isNull() and not cursor.atEnd():
-                cursor = doc.find(search_text, cursor)
-                if not cursor.isNull():
-                    selection = QTextEdit.ExtraSelection()
-                    selection.cursor = cursor
-                    fmt = QTextCharFormat()
-                    fmt.setForeground(AppStyle.HIGHLIGHT_SEARCH_TEXT)
-                    fmt.setFontWeight(QFont.Weight.Bold)
-                    selection.format = fmt
-                    extra_selections.append(selection)
-        self.txt_full_log.setExtraSelections(extra_selections)
-
-    def find_text_in_log(self, forward=True):
-        search_text = self.edt_log_search.text()
-        if not search_text: return
-        flags = QTextDocument.FindFlag(0)
-        if not forward: flags |= QTextDocument.FindFlag.FindBackward
-        found = self.txt_full_log.find(search_text, flags)
-        if not found:
-            cursor = self.txt_full_log.textCursor()
-            if forward: cursor.movePosition(QTextCursor.MoveOperation.Start)
-            else: cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.txt_full_log.setTextCursor(cursor)
-            if not self.txt_full_log.find(search_text, flags):
-                QMessageBox.information(self, "검색 결과", f"'{search_text}'을(를) 찾을 수 없습니다.")
-                return
-
     def create_filter_bar(self):
         container = QWidget()
         container.setObjectName("transparent_container") 
@@ -374,16 +615,39 @@ class MainWindow(QMainWindow):
         layout.addStretch()
         
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("GUID, IP, Service...")
+        self.search_input.setPlaceholderText("svc:Name op:Name ip:10.1.* err:Y elapsed>500 ...")
         self.search_input.setFixedWidth(250)
-        self.search_input.returnPressed.connect(self.load_data)
+        self.search_input.setToolTip(
+            "svc: op: app: node: ip: guid: -> 서버 조회조건 (와일드카드 * ? 는 로컬 필터)\n"
+            "err:Y/N, elapsed>500 (>=, <, <=, =), server: -> 로컬 필터\n"
+            "그 외 단어 -> GUID/IP/서비스/오퍼레이션/앱/노드 부분 일치 (모두 포함)\n"
+            "서버 조회는 기간, 대상 서버, 서버 조회조건이 바뀐 경우에만 수행됩니다.")
+        self.search_input.textChanged.connect(self.filter_timer.start)
+        self.search_input.returnPressed.connect(self.search)
         
+        # 로컬 캐시 무시하고 서버에서 다시 받기
+        self.chk_bypass_cache = QCheckBox("No Cache")
+        self.chk_bypass_cache.setToolTip("로컬 캐시를 사용하지 않고 서버에서 전체 구간을 다시 조회")
+
+        # 다중 서버 동시 조회 (메뉴에서 대상 서버 선택)
+        self.btn_fanout = QToolButton()
+        self.btn_fanout.setText("All Servers")
+        self.btn_fanout.setCheckable(True)
+        self.btn_fanout.setToolTip("Options에 등록된 서버 전체(또는 선택한 서버)를 동시에 조회")
+        self.btn_fanout.setPopupMode(QToolButton.ToolButtonPopupMode.MenuButtonPopup)
+        self.fanout_menu = QMenu(self.btn_fanout)
+        self.fanout_menu.aboutToShow.connect(self.refresh_fanout_menu)
+        self.btn_fanout.setMenu(self.fanout_menu)
+        self.fanout_unchecked = set()
+
         btn_search = QPushButton("Search")
         btn_search.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_search.setFixedWidth(80)
-        btn_search.clicked.connect(self.load_data)
+        btn_search.clicked.connect(self.search)
         
         layout.addWidget(self.search_input)
+        layout.addWidget(self.chk_bypass_cache)
+        layout.addWidget(self.btn_fanout)
         layout.addWidget(btn_search)
         
         return container
@@ -406,8 +670,20 @@ class MainWindow(QMainWindow):
         self.edt_op = QLineEdit()
         self.edt_op.setReadOnly(True)
 
+        # 동일 GUID 전체 보기 (인덱스 조회)
+        self.btn_same_guid = QPushButton("Same GUID")
+        self.btn_same_guid.setCheckable(True)
+        self.btn_same_guid.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_same_guid.setToolTip("이 GUID를 가진 모든 트랜잭션만 표시")
+        self.btn_same_guid.toggled.connect(self.toggle_same_guid_filter)
+
+        guid_layout = QHBoxLayout()
+        guid_layout.setContentsMargins(0, 0, 0, 0)
+        guid_layout.addWidget(self.edt_guid)
+        guid_layout.addWidget(self.btn_same_guid)
+
         layout.addWidget(QLabel("GUID"), 0, 0)
-        layout.addWidget(self.edt_guid, 0, 1)
+        layout.addLayout(guid_layout, 0, 1)
         layout.addWidget(QLabel("어플리케이션"), 0, 2)
         layout.addWidget(self.edt_app, 0, 3)
 
@@ -433,16 +709,9 @@ class MainWindow(QMainWindow):
         return CollapsiblePanel("이미지 로그 상세", content)
 
     def create_table(self):
-        table = QTableWidget()
-        columns = ["Timestamp", "GUID", "User IP", "Error", "Application", "Service", "Operation"]
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.verticalHeader().setVisible(False)
-        table.itemClicked.connect(self.on_row_clicked)
-        table.setSortingEnabled(True)
+        table = LogTableView(self.log_store)
+        # 클릭뿐 아니라 방향키로 이동할 때도 상세 표시
+        table.selectionModel().currentRowChanged.connect(lambda current, _previous: self.on_row_clicked(current))
         return table
 
     def reset_details(self):
@@ -453,67 +722,567 @@ class MainWindow(QMainWindow):
         self.edt_op.clear()
         self.txt_raw_in.clear()
         self.txt_raw_out.clear()
+        self.detail_key = None
+        self.btn_same_guid.blockSignals(True)
+        self.btn_same_guid.setChecked(False)
+        self.btn_same_guid.setText("Same GUID")
+        self.btn_same_guid.blockSignals(False)
         self.detail_panel.hide()
 
+    def refresh_fanout_menu(self):
+        """등록된 서버 목록으로 대상 선택 메뉴 재구성 (해제한 서버는 이름으로 기억)"""
+        self.fanout_menu.clear()
+        for item in ConfigManager.load_urls():
+            name = item.get('name', 'Unknown')
+            action = self.fanout_menu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(name not in self.fanout_unchecked)
+            action.toggled.connect(lambda checked, n=name: self.set_fanout_target(n, checked))
+
+    def set_fanout_target(self, name, checked):
+        if checked:
+            self.fanout_unchecked.discard(name)
+        else:
+            self.fanout_unchecked.add(name)
+
+    def selected_range(self):
+        """조회기간 입력값 (시작, 종료 문자열)"""
+        str_start = f"{self.date_start.date().toString('yyyy-MM-dd')} {self.time_start.currentText()}:00"
+        str_end = f"{self.date_end.date().toString('yyyy-MM-dd')} {self.time_end.currentText()}:59"
+        return str_start, str_end
+
+    def search_signature(self, query=None):
+        """서버 재조회가 필요한지 판단하기 위한 조회 조건 (로컬 필터 조건 제외)"""
+        query = query or LogQuery(self.search_input.text())
+        fanout_mode = self.btn_fanout.isChecked()
+        return (self.selected_range(), fanout_mode,
+                frozenset(self.fanout_unchecked) if fanout_mode else self.current_base_url,
+                tuple(sorted(query.conditions.items())))
+
+    def search(self):
+        """Search/Enter: 기간·대상이 같으면 로컬 필터만, 바뀌었으면 서버 조회 (오프라인은 항상 로컬 필터)"""
+        if self.dump_reader is not None or (
+                not self.chk_bypass_cache.isChecked() and self.search_signature() == self.loaded_signature):
+            self.filter_timer.stop()
+            self.apply_search_filter()
+        else:
+            self.load_data()
+
+    def is_store_exporting(self):
+        """화면 결과 저장소를 작업 스레드에서 읽는 중인지"""
+        return self.export_worker is not None and self.export_worker.isRunning() and self.export_worker.from_store
+
+    def stop_store_export(self):
+        """화면 결과를 내보내는 중이면 저장소가 바뀌기 전에 중단"""
+        if self.is_store_exporting():
+            self.export_worker.cancel()
+            self.export_worker.wait()
+
     def load_data(self):
+        if self.dump_reader is not None:
+            self.load_log_file()  # 오프라인 모드: 파일 다시 읽기
+            return
+
+        # 서버가 지원하는 조건만 조회조건으로 보내고, 나머지는 받은 결과를 로컬에서 필터링
+        query = LogQuery(self.search_input.text())
+        use_cache = not self.chk_bypass_cache.isChecked()
+        signature = self.search_signature(query)
+        job_key = ("search", signature, use_cache)
+        if self.jobs.is_running("search", job_key):
+            self.statusBar().showMessage("같은 조건으로 조회 중입니다.")  # 연타: 진행 중인 조회 결과를 그대로 사용
+            return
+
+        self.stop_store_export()
         self.reset_details()
+        self.detail_fetcher.clear()  # 이전 조회의 상세 캐시 / 대기 중인 미리 조회 정리
         self.table.setSortingEnabled(False)
+
+        fanout_mode = self.btn_fanout.isChecked()
+        self.table.setColumnHidden(SERVER_COLUMN, not fanout_mode)
         
-        if not self.cookies or not self.current_base_url:
-            self.table.setRowCount(0)
+        if not fanout_mode and (not self.cookies or not self.current_base_url):
+            self.jobs.cancel("search", notify=False)
+            self.overlay.hide_loading()
+            self.table.source_model.clear()
             return
 
-        search_query = self.search_input.text().strip()
-        str_start = f"{self.date_start.date().toString('yyyy-MM-dd')} {self.time_start.currentText()}:00"
-        str_end = f"{self.date_end.date().toString('yyyy-MM-dd')} {self.time_end.currentText()}:59"
+        self.loaded_signature = signature
+        self.server_conditions = dict(query.conditions)
+        str_start, str_end = self.selected_range()
 
-        self.overlay.setGeometry(self.geometry())
-        self.overlay.show_loading("Fetching Logs...")
-        
-        self.log_worker = LogLoadWorker(
+        if fanout_mode:
+            servers = [item for item in ConfigManager.load_urls()
+                       if item.get('name', 'Unknown') not in self.fanout_unchecked]
+            if not servers:
+                QMessageBox.warning(self, "Fan-out", "조회할 서버가 없습니다. (Tools > Options)")
+                return
+            sessions = {self.current_base_url: self.cookies} if self.cookies else {}
+            self.fanout_status = {}
+            self.server_urls = {item.get('name', 'Unknown'): item.get('url', '') for item in servers}
+            worker = FanOutWorker(self.fanout, servers, str_start, str_end,
+                                  self.server_conditions, use_cache, sessions)
+        else:
+            worker = LogLoadWorker(
+                self.api_service,
+                self.log_cache,
+                self.current_base_url,
+                self.cookies,
+                str_start,
+                str_end,
+                self.server_conditions,
+                use_cache=use_cache
+            )
+
+        self.overlay.show_progress("Fetching Logs...")
+        if self.server_conditions:
+            self.statusBar().showMessage(f"Server filter: {query.describe_conditions()}")
+
+        self.jobs.cancel("tail", notify=False)
+        self.log_index.clear()
+        self.histogram.clear()
+        self.histogram_strip.reset()
+        self.render_cache.clear()
+        self.tail_cursor.reset()
+        self.table.source_model.clear()
+        self.apply_search_filter()
+        self.log_worker = worker
+        self.jobs.submit("search", job_key, worker)  # 진행 중인 이전 조회는 취소
+
+    def on_fanout_status(self, name, message):
+        """서버별 진행 상태 표시"""
+        self.fanout_status[name] = message
+        summary = " | ".join(f"{n}: {m}" for n, m in self.fanout_status.items())
+        self.statusBar().showMessage(summary)
+
+    def cancel_loading(self):
+        """오버레이 Cancel: 조회 중단 (받은 결과는 유지)"""
+        self.jobs.cancel("search", wait=isinstance(self.log_worker, DumpLoadWorker))
+
+    def on_job_batch(self, channel, batch):
+        if channel == "tail":
+            self.on_tail_batch(batch)
+        else:
+            self.on_batch_loaded(batch)
+
+    def on_job_progress(self, channel, rows):
+        if channel == "search" and self.overlay.isVisible():
+            self.overlay.set_message(f"{self.overlay_title()} {rows:,} rows")
+
+    def on_job_finished(self, channel, total, cancelled):
+        self.check_session_rejected()
+        if channel == "search":
+            self.on_load_finished(total, cancelled)
+
+    def on_job_error(self, channel, message):
+        """조회 중 예외 (받은 결과는 유지, 이어서 finished가 와서 채널이 비워짐)"""
+        print(f"{channel} job failed: {message}")
+        if channel == "tail":
+            self.statusBar().showMessage(f"Live tail error: {message}")
+            return
+        self.load_error = message
+        if isinstance(self.log_worker, DumpLoadWorker):
+            QMessageBox.warning(self, "Open Log File", f"파일을 모두 읽지 못했습니다.\n{message}")
+
+    def overlay_title(self):
+        return "Reading Log File..." if isinstance(self.log_worker, DumpLoadWorker) else "Fetching Logs..."
+
+    def on_batch_loaded(self, batch):
+        """페이지 배치 수신 시 테이블에 바로 추가 (진행 표시는 조회가 끝날 때까지 유지)"""
+        start_no = self.table.source_model.append_rows(batch)
+        self.log_index.add_batch(batch, start_no)
+        self.histogram.add_rows(start_no, len(self.log_store))
+        self.histogram_strip.update()
+        self.tail_cursor.observe(batch)
+
+        self.statusBar().showMessage(f"Loading... {len(self.log_store):,} rows")
+
+    def on_load_finished(self, total, cancelled=False):
+        self.table.setSortingEnabled(True)
+        self.overlay.hide_loading()
+
+        error, self.load_error = self.load_error, None
+        if cancelled:
+            # 일부만 받은 결과: 같은 조건으로 다시 검색하면 서버에서 새로 조회
+            self.loaded_signature = None
+            state = f"Failed ({error})" if error else "Cancelled"
+            self.statusBar().showMessage(f"{state} — {len(self.log_store):,} rows (partial)")
+            return
+
+        msg = f"{total:,} rows loaded"
+        if isinstance(self.log_worker, DumpLoadWorker):
+            msg += f" from {self.dump_reader.path}"
+        elif total >= LOG_MAX_ROWS:
+            msg += f" (최대 {LOG_MAX_ROWS:,}건 제한으로 일부 생략됨)"
+        if self.fanout_status and isinstance(self.log_worker, FanOutWorker):
+            msg += "  [" + " | ".join(f"{n}: {m}" for n, m in self.fanout_status.items()) + "]"
+        self.statusBar().showMessage(msg)
+
+    # -------------------------------------------------------------------------
+    # 실시간 추적 (Live Tail)
+    # -------------------------------------------------------------------------
+    def toggle_live_tail(self, enabled):
+        """주기적으로 마지막 수신 시각 이후 로그만 조회하여 추가"""
+        if enabled:
+            self.live_timer.start()
+            self.statusBar().showMessage(f"Live tail ON ({LIVE_TAIL_INTERVAL_SEC}s)")
+            self.poll_live_tail()
+        else:
+            self.live_timer.stop()
+            self.statusBar().showMessage("Live tail OFF")
+
+    def poll_live_tail(self):
+        if not self.cookies or not self.current_base_url or self.dump_reader is not None:
+            return
+        # 다중 서버 결과에는 추가하지 않음 (현재 서버의 행만 server 없이 섞이게 되므로)
+        if self.btn_fanout.isChecked() or not self.table.isColumnHidden(SERVER_COLUMN):
+            self.statusBar().showMessage("Live tail is not available for All Servers results")
+            return
+        # 이전 조회가 아직 진행 중이면 이번 주기는 건너뜀
+        if self.jobs.is_busy("search") or self.jobs.is_busy("tail"):
+            return
+        # 화면 결과를 내보내는 동안은 저장소에 행을 추가하지 않음 (작업 스레드가 같은 컬럼을 읽는 중)
+        if self.is_store_exporting():
+            self.statusBar().showMessage("Live tail paused while exporting")
+            return
+
+        str_start = self.tail_cursor.start_text()
+        if str_start is None:
+            str_start = self.selected_range()[0]
+        str_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        worker = LogLoadWorker(
             self.api_service,
+            self.log_cache,
             self.current_base_url,
             self.cookies,
             str_start,
             str_end,
-            search_query
+            self.server_conditions,
+            use_cache=False
         )
-        self.log_worker.finished_signal.connect(self.on_data_loaded)
-        self.log_worker.start()
+        self.jobs.submit("tail", None, worker)
 
-    def on_data_loaded(self, data_list):
-        self.data_list = data_list
-        self.table.setRowCount(0)
-        
-        for row_idx, item in enumerate(self.data_list):
-            self.table.insertRow(row_idx)
-            mapping = [item['timestamp'], item['guid'], item['user_ip'], "", item['application'], item['service'], item['operation']]
-            
-            for col_idx, val in enumerate(mapping):
-                if col_idx == 3:
-                    status_text = "FAIL" if item['error'] else "OK"
-                    cell = QTableWidgetItem(status_text)
-                    cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    cell.setForeground(QColor(AppStyle.COLOR_ERROR if item['error'] else AppStyle.COLOR_SUCCESS))
-                    self.table.setItem(row_idx, col_idx, cell)
-                else:
-                    self.table.setItem(row_idx, col_idx, QTableWidgetItem(val))
-        
-        self.table.setSortingEnabled(True)
+    def on_tail_batch(self, batch):
+        """경계 중복을 제거하고 정렬 위치에 추가 (선택/스크롤 유지)"""
+        new_records = self.tail_cursor.filter_new(batch)
+        if not new_records:
+            return
+        start_no = self.table.source_model.append_rows(new_records, keep_sorted=True)
+        self.log_index.add_batch(new_records, start_no)
+        self.histogram.add_rows(start_no, len(self.log_store))
+        self.histogram_strip.update()
+        self.tail_cursor.observe(new_records)
+        self.statusBar().showMessage(
+            f"Live tail: +{len(new_records):,} rows ({len(self.log_store):,} total, "
+            f"{datetime.now().strftime('%H:%M:%S')})")
+
+    # -------------------------------------------------------------------------
+    # 오프라인 모드 (로컬 로그 파일)
+    # -------------------------------------------------------------------------
+    def open_log_file(self):
+        """getServiceLogList 응답 JSON 또는 JSONL 파일을 로그인 없이 열기"""
+        path, _ = QFileDialog.getOpenFileName(self, "Open Log File", "",
+                                              "BXM Log (*.json *.jsonl *.ndjson);;All Files (*)")
+        if not path:
+            return
+        try:
+            reader = LogDumpReader(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Open Log File", f"파일을 열 수 없습니다:\n{e}")
+            return
+
+        self.menuBar().live_tail_action.setChecked(False)
+        self.cancel_search()
+        self.stop_store_export()
+        self.table.source_model.clear()
+        # 원본 항목은 파일 위치만 보관 (이전 파일은 저장소를 비운 뒤 닫음)
+        self.log_store.set_raw_column(MappedRawColumn(reader.buffer))
+        if self.dump_reader is not None:
+            self.dump_reader.close()
+        self.dump_reader = reader
+
+        self.lbl_user_info.setText(f"Offline | {os.path.basename(path)}")
+        self.lbl_user_info.setObjectName("user_offline")
+        self.lbl_user_info.style().unpolish(self.lbl_user_info)
+        self.lbl_user_info.style().polish(self.lbl_user_info)
+        self.load_log_file()
+
+    def load_log_file(self):
+        job_key = ("dump", self.dump_reader.path)
+        if self.jobs.is_running("search", job_key):
+            self.statusBar().showMessage("파일을 읽는 중입니다.")
+            return
+        self.cancel_search()
+        self.stop_store_export()
+        self.reset_details()
+        self.table.setSortingEnabled(False)
+        self.table.setColumnHidden(SERVER_COLUMN, True)
+        self.loaded_signature = None
+        self.server_conditions = {}
+
+        worker = DumpLoadWorker(self.dump_reader)
+
+        self.overlay.show_progress("Reading Log File...")
+        self.jobs.cancel("tail", notify=False)
+        self.log_index.clear()
+        self.histogram.clear()
+        self.histogram_strip.reset()
+        self.render_cache.clear()
+        self.tail_cursor.reset()
+        self.table.source_model.clear()
+        self.apply_search_filter()
+        self.log_worker = worker
+        self.jobs.submit("search", job_key, worker)
+
+    def cancel_search(self):
+        """진행 중인 조회를 알림 없이 취소 (파일 읽기는 파일을 닫기 전에 끝날 때까지 대기)"""
+        self.jobs.cancel("search", notify=False, wait=isinstance(self.log_worker, DumpLoadWorker))
+
+    def close_log_file(self):
+        """오프라인 모드 종료 (로그인 성공 시 서버 조회로 전환)"""
+        if self.dump_reader is None:
+            return
+        self.cancel_search()
         self.overlay.hide_loading()
+        self.stop_store_export()
+        self.reset_details()
+        self.detail_fetcher.clear()
+        self.table.source_model.clear()
+        self.log_store.set_raw_column(RawBlockColumn())
+        self.log_index.clear()
+        self.histogram.clear()
+        self.histogram_strip.reset()
+        self.render_cache.clear()
+        self.dump_reader.close()
+        self.dump_reader = None
+
+    # -------------------------------------------------------------------------
+    # 내보내기 (JSONL / CSV, gzip / zstd) - 배치 단위 스트리밍
+    # -------------------------------------------------------------------------
+    def ask_export_path(self, title):
+        filters = ["JSON Lines (*.jsonl)", "JSON Lines gzip (*.jsonl.gz)", "CSV (*.csv)", "CSV gzip (*.csv.gz)"]
+        if ZSTD_AVAILABLE:
+            filters += ["JSON Lines zstd (*.jsonl.zst)", "CSV zstd (*.csv.zst)"]
+        default_name = f"syslog_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+        path, selected = QFileDialog.getSaveFileName(self, title, default_name, ";;".join(filters))
+        if path and "." not in path.rsplit("/", 1)[-1]:
+            path += selected[selected.index("*") + 1:-1]  # 확장자 없이 입력한 경우 선택한 형식으로
+        return path
+
+    def export_results(self):
+        """현재 화면의 (필터/정렬 반영) 결과 내보내기 (기록하는 동안 실시간 추적은 멈춤)"""
+        model = self.table.source_model
+        if not model.rowCount():
+            QMessageBox.information(self, "Export", "내보낼 결과가 없습니다.")
+            return
+        path = self.ask_export_path("Export Results")
+        if not path:
+            return
+
+        rec_nos = model.visible_record_numbers()
+        row = self.log_store.row
+
+        def batches():
+            for i in range(0, len(rec_nos), EXPORT_BATCH_ROWS):
+                yield [row(rec_no) for rec_no in rec_nos[i:i + EXPORT_BATCH_ROWS]]
+        self.start_export(path, batches(), len(rec_nos), from_store=True)
+
+    def export_from_server(self):
+        """
+        현재 조회 조건으로 서버에서 페이지 단위로 받아 바로 파일에 기록 (건수 제한 없음)
+        화면 결과(LOG_MAX_ROWS 제한)와 무관하게 전체 구간을 일정한 메모리로 내보냅니다.
+        """
+        if not self.cookies or not self.current_base_url:
+            QMessageBox.warning(self, "Export", "서버에 로그인한 후 사용할 수 있습니다.")
+            return
+        path = self.ask_export_path("Export From Server")
+        if not path:
+            return
+
+        query = LogQuery(self.search_input.text())
+        predicate = query.record_predicate()
+        str_start, str_end = self.selected_range()
+        pages = self.api_service.iter_system_logs(self.current_base_url, self.cookies, str_start, str_end,
+                                                  query.conditions, max_rows=sys.maxsize)
+
+        def batches():
+            try:
+                for batch in pages:
+                    yield batch if predicate is None else [record for record in batch if predicate(record)]
+            finally:
+                pages.close()
+        self.start_export(path, batches(), 0, from_store=False)
+
+    def start_export(self, path, batches, total, from_store):
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.information(self, "Export", "이미 내보내기가 진행 중입니다.")
+            return
+
+        progress = QProgressDialog(f"Exporting to {path}...", "Cancel", 0, total, self)
+        progress.setWindowTitle("Export")
+        progress.setMinimumDuration(0)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        if from_store:
+            self.jobs.cancel("tail", notify=False)  # 진행 중인 추적 결과는 버리고 내보내기가 끝난 뒤 다시 조회
+        worker = ExportWorker(path, batches, from_store)
+        if total:
+            worker.progress_signal.connect(progress.setValue)
+        else:
+            worker.progress_signal.connect(lambda count: progress.setLabelText(f"Exporting... {count:,} rows"))
+        progress.canceled.connect(worker.cancel)
+        worker.finished_signal.connect(lambda count, error: self.on_export_finished(progress, path, count, error))
+        self.export_worker = worker
+        worker.start()
+
+    def on_export_finished(self, progress, path, count, error):
+        progress.close()
+        if error and error != "Cancelled":
+            QMessageBox.critical(self, "Export", f"내보내기 실패 ({count:,}건 기록 후 중단):\n{error}")
+        elif error:
+            self.statusBar().showMessage(f"Export cancelled ({count:,} rows written to {path})")
+        else:
+            self.statusBar().showMessage(f"Exported {count:,} rows to {path}")
 
-    def on_row_clicked(self, item):
-        row = item.row()
-        target_guid = self.table.item(row, 1).text()
-        data = next((d for d in self.data_list if d['guid'] == target_guid), None)
+    def render_details(self, rec_no, data):
+        """선택한 행의 입력전문/상세 로그 문자열 생성 (LRU 캐시)"""
+        rendered = self.render_cache.get(rec_no)
+        if rendered is None:
+            rendered = (render_raw_input(data), render_detail_log(data))
+            self.render_cache.put(rec_no, rendered)
+        return rendered
+
+    def on_row_clicked(self, index):
+        data = self.table.record_at(index)
         if data:
+            raw_input, detail_log = self.render_details(
+                self.table.source_model.record_no(index.row()), data)
             if self.detail_panel.isHidden():
                 self.detail_panel.show()
             self.edt_guid.setText(data['guid'])
             self.edt_app.setText(data['application'])
             self.edt_service.setText(data['service'])
             self.edt_op.setText(data['operation'])
-            self.txt_raw_in.setText(data['raw_input'])
-            self.txt_raw_out.setText(data['raw_output'])
-            self.txt_full_log.setText(data['detail_log'])
-            self.update_highlights()
\ No newline at end of file
+            self.txt_raw_in.setText(raw_input)
+            self.txt_full_log.setText(detail_log)
+            self.show_transaction_detail(index.row(), data)
+
+            same_count = len(self.log_index.rows_for_guid(data['guid']))
+            self.btn_same_guid.setText(f"Same GUID ({same_count})")
+
+    # -------------------------------------------------------------------------
+    # 거래 상세 (입/출력 전문) - 지연 조회
+    # -------------------------------------------------------------------------
+    def detail_target(self, record):
+        """상세를 조회할 서버 (base_url, cookies) - 오프라인/미로그인이면 None"""
+        if self.dump_reader is not None:
+            return None
+        server = record.get('server')
+        if server:
+            url = self.server_urls.get(server)
+            return (url, None) if url else None  # 다중 서버: 로그인 시 등록된 공유 세션 사용
+        if self.cookies and self.current_base_url:
+            return self.current_base_url, self.cookies
+        return None
+
+    def show_transaction_detail(self, row, record):
+        """선택한 거래의 상세 표시 (캐시에 없으면 백그라운드 조회) 후 위/아래 행 미리 조회"""
+        target = self.detail_target(record)
+        if target is None:
+            self.detail_key = None
+            self.txt_raw_out.setText(RAW_OUTPUT_PLACEHOLDER)
+            return
+
+        base_url, cookies = target
+        self.detail_key, detail = self.detail_fetcher.fetch(
+            base_url, cookies, record['guid'], record['timestamp'], callback=self.detail_fetched.emit)
+        if detail is not None:
+            self.display_detail(detail)
+        else:
+            self.txt_raw_out.setText(DETAIL_LOADING_TEXT)
+
+        # 가까운 행부터 (방향키 이동 시 다음 행이 이미 캐시에 있도록)
+        model = self.table.source_model
+        neighbours = []
+        for offset in range(1, DETAIL_PREFETCH_ROWS + 1):
+            for neighbour_row in (row + offset, row - offset):
+                if 0 <= neighbour_row < model.rowCount():
+                    neighbour = model.record(neighbour_row)
+                    neighbour_target = self.detail_target(neighbour)
+                    if neighbour_target is not None:
+                        neighbours.append((neighbour_target[0], neighbour['guid'], neighbour['timestamp']))
+        self.detail_fetcher.prefetch(
+            neighbours, lambda url: self.cookies if url == self.current_base_url else None)
+
+    def on_detail_fetched(self, key, detail):
+        if key != self.detail_key:
+            return  # 그 사이 다른 행을 선택했거나 미리 조회한 결과
+        if detail is None:
+            self.txt_raw_out.setText(DETAIL_FAILED_TEXT)
+        else:
+            self.display_detail(detail)
+
+    def display_detail(self, detail):
+        if detail.get('input'):
+            self.txt_raw_in.setText(render_message(detail['input']))
+        self.txt_raw_out.setText(render_message(detail.get('output', "")))
+
+    def apply_search_filter(self):
+        """
+        검색어의 로컬 조건으로 로드된 결과를 필터링 (이후 도착하는 배치에도 같은 조건 적용)
+        일반 단어는 LogIndex로 후보를 좁히고, 나머지 조건은 컬럼 판정 함수로 거릅니다.
+        """
+        model = self.table.source_model
+        query = LogQuery(self.search_input.text())
+        keyword_predicate = LogIndex.keyword_predicate(query.keyword)
+        index_rows, row_filter = query.compile(self.log_store, self.server_conditions, self.log_index)
+        time_slice = self.histogram_strip.selection  # 시계열에서 드래그한 분 구간
+        if keyword_predicate is None and row_filter is None and time_slice is None and not model.is_filtered():
+            return
+
+        if self.btn_same_guid.isChecked():
+            self.btn_same_guid.blockSignals(True)
+            self.btn_same_guid.setChecked(False)
+            self.btn_same_guid.blockSignals(False)
+
+        if keyword_predicate is None and row_filter is None and time_slice is None:
+            model.set_filter(None)
+        else:
+            if time_slice is None and index_rows is not None and keyword_predicate is None:
+                rec_nos = index_rows  # 필드 조건: 값별 레코드 번호 목록에서 바로 시작
+            elif time_slice is None:
+                rec_nos = self.log_index.search(query.keyword)
+            else:
+                # 시간 구간은 분별 레코드 번호 목록으로 바로 좁히고 검색어 결과와 교집합
+                rec_nos = self.histogram.rows_between(*time_slice)
+                if keyword_predicate is not None:
+                    keyword_rows = set(self.log_index.search(query.keyword))
+                    rec_nos = [rec_no for rec_no in rec_nos if rec_no in keyword_rows]
+            if index_rows is not None and rec_nos is not index_rows:
+                rec_nos = LogIndex.intersect(rec_nos, index_rows)
+            if row_filter is not None:
+                rec_nos = list(compress(rec_nos, map(row_filter, rec_nos)))
+
+            ts = self.log_store.ts
+
+            def predicate(record):
+                return ((keyword_predicate is None or keyword_predicate(record))
+                        and (row_filter is None or row_filter(record.rec_no))
+                        and (time_slice is None
+                             or time_slice[0] <= ts[record.rec_no] // MINUTE_DIVISOR <= time_slice[1]))
+            model.set_visible_rows(rec_nos, predicate)
+        if model.total_count():
+            self.statusBar().showMessage(f"{model.rowCount():,} / {model.total_count():,} rows")
+
+    def toggle_same_guid_filter(self, checked):
+        """선택한 GUID의 전체 트랜잭션만 표시 / 해제"""
+        model = self.table.source_model
+        guid = self.edt_guid.text()
+        if checked and guid:
+            model.set_visible_rows(self.log_index.rows_for_guid(guid),
+                                   lambda record: record['guid'] == guid)
+        else:
+            self.apply_search_filter()
+            return
+        self.statusBar().showMessage(f"{model.rowCount():,} / {model.total_count():,} rows")
@@ -141,6 +141,8 @@ class OptionsDialog(QDialog):
 
     def save_options(self):
         """데이터 저장 및 메인 윈도우 갱신"""
+        # 화면에 없는 항목(domain, apis 등)은 같은 이름의 기존 설정에서 유지
+        extras = {item.get('name', ''): item for item in ConfigManager.load_urls()}
         data = []
         for row in range(self.table.rowCount()):
             name = self.table.item(row, 0).text()
@@ -149,6 +151,7 @@ class OptionsDialog(QDialog):
             password = self.table.item(row, 3).text()
             
             data.append({
+                **extras.get(name, {}),
                 "name": name, 
                 "url": url,
                 "id": user_id,
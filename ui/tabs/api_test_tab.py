@@ -120,7 +120,8 @@ class ApiTestTab(QWidget):
         self.txt_test_response.setText("Sending request...")
         
         # API 호출
-        success, response_text = self.api_service.send_raw_request(url, cookies, payload)
+        success, response_text = self.api_service.send_raw_request(url, cookies, payload,
+                                                                   self.main_window.current_base_url)
         
         self.txt_test_response.setText(response_text)
         if success:
@@ -0,0 +1,108 @@
+import time
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, QTimer
+
+from config.settings import ANALYTICS_REFRESH_MS
+from core.log_analytics import summarize, GROUP_FIELDS, NUMPY_AVAILABLE
+
+COLUMNS = (("name", "Name"), ("count", "Count"), ("errors", "Errors"), ("error_rate", "Error %"),
+           ("avg", "Avg"), ("p50", "p50"), ("p95", "p95"), ("p99", "p99"), ("max", "Max"))
+
+
+class AnalyticsPanel(QWidget):
+    """
+    경과시간/에러 통계 (서비스/오퍼레이션/어플리케이션/노드별 호출 수, 에러율, p50/p95/p99/max)
+    rows_provider()가 돌려주는 레코드 번호(화면 필터 결과, None 이면 전체) 기준으로 계산합니다.
+    데이터가 바뀌면 invalidate()로 알리며, 화면에 보일 때만 ANALYTICS_REFRESH_MS 간격으로 다시 계산합니다.
+    """
+
+    def __init__(self, store, rows_provider, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.rows_provider = rows_provider
+        self.dirty = True
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(ANALYTICS_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        top_layout = QHBoxLayout()
+        top_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.cmb_group = QComboBox()
+        for field in GROUP_FIELDS:
+            self.cmb_group.addItem(field.capitalize(), field)
+        self.cmb_group.currentIndexChanged.connect(self.refresh)
+
+        self.lbl_summary = QLabel("")
+        self.lbl_elapsed = QLabel("")
+        self.lbl_elapsed.setStyleSheet("color: #6c7086;")
+        if not NUMPY_AVAILABLE:
+            self.lbl_elapsed.setToolTip("numpy를 설치하면 대용량 결과도 더 빠르게 계산됩니다.")
+
+        top_layout.addWidget(QLabel("Group by:"))
+        top_layout.addWidget(self.cmb_group)
+        top_layout.addSpacing(15)
+        top_layout.addWidget(self.lbl_summary)
+        top_layout.addStretch()
+        top_layout.addWidget(self.lbl_elapsed)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for _, title in COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, len(COLUMNS)):
+            self.table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.horizontalHeader().setSortIndicator(1, Qt.SortOrder.DescendingOrder)  # 호출 건수 순
+        self.table.setSortingEnabled(True)
+
+        layout.addLayout(top_layout)
+        layout.addWidget(self.table)
+
+    def invalidate(self, *args):
+        """결과/필터 변경 알림 (보이는 중이면 잠시 후 재계산)"""
+        self.dirty = True
+        if self.isVisible() and not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.dirty:
+            self.refresh()
+
+    def refresh(self):
+        self.refresh_timer.stop()
+        self.dirty = False
+
+        started = time.perf_counter()
+        total, groups = summarize(self.store, self.cmb_group.currentData(), self.rows_provider())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self.lbl_summary.setText(
+            f"Total {total['count']:,}  |  Errors {total['errors']:,} ({total['error_rate']}%)  |  "
+            f"p50 {total['p50']:,}  p95 {total['p95']:,}  p99 {total['p99']:,}  max {total['max']:,} ms")
+        self.lbl_elapsed.setText(f"{elapsed_ms:.0f} ms")
+
+        # 정렬 상태 유지: 채우는 동안만 정렬 해제
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(groups))
+        for row, stats in enumerate(groups):
+            for column, (key, _) in enumerate(COLUMNS):
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, stats[key])
+                if key != "name":
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QToolButton, QWidget, QSizePolicy)
-from PyQt6.QtCore import Qt, QSize
+                             QToolButton, QWidget, QSizePolicy, QPushButton)
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QColor, QPainter
 
 class Panel(QFrame):
@@ -90,9 +90,18 @@ class CollapsiblePanel(QWidget):
             self.setMaximumHeight(16777215)
 
 class LoadingOverlay(QWidget):
-    """화면을 덮는 반투명 로딩 오버레이 (최상위 창 모드)"""
+    """
+    로딩 오버레이 (최상위 창 모드)
+    - show_loading: 화면 전체를 덮는 반투명 오버레이 (로그인 등 입력을 막아야 할 때)
+    - show_progress: 창 하단의 작은 진행 표시줄 + Cancel 버튼 (조회 중에도 받은 결과를 보고 조작 가능)
+    """
+    cancel_requested = pyqtSignal()
+    BANNER_SIZE = QSize(420, 48)
+    BANNER_BOTTOM_MARGIN = 40
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.banner = False
         
         # [핵심] 부모 창에 종속되지 않고 독립적인 최상위 창으로 설정
         # Frameless: 테두리 없음 / Tool: 작업표시줄 안 뜸 / WindowStaysOnTopHint: 항상 위
@@ -102,36 +111,72 @@ class LoadingOverlay(QWidget):
         self.init_ui()
 
     def init_ui(self):
-        layout = QVBoxLayout(self)
+        layout = QHBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setContentsMargins(16, 6, 10, 6)
+        layout.setSpacing(12)
         
         self.lbl_msg = QLabel("Processing...")
-        self.lbl_msg.setStyleSheet("""
-            QLabel {
+        layout.addWidget(self.lbl_msg)
+
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_cancel.clicked.connect(self.cancel_requested.emit)
+        layout.addWidget(self.btn_cancel)
+
+    def set_font_size(self, size):
+        self.lbl_msg.setStyleSheet(f"""
+            QLabel {{
                 color: #ffffff;
                 font-weight: bold;
-                font-size: 24px;
+                font-size: {size}px;
                 background-color: transparent;
                 border: none;
-            }
+            }}
         """)
-        layout.addWidget(self.lbl_msg)
 
     def paintEvent(self, event):
-        """반투명 검은색 배경 그리기"""
+        """반투명 검은색 배경 그리기 (진행 표시줄은 둥근 모서리)"""
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 180)) # 조금 더 진하게 (180)
+        if self.banner:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 200))
+            painter.drawRoundedRect(self.rect(), 8, 8)
+        else:
+            painter.fillRect(self.rect(), QColor(0, 0, 0, 180)) # 조금 더 진하게 (180)
+
+    def follow_parent(self):
+        """부모(메인윈도우)의 위치와 크기를 따라감 (진행 표시줄은 하단 중앙)"""
+        if not self.parent():
+            return
+        geo = self.parent().geometry() # 화면상 절대 좌표 및 크기
+        if self.banner:
+            size = self.BANNER_SIZE
+            self.setGeometry(geo.x() + (geo.width() - size.width()) // 2,
+                             geo.bottom() - self.BANNER_BOTTOM_MARGIN - size.height(),
+                             size.width(), size.height())
+        else:
+            self.setGeometry(geo)
 
     def show_loading(self, msg="Loading..."):
+        self._show(msg, banner=False)
+
+    def show_progress(self, msg="Loading..."):
+        self._show(msg, banner=True)
+
+    def set_message(self, msg):
         self.lbl_msg.setText(msg)
-        
-        # 부모(메인윈도우)의 위치와 크기를 그대로 따라감
-        if self.parent():
-            geo = self.parent().geometry() # 화면상 절대 좌표 및 크기
-            self.setGeometry(geo)
-            
+
+    def _show(self, msg, banner):
+        self.banner = banner
+        self.set_font_size(14 if banner else 24)
+        self.btn_cancel.setVisible(banner)
+        self.lbl_msg.setText(msg)
+        self.follow_parent()
         self.show()
         self.raise_() # 최상단 보장
+        self.update()
 
     def hide_loading(self):
-        self.hide()
\ No newline at end of file
+        self.hide()
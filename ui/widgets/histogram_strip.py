@@ -0,0 +1,214 @@
+from PyQt6.QtWidgets import QWidget, QToolTip, QMenu
+from PyQt6.QtCore import Qt, QRect, QPointF, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QPen, QPolygonF
+
+from utils.styles import AppStyle
+
+
+def _minute_text(minute):
+    """yyyyMMddHHmm -> 'MM-dd HH:mm'"""
+    s = str(minute)
+    return f"{s[4:6]}-{s[6:8]} {s[8:10]}:{s[10:12]}"
+
+
+class HistogramStrip(QWidget):
+    """
+    분당 요청 수 / 에러 수 (선택 시 p95 경과시간) 시계열 막대
+    MinuteHistogram이 증분 갱신되면 update()만 호출하면 되고, 그릴 때 버전이 바뀐 경우에만 다시 집계합니다.
+    마우스로 드래그하면 해당 시간 구간을 range_selected((첫 분, 마지막 분))로 알리고, 클릭하면 선택 해제(None)합니다.
+    분 수가 화면 폭보다 많으면 한 픽셀 칸에 여러 분을 묶어 최대값을 표시합니다.
+    """
+    range_selected = pyqtSignal(object)
+    STRIP_HEIGHT = 90
+    MARGIN = 6
+    COLOR_REQUEST = QColor(AppStyle.COLOR_ACCENT)
+    COLOR_ERROR = QColor(AppStyle.COLOR_ERROR)
+    COLOR_P95 = QColor(AppStyle.COLOR_SUCCESS)
+    COLOR_LABEL = QColor("#6c7086")
+
+    def __init__(self, histogram, parent=None):
+        super().__init__(parent)
+        self.histogram = histogram
+        self.show_p95 = False
+        self.selection = None       # (첫 분, 마지막 분) - 필터 적용 중인 구간
+        self._drag = None           # 드래그 중인 (시작 칸, 현재 칸)
+        self._press_x = 0
+        self._cache_key = None
+        self._keys = []
+        self._values = []
+
+        self.setFixedHeight(self.STRIP_HEIGHT)
+        self.setMouseTracking(True)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
+
+    # ---------------------------------------------------------
+    # 데이터
+    # ---------------------------------------------------------
+    def reset(self):
+        """새 조회 시작 (선택 구간 해제, 알림 없음)"""
+        self.selection = None
+        self._drag = None
+        self.update()
+
+    def clear_selection(self):
+        if self.selection is not None:
+            self.selection = None
+            self.update()
+            self.range_selected.emit(None)
+
+    def _series(self):
+        key = (self.histogram.version, self.show_p95)
+        if key != self._cache_key:
+            self._keys, self._values = self.histogram.series(self.show_p95)
+            self._cache_key = key
+        return self._keys, self._values
+
+    def _plot_rect(self):
+        return QRect(self.MARGIN, self.MARGIN + 12, self.width() - self.MARGIN * 2,
+                     self.height() - self.MARGIN * 2 - 24)
+
+    def _columns(self):
+        """화면 칸 목록: [(첫 분 위치, 끝 분 위치)] (분 수가 폭보다 많으면 여러 분을 한 칸에)"""
+        count = len(self._keys)
+        columns = min(count, max(self._plot_rect().width(), 1))
+        return [(i * count // columns, (i + 1) * count // columns) for i in range(columns)]
+
+    def _column_at(self, x):
+        rect = self._plot_rect()
+        columns = len(self._columns())
+        if not columns:
+            return None
+        return min(max((x - rect.left()) * columns // max(rect.width(), 1), 0), columns - 1)
+
+    # ---------------------------------------------------------
+    # 그리기
+    # ---------------------------------------------------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(AppStyle.COLOR_BG_PANEL))
+        keys, values = self._series()
+        rect = self._plot_rect()
+        painter.setPen(self.COLOR_LABEL)
+
+        if not keys:
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Requests / errors per minute")
+            painter.end()
+            return
+
+        columns = self._columns()
+        grouped = []
+        for first, end in columns:
+            chunk = values[first:end]
+            grouped.append((max(v[0] for v in chunk), max(v[1] for v in chunk), max(v[2] for v in chunk)))
+        peak = max(max(g[0] for g in grouped), 1)
+        peak_p95 = max(max(g[2] for g in grouped), 1)
+        width = rect.width() / len(columns)
+        bottom = rect.bottom()
+
+        for i, (requests, errors, _) in enumerate(grouped):
+            x = rect.left() + int(i * width)
+            w = max(int((i + 1) * width) - int(i * width) - (1 if width > 3 else 0), 1)
+            if requests:
+                h = max(int(rect.height() * requests / peak), 1)
+                painter.fillRect(x, bottom - h + 1, w, h, self.COLOR_REQUEST)
+            if errors:
+                h = max(int(rect.height() * errors / peak), 1)
+                painter.fillRect(x, bottom - h + 1, w, h, self.COLOR_ERROR)
+
+        if self.show_p95:
+            points = QPolygonF([QPointF(rect.left() + (i + 0.5) * width,
+                                        bottom - rect.height() * g[2] / peak_p95)
+                                for i, g in enumerate(grouped)])
+            painter.setPen(QPen(self.COLOR_P95, 1.5))
+            painter.drawPolyline(points)
+
+        # 선택 구간 (드래그 중이면 드래그 범위)
+        span = self._selected_columns()
+        if span is not None:
+            x1 = rect.left() + int(span[0] * width)
+            x2 = rect.left() + int((span[1] + 1) * width)
+            painter.fillRect(QRect(x1, rect.top(), max(x2 - x1, 2), rect.height()), AppStyle.HIGHLIGHT_SELECTION_BG)
+
+        # 범례 / 축 라벨
+        painter.setPen(self.COLOR_LABEL)
+        legend = f"max {peak:,}/min"
+        if self.show_p95:
+            legend += f"   p95 max {peak_p95:,} ms"
+        painter.drawText(rect.left(), self.MARGIN + 10, legend)
+        painter.drawText(rect.left(), self.height() - self.MARGIN, _minute_text(keys[0]))
+        painter.drawText(QRect(rect.left(), rect.bottom(), rect.width(), self.height() - rect.bottom() - self.MARGIN + 2),
+                         Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom, _minute_text(keys[-1]))
+        painter.end()
+
+    def _selected_columns(self):
+        if self._drag is not None:
+            return min(self._drag), max(self._drag)
+        if self.selection is None or not self._keys:
+            return None
+        columns = self._columns()
+        first = last = None
+        for i, (start, end) in enumerate(columns):
+            if end > start and self._keys[start] <= self.selection[1] and self._keys[end - 1] >= self.selection[0]:
+                first = i if first is None else first
+                last = i
+        return None if first is None else (first, last)
+
+    # ---------------------------------------------------------
+    # 마우스
+    # ---------------------------------------------------------
+    def mousePressEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton or not self._keys:
+            return
+        column = self._column_at(int(event.position().x()))
+        self._drag = (column, column)
+        self._press_x = int(event.position().x())
+        self.update()
+
+    def mouseMoveEvent(self, event):
+        x = int(event.position().x())
+        column = self._column_at(x)
+        if self._drag is not None:
+            self._drag = (self._drag[0], column)
+            self.update()
+        elif column is not None:
+            self._show_tooltip(event, column)
+
+    def mouseReleaseEvent(self, event):
+        if self._drag is None:
+            return
+        first, last = min(self._drag), max(self._drag)
+        self._drag = None
+        self.update()
+        if abs(int(event.position().x()) - self._press_x) < 3:
+            self.clear_selection()  # 클릭: 선택 해제
+            return
+        columns = self._columns()
+        self.selection = (self._keys[columns[first][0]], self._keys[columns[last][1] - 1])
+        self.update()
+        self.range_selected.emit(self.selection)
+
+    def _show_tooltip(self, event, column):
+        start, end = self._columns()[column]
+        chunk = self._values[start:end]
+        when = _minute_text(self._keys[start])
+        if end - start > 1:
+            when += f" ~ {_minute_text(self._keys[end - 1])[6:]}"
+        text = f"{when}\nRequests: {sum(v[0] for v in chunk):,}\nErrors: {sum(v[1] for v in chunk):,}"
+        if self.show_p95:
+            text += f"\np95: {max(v[2] for v in chunk):,} ms"
+        QToolTip.showText(event.globalPosition().toPoint(), text, self)
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        p95_action = menu.addAction("Show p95 latency")
+        p95_action.setCheckable(True)
+        p95_action.setChecked(self.show_p95)
+        clear_action = menu.addAction("Clear time selection")
+        clear_action.setEnabled(self.selection is not None)
+
+        chosen = menu.exec(event.globalPos())
+        if chosen is p95_action:
+            self.show_p95 = p95_action.isChecked()
+            self.update()
+        elif chosen is clear_action:
+            self.clear_selection()
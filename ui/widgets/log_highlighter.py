@@ -0,0 +1,222 @@
+import re
+from bisect import bisect_left
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+
+from config.settings import LOG_SEARCH_DELAY_MS
+
+ERROR_KEYWORDS = ("error", "fatal", "exception")
+FOLD_CHUNK = 256 * 1024
+ERROR_LINE_PATTERN = re.compile(r"^.*(?:error|fatal|exception).*$", re.IGNORECASE | re.MULTILINE)
+
+
+def fold_text(text):
+    """
+    대소문자 무시 검색용 소문자 사본 (위치가 원문과 같을 때만, 아니면 None)
+    한 번 만들어 두면 이후 검색은 정규식 IGNORECASE 대신 str.find로 처리되어 훨씬 빠릅니다.
+    """
+    # 큰 문서를 한 번에 lower() 하면 그동안 GIL을 잡고 있어 화면이 멈추므로 나누어 변환
+    parts = []
+    for start in range(0, len(text), FOLD_CHUNK):
+        chunk = text[start:start + FOLD_CHUNK]
+        folded = chunk.lower()
+        if len(folded) != len(chunk):
+            return None
+        parts.append(folded)
+    return "".join(parts)
+
+
+def _find_all(haystack, needle):
+    positions = []
+    find = haystack.find
+    pos = find(needle)
+    while pos != -1:
+        positions.append(pos)
+        pos = find(needle, pos + len(needle))
+    return positions
+
+
+def find_error_lines(text, folded=None):
+    """에러 키워드가 포함된 줄의 (시작, 끝) 위치 목록"""
+    if folded is None:
+        return [match.span() for match in ERROR_LINE_PATTERN.finditer(text)]
+
+    spans = []
+    line_end = -1
+    for pos in sorted(p for keyword in ERROR_KEYWORDS for p in _find_all(folded, keyword)):
+        if pos <= line_end:
+            continue  # 같은 줄
+        start = folded.rfind('\n', 0, pos) + 1
+        line_end = folded.find('\n', pos)
+        if line_end == -1:
+            line_end = len(folded)
+        spans.append((start, line_end))
+    return spans
+
+
+def find_matches(text, needle, folded=None):
+    """검색어 일치 시작 위치 목록 (대소문자 무시, 겹치지 않게)"""
+    if not needle:
+        return []
+    if folded is not None and len(needle.lower()) == len(needle):
+        return _find_all(folded, needle.lower())
+    pattern = re.compile(re.escape(needle), re.IGNORECASE)
+    return [match.start() for match in pattern.finditer(text)]
+
+
+class HighlightScanWorker(QThread):
+    """문서 전체 검색 (소문자 사본과 에러 줄 위치는 문서당 한 번만 계산)"""
+    finished_signal = pyqtSignal(int, str, object, object, object)  # doc_id, needle, error_spans|None, matches, folded
+
+    def __init__(self, doc_id, text, needle, folded, need_errors):
+        super().__init__()
+        self.doc_id = doc_id
+        self.text = text
+        self.needle = needle
+        self.folded = folded
+        self.need_errors = need_errors
+
+    def run(self):
+        errors = None
+        if self.need_errors:
+            self.folded = fold_text(self.text)
+            errors = find_error_lines(self.text, self.folded)
+        matches = find_matches(self.text, self.needle, self.folded)
+        self.finished_signal.emit(self.doc_id, self.needle, errors, matches, self.folded)
+
+
+class LogHighlighter(QObject):
+    """
+    상세 로그 뷰(LogTextView) 하이라이트 엔진
+    - 검색어 입력은 LOG_SEARCH_DELAY_MS 동안 멈춘 뒤 반영 (디바운스)
+    - 에러 줄/검색어 위치는 작업 스레드에서 한 번 계산하여 보관
+    - 뷰어는 정렬된 위치 목록에서 화면에 보이는 줄의 항목만 찾아 그림
+    """
+    counter_changed = pyqtSignal(str)
+
+    def __init__(self, viewer, parent=None):
+        super().__init__(parent)
+        self.viewer = viewer
+        self.doc_id = 0
+        self.text = ""
+        self.folded = None      # 대소문자 무시 검색용 소문자 사본
+        self.needle = ""
+        self.error_spans = None
+        self.matches = []
+        self.matches_needle = ""
+        self.current = -1
+        self._worker = None
+        self._threads = set()   # 종료 전까지 QThread 참조 유지
+        self._pending_jump = 0
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(LOG_SEARCH_DELAY_MS)
+        self._debounce.timeout.connect(self._start_scan)
+
+        viewer.text_changed.connect(self.document_changed)
+
+    # ---------------------------------------------------------
+    # 입력
+    # ---------------------------------------------------------
+    def document_changed(self):
+        """뷰어 내용이 바뀌면 캐시 초기화 후 즉시 검색 (text_changed)"""
+        self.doc_id += 1
+        self.text = self.viewer.text()
+        self.folded = None
+        self.error_spans = None
+        self.matches = []
+        self.matches_needle = ""
+        self.current = -1
+        self._debounce.stop()
+        self._update_counter()
+        if self.text:
+            self._start_scan()
+
+    def set_needle(self, needle):
+        """검색어 변경 (디바운스 후 검색)"""
+        self.needle = needle
+        self._debounce.start()
+
+    def jump(self, forward=True):
+        """다음/이전 일치 위치로 이동 (검색이 끝나지 않았으면 끝난 뒤 이동)"""
+        if self._debounce.isActive() or self.matches_needle != self.needle:
+            self._pending_jump = 1 if forward else -1
+            self._debounce.stop()
+            self._start_scan()
+            return
+        if not self.matches:
+            self._update_counter()
+            return
+
+        if self.current < 0:
+            # 현재 화면 위치 기준으로 가장 가까운 일치 선택
+            position = self.viewer.visible_range()[0]
+            index = bisect_left(self.matches, position) if forward else bisect_left(self.matches, position) - 1
+        else:
+            index = self.current + (1 if forward else -1)
+        self.current = index % len(self.matches)
+
+        self.viewer.ensure_visible(self.matches[self.current])
+        self.decorate()
+        self._update_counter()
+
+    # ---------------------------------------------------------
+    # 검색 (작업 스레드)
+    # ---------------------------------------------------------
+    def _start_scan(self):
+        if self._worker is not None:
+            return  # 진행 중인 검색이 끝나면 최신 조건으로 다시 검색
+        if self.error_spans is not None and self.matches_needle == self.needle:
+            self._finish_jump()
+            return
+
+        worker = HighlightScanWorker(self.doc_id, self.text, self.needle, self.folded, self.error_spans is None)
+        worker.finished_signal.connect(self._on_scan_finished)
+        worker.finished.connect(lambda w=worker: self._threads.discard(w))
+        self._threads.add(worker)
+        self._worker = worker
+        worker.start()
+
+    def _on_scan_finished(self, doc_id, needle, error_spans, matches, folded):
+        self._worker = None
+        if doc_id == self.doc_id:
+            if error_spans is not None:
+                self.error_spans = error_spans
+                self.folded = folded
+            if needle != self.matches_needle:
+                self.matches = matches
+                self.matches_needle = needle
+                self.current = -1
+            self.decorate()
+            self._update_counter()
+
+        if doc_id != self.doc_id or needle != self.needle or self.error_spans is None:
+            self._start_scan()
+        else:
+            self._finish_jump()
+
+    def _finish_jump(self):
+        if self._pending_jump:
+            forward = self._pending_jump > 0
+            self._pending_jump = 0
+            self.jump(forward)
+
+    # ---------------------------------------------------------
+    # 표시
+    # ---------------------------------------------------------
+    def decorate(self):
+        """계산된 위치 목록을 뷰어에 전달 (실제 표시는 보이는 줄만)"""
+        focus = None
+        if self.current >= 0:
+            start = self.matches[self.current]
+            focus = (start, start + len(self.matches_needle))
+        self.viewer.set_highlights(self.error_spans, self.matches, len(self.matches_needle), focus)
+
+    def _update_counter(self):
+        if not self.matches_needle:
+            self.counter_changed.emit("")
+        elif not self.matches:
+            self.counter_changed.emit("0 / 0")
+        else:
+            self.counter_changed.emit(f"{self.current + 1 if self.current >= 0 else '-'} / {len(self.matches):,}")
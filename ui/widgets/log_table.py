@@ -0,0 +1,248 @@
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QStyledItemDelegate,
+                             QStyleOptionViewItem, QStyle, QApplication)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+from utils.styles import AppStyle
+
+# (헤더명, 레코드 키)
+LOG_COLUMNS = [
+    ("Timestamp", "timestamp"),
+    ("GUID", "guid"),
+    ("User IP", "user_ip"),
+    ("Error", "error"),
+    ("Application", "application"),
+    ("Service", "service"),
+    ("Operation", "operation"),
+    ("Server", "server"),
+]
+ERROR_COLUMN = 3
+SERVER_COLUMN = 7
+
+
+class LogTableModel(QAbstractTableModel):
+    """
+    시스템 로그 가상 테이블 모델 (core.log_store.LogStore 기반)
+    화면에 보이는 셀만 data()에서 저장소 컬럼을 읽어 문자열로 변환합니다.
+
+    정렬/필터도 이 모델이 직접 담당합니다. (_order: 화면 행 -> 레코드 번호)
+    QSortFilterProxyModel은 행마다 파이썬 lessThan/filterAcceptsRow를 호출하여
+    수십만 건에서 수 초가 걸리므로, 번호 목록을 list.sort/컴프리헨션으로 일괄 재계산합니다.
+    """
+    ErrorRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self._order = []
+        self._keys = [key for _, key in LOG_COLUMNS]
+        self._predicate = None
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    @property
+    def store(self):
+        return self._store
+
+    # ---------------------------------------------------------
+    # Qt Model 인터페이스
+    # ---------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(LOG_COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            rec_no = self._order[index.row()]
+            col = index.column()
+            if col == ERROR_COLUMN:
+                return "FAIL" if self._store.error[rec_no] else "OK"
+            return self._store.value(rec_no, self._keys[col])
+        if role == self.ErrorRole:
+            return self._store.error[self._order[index.row()]] == 1
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return LOG_COLUMNS[section][0]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """화면 행 순서만 재배열 (선택 행은 persistent index로 유지)"""
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0 or not self._order:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_order = self._order
+        new_order = self._sorted(old_order)
+
+        persistent = self.persistentIndexList()
+        if persistent:
+            position = {rec_no: row for row, rec_no in enumerate(new_order)}
+            moved = [self.index(position[old_order[idx.row()]], idx.column()) for idx in persistent]
+            self.changePersistentIndexList(persistent, moved)
+
+        self._order = new_order
+        self.layoutChanged.emit()
+
+    def _sorted(self, rec_nos):
+        if self._sort_column < 0:
+            return rec_nos
+        return self._store.sort_rows(rec_nos, self._keys[self._sort_column],
+                                     reverse=(self._sort_order == Qt.SortOrder.DescendingOrder))
+
+    # ---------------------------------------------------------
+    # 데이터 조작
+    # ---------------------------------------------------------
+    def append_rows(self, batch, keep_sorted=False):
+        """
+        배치 단위 행 추가 (필터 통과분만 화면 끝에 추가, 기존 선택/스크롤 유지)
+        keep_sorted=True 이면 현재 정렬 순서상의 위치에 끼워 넣습니다. (실시간 추적용 소량 추가)
+        반환값: 배치 첫 레코드의 레코드 번호
+        """
+        start_no = self._store.append_batch(batch)
+        new_rows = range(start_no, len(self._store))
+        if self._predicate is not None:
+            row = self._store.row
+            new_rows = [i for i in new_rows if self._predicate(row(i))]
+        if not new_rows:
+            return start_no
+
+        if keep_sorted and self._sort_column >= 0 and self._order:
+            self._insert_sorted(new_rows)
+            return start_no
+
+        first = len(self._order)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._order.extend(new_rows)
+        self.endInsertRows()
+        return start_no
+
+    def _insert_sorted(self, rec_nos):
+        """정렬 위치(같은 키 중 마지막)에 한 행씩 삽입"""
+        getter = self._store.sort_key_getter(self._keys[self._sort_column])
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        order = self._order
+
+        for rec_no in rec_nos:
+            key = getter(rec_no)
+            lo, hi = 0, len(order)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                mid_key = getter(order[mid])
+                if (key > mid_key) if descending else (key < mid_key):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            self.beginInsertRows(QModelIndex(), lo, lo)
+            order.insert(lo, rec_no)
+            self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._store.clear()
+        self._order = []
+        self._predicate = None
+        self.endResetModel()
+
+    def set_filter(self, predicate):
+        """표시 조건 지정 (predicate: LogRow -> bool, None 이면 전체 표시)"""
+        self._predicate = predicate
+        if predicate is None:
+            rec_nos = list(range(len(self._store)))
+        else:
+            row = self._store.row
+            rec_nos = [i for i in range(len(self._store)) if predicate(row(i))]
+
+        self.beginResetModel()
+        self._order = self._sorted(rec_nos)
+        self.endResetModel()
+
+    def set_visible_rows(self, rec_nos, predicate=None):
+        """
+        인덱스 조회 결과(레코드 번호 목록)로 바로 필터링
+        predicate는 이후 추가되는 행에 적용할 동일 조건입니다.
+        """
+        self._predicate = predicate if predicate is not None else (lambda record: False)
+        self.beginResetModel()
+        self._order = self._sorted(list(rec_nos))
+        self.endResetModel()
+
+    def is_filtered(self):
+        return self._predicate is not None
+
+    def record(self, row):
+        """화면 행 번호로 레코드(행 뷰) 조회"""
+        return self._store.row(self._order[row])
+
+    def record_no(self, row):
+        """화면 행 번호 -> 레코드 번호"""
+        return self._order[row]
+
+    def visible_record_numbers(self):
+        """현재 화면 순서(정렬/필터 반영)의 레코드 번호 목록 사본"""
+        return list(self._order)
+
+    def record_by_no(self, rec_no):
+        return self._store.row(rec_no)
+
+    def total_count(self):
+        """필터와 무관한 전체 레코드 수"""
+        return len(self._store)
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Error 컬럼(OK/FAIL) 색상 표시용 델리게이트"""
+    COLOR_OK = QColor(AppStyle.COLOR_SUCCESS)
+    COLOR_FAIL = QColor(AppStyle.COLOR_ERROR)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        opt.text = ""
+
+        # 배경/선택 상태는 스타일에 맡기고 텍스트만 직접 그림
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        painter.setPen(self.COLOR_FAIL if index.data(LogTableModel.ErrorRole) else self.COLOR_OK)
+        painter.drawText(opt.rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+
+class LogTableView(QTableView):
+    """시스템 로그 테이블 뷰 (고정 행 높이, 행 단위 선택)"""
+    ROW_HEIGHT = 26
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.source_model = LogTableModel(store, self)
+        self.setModel(self.source_model)
+
+        self.setItemDelegateForColumn(ERROR_COLUMN, StatusDelegate(self))
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.verticalHeader().setVisible(False)
+        # 행 높이 고정 -> 전체 행 크기 계산 생략
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.setWordWrap(False)
+        self.setSortingEnabled(True)
+        self.horizontalHeader().setSortIndicatorShown(True)
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        # 서버 컬럼은 다중 서버 조회 시에만 표시
+        self.setColumnHidden(SERVER_COLUMN, True)
+
+    def record_at(self, index):
+        """뷰 인덱스로 레코드 조회"""
+        if not index.isValid():
+            return None
+        return self.source_model.record(index.row())
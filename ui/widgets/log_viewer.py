@@ -0,0 +1,337 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+from PyQt6.QtWidgets import QAbstractScrollArea, QApplication, QInputDialog
+from PyQt6.QtCore import Qt, QTimer, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QPalette, QKeySequence
+
+from config.settings import LOG_VIEW_INDEX_CHUNK, LOG_VIEW_LINE_LIMIT
+from utils.styles import AppStyle
+
+
+class LogTextView(QAbstractScrollArea):
+    """
+    대용량 로그 텍스트 뷰어 (읽기 전용)
+    문서 전체를 QTextDocument로 만들지 않고 문자열과 줄 시작 위치 색인(array)만 보관하며,
+    화면에 보이는 줄만 직접 그립니다. 줄 색인은 LOG_VIEW_INDEX_CHUNK 글자씩 나누어
+    이벤트 루프 사이사이에 만들기 때문에 큰 문서도 첫 화면이 바로 표시됩니다.
+    """
+    text_changed = pyqtSignal()
+    view_changed = pyqtSignal()      # 보이는 구간 변경 (스크롤/크기)
+    indexing_progress = pyqtSignal(int, int)  # 색인된 글자 수, 전체 글자 수
+    PADDING = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ""
+        self._starts = array('q', [0])   # 줄 시작 위치
+        self._indexed = 0                # 색인이 끝난 위치
+        self._max_width = 0
+
+        # 하이라이트 (LogHighlighter가 지정, 그릴 때 보이는 줄만 bisect로 찾음)
+        self._error_spans = []
+        self._matches = []
+        self._match_length = 0
+        self._focus = None               # (시작, 끝)
+        self._selection = None           # (기준 위치, 현재 위치) - 문서 문자 위치
+
+        self._index_timer = QTimer(self)
+        self._index_timer.setInterval(0)
+        self._index_timer.timeout.connect(self._index_next_chunk)
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+    # ---------------------------------------------------------
+    # 문서
+    # ---------------------------------------------------------
+    def setText(self, text):
+        self.set_text(text)
+
+    setPlainText = setText
+
+    def set_text(self, text):
+        self._text = text or ""
+        self._starts = array('q', [0])
+        self._indexed = 0
+        self._max_width = 0
+        self._error_spans, self._matches, self._focus, self._selection = [], [], None, None
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+
+        # 첫 화면 분량은 바로 색인하고 나머지는 이벤트 루프에서 이어서 처리
+        self._index_next_chunk()
+        if self._indexed < len(self._text):
+            self._index_timer.start()
+        self.text_changed.emit()
+
+    def clear(self):
+        self.set_text("")
+
+    def toPlainText(self):
+        return self._text
+
+    def text(self):
+        return self._text
+
+    def _index_next_chunk(self):
+        text = self._text
+        end = min(self._indexed + LOG_VIEW_INDEX_CHUNK, len(text))
+        starts_append = self._starts.append
+        find = text.find
+
+        pos = find('\n', self._indexed, end)
+        while pos != -1:
+            starts_append(pos + 1)
+            pos = find('\n', pos + 1, end)
+        self._indexed = end
+
+        if self._indexed >= len(text):
+            self._index_timer.stop()
+        self._update_scrollbars()
+        self.indexing_progress.emit(self._indexed, len(text))
+        self.viewport().update()
+
+    def is_indexing(self):
+        return self._index_timer.isActive()
+
+    def line_count(self):
+        """색인된 줄 수 (색인 중이면 마지막 줄은 아직 끝나지 않았을 수 있음)"""
+        return len(self._starts)
+
+    def line_of(self, position):
+        """문자 위치 -> 줄 번호 (0부터)"""
+        return bisect_right(self._starts, position) - 1
+
+    def line_span(self, line):
+        """줄의 (시작, 끝) 위치 (끝은 줄바꿈 제외)"""
+        start = self._starts[line]
+        if line + 1 < len(self._starts):
+            return start, self._starts[line + 1] - 1
+        end = self._text.find('\n', start)
+        return start, (len(self._text) if end == -1 else end)
+
+    def line_text(self, line):
+        start, end = self.line_span(line)
+        return self._text[start:end]
+
+    # ---------------------------------------------------------
+    # 스크롤 / 이동
+    # ---------------------------------------------------------
+    def line_height(self):
+        return self.fontMetrics().lineSpacing()
+
+    def visible_lines(self):
+        return max(self.viewport().height() // max(self.line_height(), 1), 1)
+
+    def first_visible_line(self):
+        return self.verticalScrollBar().value()
+
+    def visible_range(self):
+        """화면에 보이는 문서 위치 범위 (첫 줄 시작 ~ 마지막 줄 끝)"""
+        first = self.first_visible_line()
+        last = min(first + self.visible_lines(), self.line_count() - 1)
+        return self._starts[first], self.line_span(last)[1]
+
+    def _update_scrollbars(self):
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(self.line_count() - self.visible_lines(), 0))
+        vbar.setPageStep(self.visible_lines())
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(self._max_width - self.viewport().width() + self.PADDING * 2, 0))
+        hbar.setPageStep(self.viewport().width())
+        hbar.setSingleStep(self.fontMetrics().averageCharWidth() * 4)
+
+    def _on_scrolled(self, _value):
+        self.viewport().update()
+        self.view_changed.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+        self.view_changed.emit()
+
+    def go_to_line(self, line):
+        """줄 번호(0부터)가 화면 가운데 오도록 이동"""
+        line = min(max(line, 0), self.line_count() - 1)
+        self.verticalScrollBar().setValue(max(line - self.visible_lines() // 2, 0))
+        self._selection = self.line_span(line)
+        self.viewport().update()
+
+    def ensure_visible(self, position):
+        """문자 위치가 화면 밖이면 해당 줄로 이동 (가로 스크롤 포함)"""
+        line = self.line_of(position)
+        first = self.first_visible_line()
+        if not first <= line < first + self.visible_lines():
+            self.verticalScrollBar().setValue(max(line - self.visible_lines() // 2, 0))
+
+        start, _ = self.line_span(line)
+        x = self.fontMetrics().horizontalAdvance(self._text[start:position][:LOG_VIEW_LINE_LIMIT])
+        hbar = self.horizontalScrollBar()
+        if not hbar.value() <= x < hbar.value() + self.viewport().width() - self.PADDING * 2:
+            if x > hbar.maximum():
+                hbar.setMaximum(x)
+            hbar.setValue(max(x - self.viewport().width() // 3, 0))
+
+    def prompt_go_to_line(self):
+        line, ok = QInputDialog.getInt(self, "Go to Line", f"Line (1 - {self.line_count():,}):",
+                                       self.first_visible_line() + 1, 1, max(self.line_count(), 1))
+        if ok:
+            self.go_to_line(line - 1)
+
+    # ---------------------------------------------------------
+    # 하이라이트 / 선택
+    # ---------------------------------------------------------
+    def set_highlights(self, error_spans, matches, match_length, focus=None):
+        """error_spans: [(시작, 끝)], matches: 정렬된 시작 위치 목록, focus: 현재 일치 (시작, 끝)"""
+        self._error_spans = error_spans or []
+        self._matches = matches or []
+        self._match_length = match_length
+        self._focus = focus
+        self.viewport().update()
+
+    def selected_text(self):
+        if self._selection is None:
+            return ""
+        start, end = sorted(self._selection)
+        return self._text[start:end]
+
+    def _line_at(self, y):
+        return min(self.first_visible_line() + max(y - self.PADDING, 0) // self.line_height(),
+                   self.line_count() - 1)
+
+    def _position_at(self, point):
+        """화면 좌표 -> 문서 문자 위치 (가장 가까운 글자 경계, horizontalAdvance로 이분 탐색)"""
+        line = self._line_at(int(point.y()))
+        start, end = self.line_span(line)
+        line_text = self._text[start:min(end, start + LOG_VIEW_LINE_LIMIT)].replace('\t', ' ')
+        x = point.x() - self.PADDING + self.horizontalScrollBar().value()
+        advance = self.fontMetrics().horizontalAdvance
+        lo, hi = 0, len(line_text)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if advance(line_text[:mid + 1]) <= x:
+                lo = mid + 1
+            else:
+                hi = mid
+        # 글자 가운데를 넘었으면 다음 경계
+        if lo < len(line_text) and x - advance(line_text[:lo]) > advance(line_text[lo]) / 2:
+            lo += 1
+        return start + lo
+
+    def _word_span(self, position):
+        """위치의 단어 (공백/따옴표/구분 기호 사이) 범위"""
+        text = self._text
+        start, end = self.line_span(self.line_of(position))
+        separators = ' \t"\',:;=()[]{}<>|'
+        left = position
+        while left > start and text[left - 1] not in separators:
+            left -= 1
+        right = position
+        while right < end and text[right] not in separators:
+            right += 1
+        return left, right
+
+    def mousePressEvent(self, event):
+        position = self._position_at(event.position())
+        if event.modifiers() & Qt.KeyboardModifier.ShiftModifier and self._selection:
+            self._selection = (self._selection[0], position)
+        else:
+            self._selection = (position, position)
+        self.viewport().update()
+
+    def mouseDoubleClickEvent(self, event):
+        """더블 클릭: 단어 선택 (GUID, 값 하나 복사용)"""
+        self._selection = self._word_span(self._position_at(event.position()))
+        self.viewport().update()
+
+    def mouseMoveEvent(self, event):
+        if self._selection and event.buttons() & Qt.MouseButton.LeftButton:
+            self._selection = (self._selection[0], self._position_at(event.position()))
+            self.viewport().update()
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            QApplication.clipboard().setText(self.selected_text())
+        elif event.matches(QKeySequence.StandardKey.SelectAll):
+            self._selection = (0, len(self._text))
+            self.viewport().update()
+        elif event.key() == Qt.Key.Key_G and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            self.prompt_go_to_line()
+        elif event.matches(QKeySequence.StandardKey.MoveToStartOfDocument):
+            self.verticalScrollBar().setValue(0)
+        elif event.matches(QKeySequence.StandardKey.MoveToEndOfDocument):
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        else:
+            super().keyPressEvent(event)
+
+    # ---------------------------------------------------------
+    # 그리기 (보이는 줄만)
+    # ---------------------------------------------------------
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        metrics = self.fontMetrics()
+        line_height = self.line_height()
+        width = self.viewport().width()
+        x0 = self.PADDING - self.horizontalScrollBar().value()
+        text_color = self.palette().color(QPalette.ColorRole.Text)
+        text = self._text
+
+        first = self.first_visible_line()
+        last = min(first + self.visible_lines() + 1, self.line_count())
+        selection = sorted(self._selection) if self._selection else None
+        max_width = self._max_width
+
+        for row, line in enumerate(range(first, last)):
+            start, end = self.line_span(line)
+            line_text = text[start:min(end, start + LOG_VIEW_LINE_LIMIT)].replace('\t', ' ')
+            top = self.PADDING + row * line_height
+            rect = QRect(0, top, width, line_height)
+
+            if self._is_error_line(start, end):
+                painter.fillRect(rect, AppStyle.HIGHLIGHT_ERROR_BG)
+            if selection and selection[0] <= end and selection[1] >= start and selection[0] != selection[1]:
+                # 선택 구간의 글자 범위만 칠함 (다음 줄로 이어지면 줄 끝까지)
+                left = x0 + metrics.horizontalAdvance(line_text[:max(selection[0] - start, 0)])
+                right = (width if selection[1] > end
+                         else x0 + metrics.horizontalAdvance(line_text[:selection[1] - start]))
+                painter.fillRect(QRect(left, top, max(right - left, 0), line_height),
+                                 AppStyle.HIGHLIGHT_SELECTION_BG)
+
+            painter.setPen(text_color)
+            painter.drawText(x0, top + metrics.ascent(), line_text)
+            max_width = max(max_width, metrics.horizontalAdvance(line_text))
+
+            self._paint_matches(painter, metrics, line_text, start, end, x0, top)
+
+        painter.end()
+        if max_width > self._max_width:
+            self._max_width = max_width
+            self._update_scrollbars()
+
+    def _is_error_line(self, start, end):
+        spans = self._error_spans
+        index = bisect_right(spans, (end, end)) - 1
+        return index >= 0 and spans[index][1] >= start and spans[index][0] <= end
+
+    def _paint_matches(self, painter, metrics, line_text, start, end, x0, top):
+        length = self._match_length
+        if not length or not self._matches:
+            return
+        lo = bisect_left(self._matches, start)
+        hi = bisect_left(self._matches, end)
+        for match_start in self._matches[lo:hi]:
+            offset = match_start - start
+            if offset >= len(line_text):
+                break
+            x = x0 + metrics.horizontalAdvance(line_text[:offset])
+            word = line_text[offset:offset + length]
+            focused = self._focus is not None and self._focus[0] == match_start
+            if focused:
+                painter.fillRect(QRect(x, top, metrics.horizontalAdvance(word), self.line_height()),
+                                 AppStyle.HIGHLIGHT_FOCUS_BG)
+            painter.setPen(AppStyle.HIGHLIGHT_FOCUS_TEXT if focused else AppStyle.HIGHLIGHT_SEARCH_TEXT)
+            painter.drawText(x, top + metrics.ascent(), word)
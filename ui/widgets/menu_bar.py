@@ -11,6 +11,28 @@ class AppMenuBar(QMenuBar):
     def init_ui(self):
         # 1. File Menu
         file_menu = self.addMenu('&File')
+
+        # 로컬 로그 파일 열기 (오프라인 모드, 로그인 불필요)
+        open_action = QAction('Open Log File...', self)
+        open_action.setShortcut('Ctrl+Shift+O')
+        if self.parent_window and hasattr(self.parent_window, 'open_log_file'):
+            open_action.triggered.connect(self.parent_window.open_log_file)
+        file_menu.addAction(open_action)
+        file_menu.addSeparator()
+
+        # 조회 결과 내보내기 (JSONL/CSV, gzip/zstd)
+        export_action = QAction('Export Results...', self)
+        export_action.setShortcut('Ctrl+E')
+        if self.parent_window and hasattr(self.parent_window, 'export_results'):
+            export_action.triggered.connect(self.parent_window.export_results)
+        file_menu.addAction(export_action)
+
+        export_server_action = QAction('Export From Server...', self)
+        export_server_action.setShortcut('Ctrl+Shift+E')
+        if self.parent_window and hasattr(self.parent_window, 'export_from_server'):
+            export_server_action.triggered.connect(self.parent_window.export_from_server)
+        file_menu.addAction(export_server_action)
+        file_menu.addSeparator()
         
         exit_action = QAction('Exit', self)
         exit_action.setShortcut('Ctrl+Q')
@@ -26,6 +48,14 @@ class AppMenuBar(QMenuBar):
             refresh_action.triggered.connect(self.parent_window.load_data)
         view_menu.addAction(refresh_action)
 
+        # 실시간 추적 (주기적 증분 조회)
+        self.live_tail_action = QAction('Live Tail', self)
+        self.live_tail_action.setShortcut('F6')
+        self.live_tail_action.setCheckable(True)
+        if self.parent_window and hasattr(self.parent_window, 'toggle_live_tail'):
+            self.live_tail_action.toggled.connect(self.parent_window.toggle_live_tail)
+        view_menu.addAction(self.live_tail_action)
+
         # 3. [신규] Tools Menu (Options)
         tools_menu = self.addMenu('&Tools')
         
@@ -34,6 +64,12 @@ class AppMenuBar(QMenuBar):
         options_action.triggered.connect(self.open_options)
         tools_menu.addAction(options_action)
 
+        # API 상태 점검 (지연 시간 분포 / 오류 유형 / baseline 비교)
+        scan_action = QAction('API Health Scan...', self)
+        if self.parent_window and hasattr(self.parent_window, 'open_api_scan'):
+            scan_action.triggered.connect(self.parent_window.open_api_scan)
+        tools_menu.addAction(scan_action)
+
         # 4. Help Menu
         help_menu = self.addMenu('&Help')
         
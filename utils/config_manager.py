@@ -1,8 +1,10 @@
 import json
 import os
 
+from config.settings import CACHE_DIR
+
 URLS_FILE = "login_urls.json"
-SESSION_FILE = "session.json"
+SESSION_FILE = os.path.join(CACHE_DIR, "session.json")  # 세션 쿠키 (버전 관리 제외 폴더)
 
 class ConfigManager:
     # ---------------------------------------------------------
@@ -37,6 +39,7 @@ class ConfigManager:
             "page_name": page_name
         }
         try:
+            os.makedirs(os.path.dirname(SESSION_FILE), exist_ok=True)
             with open(SESSION_FILE, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
         except Exception as e:
@@ -55,7 +58,7 @@ class ConfigManager:
     
     @staticmethod
     def clear_session():
-        """세션 파일 삭제 (로그아웃 시)"""
+        """세션 파일 삭제 (로그인 실패 / 서버가 세션을 거부한 경우)"""
         if os.path.exists(SESSION_FILE):
             try:
                 os.remove(SESSION_FILE)
@@ -0,0 +1,24 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    모듈을 처음 속성에 접근할 때 로드 (설치되지 않았으면 None)
+    numpy처럼 import 비용이 큰 선택 의존성을 시작 시간에서 빼기 위해 사용합니다.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
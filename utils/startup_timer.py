@@ -0,0 +1,31 @@
+import time
+
+
+class StartupTimer:
+    """
+    프로그램 시작 단계별 소요 시간 기록 (main.py에서 가장 먼저 import)
+    mark(단계)를 호출하면 직전 표시 이후 걸린 시간을 그 단계 시간으로 기록합니다.
+    """
+    _start = time.perf_counter()
+    _last = _start
+    phases = []
+
+    @classmethod
+    def mark(cls, phase):
+        now = time.perf_counter()
+        cls.phases.append((phase, now - cls._last))
+        cls._last = now
+
+    @classmethod
+    def elapsed(cls):
+        return cls._last - cls._start
+
+    @classmethod
+    def report(cls):
+        """단계별 시간 출력 후 한 줄 요약 반환"""
+        print("Startup timing:")
+        for phase, seconds in cls.phases:
+            print(f"  {phase:<20} {seconds * 1000:8.1f} ms")
+        print(f"  {'total':<20} {cls.elapsed() * 1000:8.1f} ms")
+        parts = " | ".join(f"{phase} {seconds * 1000:.0f}" for phase, seconds in cls.phases)
+        return f"Startup {cls.elapsed():.2f}s ({parts} ms)"
@@ -17,6 +17,7 @@ class AppStyle:
     HIGHLIGHT_SEARCH_TEXT = QColor("#FFFF00")
     HIGHLIGHT_FOCUS_BG = QColor("#FFFF00")
     HIGHLIGHT_FOCUS_TEXT = QColor("#000000")
+    HIGHLIGHT_SELECTION_BG = QColor(137, 180, 250, 70)
 
     # ---------------------------------------------------------
     # 2. QSS 스타일시트
@@ -31,7 +32,7 @@ class AppStyle:
     }}
 
     /* [Containers] */
-    QFrame, QTableWidget, QTextEdit, QTabWidget::pane {{
+    QFrame, QTableWidget, QTableView, QTextEdit, QTabWidget::pane {{
         background-color: {COLOR_BG_PANEL};
         border: 1px solid {COLOR_BORDER};
         border-radius: 6px;
@@ -133,6 +134,10 @@ class AppStyle:
         font-family: Consolas, monospace;
         border: none;
     }}
+    LogTextView {{
+        font-family: Consolas, monospace;
+        border: none;
+    }}
     QTextEdit#detail_log_box {{
         background-color: #11111b;
         border: 1px solid {COLOR_BORDER};
@@ -141,7 +146,7 @@ class AppStyle:
     }}
 
     /* [Table] */
-    QTableWidget {{
+    QTableWidget, QTableView {{
         gridline-color: {COLOR_BORDER};
         selection-background-color: #45475a;
         selection-color: #ffffff;
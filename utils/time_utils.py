@@ -0,0 +1,41 @@
+from datetime import datetime
+
+# 구분자 제거용 변환 테이블 ("2024-01-01 12:34:56.789" -> "20240101123456789")
+_STRIP_SEPARATORS = str.maketrans('', '', '-: ./T')
+TS_KEY_DIGITS = 17  # yyyyMMddHHmmssSSS
+
+
+def to_ts_key(text):
+    """
+    일시 문자열을 정렬 가능한 정수 키(yyyyMMddHHmmssSSS)로 변환
+    BXM의 opOccurDttm 형식(구분자 유무, 밀리초 유무)에 관계없이 동작하며 실패 시 0 반환
+    """
+    if not text:
+        return 0
+    digits = str(text).translate(_STRIP_SEPARATORS)[:TS_KEY_DIGITS]
+    if not digits.isdigit():
+        return 0
+    return int(digits.ljust(TS_KEY_DIGITS, '0'))
+
+
+def ts_has_ms(text):
+    """일시 문자열에 밀리초가 포함되어 있는지 여부"""
+    return len(str(text or "").translate(_STRIP_SEPARATORS)) > 14
+
+
+def ts_key_to_text(key, with_ms=True):
+    """정수 키를 표시용 문자열로 변환 (0 이면 빈 문자열)"""
+    if not key:
+        return ""
+    s = f"{key:0{TS_KEY_DIGITS}d}"
+    text = f"{s[0:4]}-{s[4:6]}-{s[6:8]} {s[8:10]}:{s[10:12]}:{s[12:14]}"
+    return f"{text}.{s[14:17]}" if with_ms else text
+
+
+def ts_key_to_datetime(key):
+    s = f"{key:0{TS_KEY_DIGITS}d}"
+    return datetime.strptime(s, "%Y%m%d%H%M%S%f")
+
+
+def datetime_to_ts_key(dt):
+    return int(dt.strftime("%Y%m%d%H%M%S") + f"{dt.microsecond // 1000:03d}")